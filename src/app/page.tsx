@@ -32,7 +32,7 @@ export default function Home() {
           <div className="mx-auto max-w-7xl px-4 sm:px-6 lg:px-8">
             {/* Welcome header */}
             <div className="mb-8">
-              <h1 className="text-3xl font-bold text-gray-900 dark:text-white">
+              <h1 data-testid="welcome-header" className="text-3xl font-bold text-gray-900 dark:text-white">
                 Welcome to IoT Platform
               </h1>
               <p className="mt-2 text-gray-600 dark:text-gray-400">
@@ -55,7 +55,7 @@ export default function Home() {
                     </div>
                     <div className="ml-5 w-0 flex-1">
                       <dl>
-                        <dt className="text-sm font-medium text-gray-500 dark:text-gray-400 truncate">
+                        <dt data-testid="auth-status" className="text-sm font-medium text-gray-500 dark:text-gray-400 truncate">
                           Authentication Status
                         </dt>
                         <dd className="text-lg font-medium text-gray-900 dark:text-white">
@@ -67,6 +67,7 @@ export default function Home() {
                   <div className="mt-5">
                     <Link
                       href="/login"
+                      data-testid="try-login"
                       className="inline-flex items-center px-4 py-2 border border-transparent text-sm font-medium rounded-md text-white bg-indigo-600 hover:bg-indigo-700"
                     >
                       Try Login
@@ -95,6 +96,7 @@ export default function Home() {
                   <div className="mt-5">
                     <Link
                       href="/register"
+                      data-testid="demo-register"
                       className="inline-flex items-center px-4 py-2 border border-transparent text-sm font-medium rounded-md text-white bg-green-600 hover:bg-green-700"
                     >
                       Register
@@ -127,7 +129,7 @@ export default function Home() {
             {/* Demo Credentials */}
             <div className="bg-white dark:bg-gray-800 shadow rounded-lg">
               <div className="px-6 py-4 border-b border-gray-200 dark:border-gray-700">
-                <h2 className="text-lg font-medium text-gray-900 dark:text-white">
+                <h2 data-testid="demo-credentials" className="text-lg font-medium text-gray-900 dark:text-white">
                   Demo Credentials
                 </h2>
                 <p className="text-sm text-gray-600 dark:text-gray-400">
@@ -137,7 +139,7 @@ export default function Home() {
               <div className="p-6">
                 <div className="grid grid-cols-1 gap-6 md:grid-cols-3">
                   <div className="border border-gray-200 dark:border-gray-700 rounded-lg p-4">
-                    <h3 className="text-lg font-medium text-gray-900 dark:text-white mb-2">
+                    <h3 data-testid="demo-card-admin" className="text-lg font-medium text-gray-900 dark:text-white mb-2">
                       Admin Account
                     </h3>
                     <div className="space-y-1 text-sm">
@@ -154,7 +156,7 @@ export default function Home() {
                   </div>
 
                   <div className="border border-gray-200 dark:border-gray-700 rounded-lg p-4">
-                    <h3 className="text-lg font-medium text-gray-900 dark:text-white mb-2">
+                    <h3 data-testid="demo-card-company" className="text-lg font-medium text-gray-900 dark:text-white mb-2">
                       Company Account
                     </h3>
                     <div className="space-y-1 text-sm">
@@ -171,7 +173,7 @@ export default function Home() {
                   </div>
 
                   <div className="border border-gray-200 dark:border-gray-700 rounded-lg p-4">
-                    <h3 className="text-lg font-medium text-gray-900 dark:text-white mb-2">
+                    <h3 data-testid="demo-card-consumer" className="text-lg font-medium text-gray-900 dark:text-white mb-2">
                       Consumer Account
                     </h3>
                     <div className="space-y-1 text-sm">
@@ -193,7 +195,7 @@ export default function Home() {
             {/* API Status */}
             <div className="mt-8 bg-white dark:bg-gray-800 shadow rounded-lg">
               <div className="px-6 py-4 border-b border-gray-200 dark:border-gray-700">
-                <h2 className="text-lg font-medium text-gray-900 dark:text-white">
+                <h2 data-testid="api-status" className="text-lg font-medium text-gray-900 dark:text-white">
                   Dummy API Status
                 </h2>
                 <p className="text-sm text-gray-600 dark:text-gray-400">
@@ -214,7 +216,7 @@ export default function Home() {
                   ].map((api) => (
                     <div key={api.name} className="flex items-center space-x-2">
                       <div className="h-2 w-2 bg-green-500 rounded-full"></div>
-                      <span className="text-sm text-gray-900 dark:text-white">{api.name}</span>
+                      <span data-testid="api-endpoint" className="text-sm text-gray-900 dark:text-white">{api.name}</span>
                     </div>
                   ))}
                 </div>
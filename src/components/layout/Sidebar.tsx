@@ -69,6 +69,7 @@ export function Sidebar({ navigation }: SidebarProps) {
                         <li key={item.name}>
                           <Link
                             href={item.href}
+                            data-testid={`mobile-nav-${item.name.toLowerCase()}`}
                             className={classNames(
                               item.current
                                 ? 'bg-gray-50 dark:bg-gray-800 text-indigo-600 dark:text-indigo-400'
@@ -115,6 +116,7 @@ export function Sidebar({ navigation }: SidebarProps) {
                     <li key={item.name}>
                       <Link
                         href={item.href}
+                        data-testid={`nav-${item.name.toLowerCase()}`}
                         className={classNames(
                           item.current
                             ? 'bg-gray-50 dark:bg-gray-800 text-indigo-600 dark:text-indigo-400'
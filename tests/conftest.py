@@ -2,16 +2,13 @@ import pytest
 import os
 import sys
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from utilities.driver_factory import DriverFactory
-from utilities.screenshot_util import ScreenshotUtil
-from test_data.test_config import TestConfig
+from test_data.test_config import TestConfig, ENVIRONMENT_CONFIGS
+
+# Selenium-backed utilities (DriverFactory, ScreenshotUtil) are imported inside
+# the fixtures and hooks that use them to keep conftest import cheap
+
+# Priority markers, highest first
+PRIORITY_LEVELS = ("critical", "high", "medium", "low")
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -24,26 +21,70 @@ def test_config():
 @pytest.fixture(scope="session")
 def driver_factory():
     """Fixture to provide driver factory."""
+    from utilities.driver_factory import DriverFactory
+    
     return DriverFactory()
 
-@pytest.fixture(scope="function")
-def driver(request, test_config):
-    """Fixture to provide WebDriver instance."""
-    browser = getattr(request.config.option, 'browser', test_config.BROWSER)
-    headless = getattr(request.config.option, 'headless', test_config.HEADLESS)
+@pytest.fixture(scope="session")
+def _driver_session(request, test_config):
+    """Fixture to provide a single WebDriver instance for the whole session."""
+    from utilities.driver_factory import DriverFactory
     
+    browser = getattr(request.config.option, 'browser', test_config.BROWSER)
+    headless = getattr(request.config.option, 'headless', None)
+    if headless is None:
+        headless = test_config.HEADLESS
+
     driver_instance = DriverFactory.get_driver(browser, headless)
     driver_instance.maximize_window()
-    driver_instance.implicitly_wait(test_config.IMPLICIT_WAIT)
     
-    yield driver_instance
-    
-    # Cleanup
-    driver_instance.quit()
+    # Drop analytics/tracking requests that only slow page loads (Chromium only)
+    if test_config.BLOCKED_URLS and hasattr(driver_instance, "execute_cdp_cmd"):
+        driver_instance.execute_cdp_cmd("Network.enable", {})
+        driver_instance.execute_cdp_cmd("Network.setBlockedURLs", {"urls": test_config.BLOCKED_URLS})
+
+    # Cleanup once all tests have finished
+    request.addfinalizer(driver_instance.quit)
+
+    return driver_instance
+
+@pytest.fixture(scope="function")
+def driver(_driver_session):
+    """Fixture to provide WebDriver instance with clean browser state per test."""
+    main_window = _driver_session.current_window_handle
+    window_size = _driver_session.get_window_size()
+
+    yield _driver_session
+
+    # Reset browser state so the next test starts fresh
+    try:
+        for handle in _driver_session.window_handles:
+            if handle != main_window:
+                _driver_session.switch_to.window(handle)
+                _driver_session.close()
+        _driver_session.switch_to.window(main_window)
+
+        # Chromium clears cookies for every domain in one CDP call
+        if hasattr(_driver_session, "execute_cdp_cmd"):
+            _driver_session.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            _driver_session.delete_all_cookies()
+        try:
+            _driver_session.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except Exception:
+            pass  # Storage is not accessible on some pages (e.g. about:blank)
+        _driver_session.get("about:blank")
+
+        if _driver_session.get_window_size() != window_size:
+            _driver_session.set_window_size(window_size['width'], window_size['height'])
+    except Exception:
+        pass  # Ignore reset errors
 
 @pytest.fixture(scope="function")
 def screenshot_util(driver):
     """Fixture to provide screenshot utility."""
+    from utilities.screenshot_util import ScreenshotUtil
+    
     return ScreenshotUtil(driver)
 
 @pytest.fixture(scope="function")
@@ -56,71 +97,80 @@ def api_base_url(test_config):
     """Fixture to provide API base URL."""
     return test_config.API_BASE_URL
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def admin_user(test_config):
     """Fixture to provide admin user credentials."""
     return test_config.ADMIN_USER
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def company_user(test_config):
     """Fixture to provide company user credentials."""
     return test_config.COMPANY_USER
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def consumer_user(test_config):
     """Fixture to provide consumer user credentials."""
     return test_config.CONSUMER_USER
 
-@pytest.fixture(scope="function")
-def login_admin(driver, admin_user, base_url):
-    """Fixture to auto-login as admin user."""
+def _capture_auth_state(driver, user, base_url):
+    """Log in through the UI once and capture the resulting cookies and localStorage."""
     from page_objects.login_page import LoginPage
     
     login_page = LoginPage(driver)
     login_page.navigate_to(f"{base_url}/login")
-    login_page.login(admin_user["email"], admin_user["password"])
+    # Fail the session fixture rather than caching a logged-out state for
+    # every test on this worker
+    if not login_page.login(user["email"], user["password"]) or not login_page.is_login_successful():
+        pytest.fail(f"Could not log in as {user['email']} to capture the auth state")
     
-    yield
-    
-    # Logout after test
-    try:
-        login_page.logout()
-    except:
-        pass  # Ignore logout errors
+    return {
+        "cookies": driver.get_cookies(),
+        "local_storage": driver.execute_script("return JSON.stringify(window.localStorage);")
+    }
+
+def _restore_auth_state(driver, auth_state, base_url):
+    """Restore a captured authenticated state without going through the login form."""
+    driver.get(base_url)
+    for cookie in auth_state["cookies"]:
+        driver.add_cookie(cookie)
+    driver.execute_script(
+        "Object.assign(window.localStorage, JSON.parse(arguments[0]));",
+        auth_state["local_storage"]
+    )
+    driver.refresh()
+
+@pytest.fixture(scope="session")
+def _admin_auth_state(_driver_session, test_config):
+    """Fixture to log in as admin user once per session."""
+    return _capture_auth_state(_driver_session, test_config.ADMIN_USER, test_config.BASE_URL)
+
+@pytest.fixture(scope="session")
+def _company_auth_state(_driver_session, test_config):
+    """Fixture to log in as company user once per session."""
+    return _capture_auth_state(_driver_session, test_config.COMPANY_USER, test_config.BASE_URL)
+
+@pytest.fixture(scope="session")
+def _consumer_auth_state(_driver_session, test_config):
+    """Fixture to log in as consumer user once per session."""
+    return _capture_auth_state(_driver_session, test_config.CONSUMER_USER, test_config.BASE_URL)
 
+# The login fixtures do not log out after the test: a server-side logout would
+# invalidate the cached session, and the driver fixture already clears cookies
+# and storage between tests.
 @pytest.fixture(scope="function")
-def login_company(driver, company_user, base_url):
+def login_admin(driver, _admin_auth_state, base_url):
+    """Fixture to auto-login as admin user."""
+    _restore_auth_state(driver, _admin_auth_state, base_url)
+
+@pytest.fixture(scope="function")
+def login_company(driver, _company_auth_state, base_url):
     """Fixture to auto-login as company user."""
-    from page_objects.login_page import LoginPage
-    
-    login_page = LoginPage(driver)
-    login_page.navigate_to(f"{base_url}/login")
-    login_page.login(company_user["email"], company_user["password"])
-    
-    yield
-    
-    # Logout after test
-    try:
-        login_page.logout()
-    except:
-        pass  # Ignore logout errors
+    _restore_auth_state(driver, _company_auth_state, base_url)
 
 @pytest.fixture(scope="function")
-def login_consumer(driver, consumer_user, base_url):
+def login_consumer(driver, _consumer_auth_state, base_url):
     """Fixture to auto-login as consumer user."""
-    from page_objects.login_page import LoginPage
-    
-    login_page = LoginPage(driver)
-    login_page.navigate_to(f"{base_url}/login")
-    login_page.login(consumer_user["email"], consumer_user["password"])
-    
-    yield
-    
-    # Logout after test
-    try:
-        login_page.logout()
-    except:
-        pass  # Ignore logout errors
+    _restore_auth_state(driver, _consumer_auth_state, base_url)
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
@@ -128,18 +178,26 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
     
-    if report.when == "call" and report.failed:
+    if (report.when == "call" and report.failed and TestConfig.SCREENSHOTS != "never"
+            and not item.get_closest_marker("no_screenshot")):
         # Get the driver from the test
         if hasattr(item, 'funcargs') and 'driver' in item.funcargs:
+            from pytest_html import extras
+            from utilities.screenshot_util import ScreenshotUtil
+            
             driver = item.funcargs['driver']
             screenshot_util = ScreenshotUtil(driver)
             screenshot_path = screenshot_util.capture_failure_screenshot(item.name)
             
-            # Add screenshot to HTML report
+            # Link the screenshot file from the HTML report instead of inlining
+            # it, so the self-contained report does not carry every image
             if screenshot_path:
-                extra = getattr(report, 'extra', [])
-                extra.append(pytest.Html(f'<div><img src="{screenshot_path}" alt="screenshot" style="width:300px;height:200px;" onclick="window.open(this.src)" align="right"/></div>'))
-                report.extra = extra
+                html_path = getattr(item.config.option, 'htmlpath', None)
+                if html_path:
+                    screenshot_path = os.path.relpath(screenshot_path, os.path.dirname(os.path.abspath(html_path)))
+                report_extras = getattr(report, 'extras', [])
+                report_extras.append(extras.url(screenshot_path, name="Screenshot"))
+                report.extras = report_extras
 
 def pytest_addoption(parser):
     """Add command line options."""
@@ -152,8 +210,14 @@ def pytest_addoption(parser):
     parser.addoption(
         "--headless",
         action="store_true",
-        default=False,
-        help="Run tests in headless mode"
+        default=None,
+        help="Run tests in headless mode (default: HEADLESS env var, headless unless set to false)"
+    )
+    parser.addoption(
+        "--headed",
+        action="store_false",
+        dest="headless",
+        help="Run tests with a visible browser window"
     )
     parser.addoption(
         "--base-url",
@@ -167,13 +231,46 @@ def pytest_addoption(parser):
         default="local",
         help="Environment to run tests against (local, dev, staging, prod)"
     )
+    parser.addoption(
+        "--screenshots",
+        action="store",
+        default=None,
+        choices=("on-failure", "always", "never"),
+        help="When to take screenshots (default: SCREENSHOTS env var or on-failure)"
+    )
+    parser.addoption(
+        "--smoke-level",
+        action="store",
+        default="all",
+        choices=PRIORITY_LEVELS + ("all",),
+        help="Only run tests at or above this priority (critical, high, medium, low)"
+    )
+    parser.addoption(
+        "--smoke-quick",
+        action="store_const",
+        const="high",
+        dest="smoke_level",
+        help="Pre-commit fast path: only critical and high priority tests (same as --smoke-level=high)"
+    )
 
 def pytest_configure(config):
     """Configure pytest."""
-    # Create reports directory if it doesn't exist
+    # Create reports directory if it doesn't exist (xdist workers race here)
     reports_dir = os.path.join(os.path.dirname(__file__), "reports")
-    if not os.path.exists(reports_dir):
-        os.makedirs(reports_dir)
+    os.makedirs(reports_dir, exist_ok=True)
+    
+    # Page objects read the screenshot policy from TestConfig; xdist workers
+    # receive the same command line, so each applies it in its own process
+    screenshots = config.getoption("screenshots")
+    if screenshots:
+        TestConfig.SCREENSHOTS = screenshots
+    
+    # Give each xdist worker its own log file instead of sharing one
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    log_file = config.getoption("log_file") or config.getini("log_file")
+    if worker_id and log_file:
+        log_root, log_ext = os.path.splitext(log_file)
+        config.option.log_file = f"{log_root}_{worker_id}{log_ext}"
     
     # Set up custom markers
     config.addinivalue_line(
@@ -184,17 +281,45 @@ def pytest_configure(config):
         "markers",
         "regression: Regression tests"
     )
+    config.addinivalue_line(
+        "markers",
+        "no_screenshot: Do not capture a screenshot when the test fails"
+    )
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection."""
-    # Add smoke marker to all tests in smoke test files
+    # Add smoke marker to all tests in smoke test files, checking each file once
+    smoke_files = {}
     for item in items:
-        if "smoke" in item.fspath.basename:
+        is_smoke_file = smoke_files.get(item.path)
+        if is_smoke_file is None:
+            is_smoke_file = smoke_files[item.path] = "smoke" in item.path.name
+        if is_smoke_file and not item.get_closest_marker("smoke"):
             item.add_marker(pytest.mark.smoke)
+    
+    # Deselect tests below the requested priority rather than skipping them,
+    # so they do not even reach the xdist workers
+    level = config.getoption("smoke_level")
+    if level != "all":
+        allowed = PRIORITY_LEVELS[:PRIORITY_LEVELS.index(level) + 1]
+        selected, deselected = [], []
+        for item in items:
+            if any(item.get_closest_marker(priority) for priority in allowed):
+                selected.append(item)
+            else:
+                deselected.append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
 
 @pytest.fixture(scope="session", autouse=True)
 def test_session_setup():
     """Session-level setup and teardown."""
+    # Every xdist worker runs its own session; only announce it once
+    if os.environ.get("PYTEST_XDIST_WORKER", "gw0") != "gw0":
+        yield
+        return
+    
     print(f"\n{'='*50}")
     print(f"Starting IoT Platform Smoke Test Session")
     print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -223,27 +348,4 @@ def env_config(pytestconfig):
     """Environment-specific configuration."""
     env = pytestconfig.getoption("env")
     
-    configs = {
-        "local": {
-            "base_url": "http://localhost:3000",
-            "api_url": "http://localhost:3000/api",
-            "timeout": 10
-        },
-        "dev": {
-            "base_url": "https://dev.iotplatform.com",
-            "api_url": "https://dev.iotplatform.com/api",
-            "timeout": 15
-        },
-        "staging": {
-            "base_url": "https://staging.iotplatform.com",
-            "api_url": "https://staging.iotplatform.com/api",
-            "timeout": 20
-        },
-        "prod": {
-            "base_url": "https://iotplatform.com",
-            "api_url": "https://iotplatform.com/api",
-            "timeout": 30
-        }
-    }
-    
-    return configs.get(env, configs["local"])
+    return ENVIRONMENT_CONFIGS.get(env, ENVIRONMENT_CONFIGS["local"])
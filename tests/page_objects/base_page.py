@@ -3,9 +3,8 @@ Base page object class for common functionality.
 """
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException, StaleElementReferenceException
 from utilities.helpers import WebDriverHelpers, ReportHelpers
 from utilities.screenshot_util import ScreenshotUtil
 from test_data.test_config import TestConfig
@@ -18,40 +17,82 @@ class BasePage:
     
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, TestConfig.EXPLICIT_WAIT)
-        self.short_wait = WebDriverWait(driver, 5)
         self.helpers = WebDriverHelpers(driver)
+        # Share the helpers' waits so both layers use one cache per driver
+        self.wait = self.helpers.wait
+        self.short_wait = self.helpers.short_wait
+        self._element_cache = {}
         self.screenshot_util = ScreenshotUtil(driver)
         self.base_url = TestConfig.BASE_URL
     
     # Common locators
-    LOADING_SPINNER = (By.CLASS_NAME, "loading-spinner")
-    ERROR_MESSAGE = (By.CLASS_NAME, "error-message")
-    SUCCESS_MESSAGE = (By.CLASS_NAME, "success-message")
-    ALERT_MESSAGE = (By.CLASS_NAME, "alert")
-    MODAL_DIALOG = (By.CLASS_NAME, "modal")
-    CLOSE_BUTTON = (By.XPATH, "//button[contains(@class, 'close') or contains(text(), 'Close')]")
+    LOADING_SPINNER = (By.CSS_SELECTOR, ".loading-spinner")
+    ERROR_MESSAGE = (By.CSS_SELECTOR, ".error-message")
+    SUCCESS_MESSAGE = (By.CSS_SELECTOR, ".success-message")
+    ALERT_MESSAGE = (By.CSS_SELECTOR, ".alert")
+    MODAL_DIALOG = (By.CSS_SELECTOR, ".modal")
+    CLOSE_BUTTON = (By.CSS_SELECTOR, "button[class*='close'], button[aria-label*='Close'], button[data-action='close']")
     
     def navigate_to(self, url):
         """Navigate to a specific URL."""
         if not url.startswith('http'):
             url = f"{self.base_url}{url}"
         
+        # Elements resolved on the previous page are stale after navigating
+        self._element_cache.clear()
+        
         try:
-            self.driver.get(url)
-            self.wait_for_page_load()
-            ReportHelpers.log_test_step(f"Navigate to {url}", "PASS")
+            if hasattr(self.driver, "execute_cdp_cmd"):
+                self._navigate_with_cdp(url)
+            else:
+                self.driver.get(url)
+                # With "eager"/"none" the driver already returned at the chosen
+                # point; explicit waits in the page objects cover readiness
+                if TestConfig.PAGE_LOAD_STRATEGY == "normal":
+                    self.wait_for_page_load()
+            ReportHelpers.log_test_step("Navigate to", "PASS", url)
             return True
         except Exception as e:
             logger.error(f"Failed to navigate to {url}: {e}")
-            ReportHelpers.log_test_step(f"Navigate to {url}", "FAIL", str(e))
+            ReportHelpers.log_test_step("Navigate to", "FAIL", url, e)
             return False
     
+    def _navigate_with_cdp(self, url):
+        """Navigate through CDP and wait for the new document and its requests to settle."""
+        # Page.navigate returns as soon as the navigation commits instead of
+        # blocking until the load event like driver.get(), so the first polls
+        # can still reach the previous document; mark it so they are not
+        # mistaken for the new page being ready
+        self.driver.execute_script("window.__leavingDocument = true;")
+        result = self.driver.execute_cdp_cmd("Page.navigate", {"url": url})
+        if result.get("errorText"):
+            raise WebDriverException(result["errorText"])
+        
+        if TestConfig.PAGE_LOAD_STRATEGY == "none":
+            return
+        
+        # Without a loaderId the navigation stayed in the same document
+        # (e.g. a fragment change), which keeps the marker
+        new_document = bool(result.get("loaderId"))
+        ready_state = "complete" if TestConfig.PAGE_LOAD_STRATEGY == "normal" else "interactive"
+        self._get_wait(TestConfig.PAGE_LOAD_TIMEOUT).until(
+            lambda driver: driver.execute_script(
+                "return !(arguments[1] && window.__leavingDocument)"
+                " && (document.readyState === arguments[0] || document.readyState === 'complete')"
+                " && !window.__pendingRequests;",
+                ready_state, new_document
+            )
+        )
+    
+    def _get_wait(self, timeout):
+        """Return the helpers' cached WebDriverWait for the given timeout."""
+        return self.helpers._get_wait(timeout)
+    
     def wait_for_page_load(self, timeout=None):
         """Wait for page to be fully loaded."""
         timeout = timeout or TestConfig.PAGE_LOAD_TIMEOUT
         try:
-            WebDriverWait(self.driver, timeout).until(
+            self._get_wait(timeout).until(
                 lambda driver: driver.execute_script("return document.readyState") == "complete"
             )
             return True
@@ -59,10 +100,48 @@ class BasePage:
             logger.warning(f"Page load timeout after {timeout} seconds")
             return False
     
+    def get_navigation_timing(self, timeout=None):
+        """
+        Read the browser's Navigation Timing entry for the current document.
+        
+        Waits for the load event to finish so that loadEventEnd is set.
+        
+        Returns:
+            dict: dom_content_loaded and load, in milliseconds from navigation
+            start, or None if the page did not finish loading in time
+        """
+        timeout = timeout or TestConfig.PAGE_LOAD_TIMEOUT
+        try:
+            return self._get_wait(timeout).until(lambda driver: driver.execute_script(
+                """
+                const entry = performance.getEntriesByType('navigation')[0];
+                if (!entry || !entry.loadEventEnd) return null;
+                return {dom_content_loaded: entry.domContentLoadedEventEnd, load: entry.loadEventEnd};
+                """
+            ))
+        except TimeoutException:
+            logger.warning(f"Page did not finish loading within {timeout} seconds")
+            return None
+    
     def wait_for_element(self, locator, timeout=None):
         """Wait for an element to be present."""
         return self.helpers.wait_for_element(locator, timeout)
     
+    def find_element_cached(self, locator, timeout=None):
+        """Return the cached element for a locator, resolving it on first use."""
+        element = self._element_cache.get(locator)
+        if element is None:
+            element = self._element_cache[locator] = self.wait_for_element(locator, timeout)
+        return element
+    
+    def on_cached_element(self, locator, action, timeout=None):
+        """Run an action on a cached element, re-resolving it once if it went stale."""
+        try:
+            return action(self.find_element_cached(locator, timeout))
+        except StaleElementReferenceException:
+            self._element_cache.pop(locator, None)
+            return action(self.find_element_cached(locator, timeout))
+    
     def wait_for_clickable_element(self, locator, timeout=None):
         """Wait for an element to be clickable."""
         return self.helpers.wait_for_clickable_element(locator, timeout)
@@ -84,11 +163,11 @@ class BasePage:
         try:
             element = self.wait_for_clickable_element(locator, timeout)
             element.click()
-            ReportHelpers.log_test_step(f"Click element {locator}", "PASS")
+            ReportHelpers.log_test_step("Click element", "PASS", locator)
             return True
         except TimeoutException:
             logger.error(f"Element not clickable: {locator}")
-            ReportHelpers.log_test_step(f"Click element {locator}", "FAIL", "Element not clickable")
+            ReportHelpers.log_test_step("Click element", "FAIL", locator, "Element not clickable")
             return False
     
     def send_keys_to_element(self, locator, text, clear_first=True, timeout=None):
@@ -98,11 +177,11 @@ class BasePage:
             if clear_first:
                 element.clear()
             element.send_keys(text)
-            ReportHelpers.log_test_step(f"Send keys to {locator}", "PASS", f"Text: {text}")
+            ReportHelpers.log_test_step("Send keys", "PASS", locator)
             return True
         except TimeoutException:
             logger.error(f"Element not found: {locator}")
-            ReportHelpers.log_test_step(f"Send keys to {locator}", "FAIL", "Element not found")
+            ReportHelpers.log_test_step("Send keys", "FAIL", locator, "Element not found")
             return False
     
     def get_element_text(self, locator, timeout=None):
@@ -110,11 +189,11 @@ class BasePage:
         try:
             element = self.wait_for_element(locator, timeout)
             text = element.text
-            ReportHelpers.log_test_step(f"Get text from {locator}", "PASS", f"Text: {text}")
+            ReportHelpers.log_test_step("Get text", "PASS", locator, text)
             return text
         except TimeoutException:
             logger.error(f"Element not found: {locator}")
-            ReportHelpers.log_test_step(f"Get text from {locator}", "FAIL", "Element not found")
+            ReportHelpers.log_test_step("Get text", "FAIL", locator, "Element not found")
             return None
     
     def get_element_attribute(self, locator, attribute, timeout=None):
@@ -122,24 +201,18 @@ class BasePage:
         try:
             element = self.wait_for_element(locator, timeout)
             value = element.get_attribute(attribute)
-            ReportHelpers.log_test_step(f"Get {attribute} from {locator}", "PASS", f"Value: {value}")
+            ReportHelpers.log_test_step("Get attribute", "PASS", locator, attribute, value)
             return value
         except TimeoutException:
             logger.error(f"Element not found: {locator}")
-            ReportHelpers.log_test_step(f"Get {attribute} from {locator}", "FAIL", "Element not found")
+            ReportHelpers.log_test_step("Get attribute", "FAIL", locator, attribute, "Element not found")
             return None
     
     def wait_for_loading_complete(self, timeout=30):
         """Wait for loading spinner to disappear."""
         try:
-            # Wait for spinner to appear first (optional)
-            try:
-                self.short_wait.until(EC.presence_of_element_located(self.LOADING_SPINNER))
-            except TimeoutException:
-                pass  # Spinner might not appear
-            
-            # Wait for spinner to disappear
-            WebDriverWait(self.driver, timeout).until(
+            # Succeeds immediately when no spinner is shown
+            self._get_wait(timeout).until(
                 EC.invisibility_of_element_located(self.LOADING_SPINNER)
             )
             return True
@@ -150,7 +223,7 @@ class BasePage:
     def wait_for_no_error_messages(self, timeout=10):
         """Wait for no error messages to be present."""
         try:
-            WebDriverWait(self.driver, timeout).until(
+            self._get_wait(timeout).until(
                 EC.invisibility_of_element_located(self.ERROR_MESSAGE)
             )
             return True
@@ -188,6 +261,30 @@ class BasePage:
         """Scroll to an element."""
         return self.helpers.scroll_to_element(locator, timeout)
     
+    def set_viewport_size(self, width, height):
+        """
+        Resize the page viewport.
+        
+        Chromium browsers emulate the size through CDP, which re-lays out the
+        loaded page without an OS window resize; other browsers resize the
+        window. Undo with reset_viewport_size().
+        """
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            self.driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+                "width": width,
+                "height": height,
+                "deviceScaleFactor": 0,
+                "mobile": width < 600
+            })
+        else:
+            self.driver.set_window_size(width, height)
+    
+    def reset_viewport_size(self):
+        """Drop a viewport size emulated by set_viewport_size()."""
+        # A resized window is restored by the driver fixture instead
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            self.driver.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
+    
     def scroll_to_top(self):
         """Scroll to top of page."""
         self.helpers.scroll_to_top()
@@ -200,6 +297,24 @@ class BasePage:
         """Hover over an element."""
         return self.helpers.hover_over_element(locator, timeout)
     
+    def wait_for_url_contains(self, url_part, timeout=None):
+        """Wait for the URL to contain the expected part."""
+        try:
+            self.helpers.wait_for_url_contains(url_part, timeout)
+            return True
+        except TimeoutException:
+            logger.error(f"URL does not contain {url_part}: {self.driver.current_url}")
+            return False
+    
+    def wait_for_url_matches(self, pattern, timeout=None):
+        """Wait for the URL to match a regular expression."""
+        try:
+            self._get_wait(timeout or TestConfig.EXPLICIT_WAIT).until(EC.url_matches(pattern))
+            return True
+        except TimeoutException:
+            logger.error(f"URL does not match {pattern}: {self.driver.current_url}")
+            return False
+    
     def get_current_url(self):
         """Get current URL."""
         return self.driver.current_url
@@ -210,11 +325,13 @@ class BasePage:
     
     def refresh_page(self):
         """Refresh the current page."""
+        self._element_cache.clear()
         self.driver.refresh()
         self.wait_for_page_load()
     
     def go_back(self):
         """Go back to previous page."""
+        self._element_cache.clear()
         self.driver.back()
         self.wait_for_page_load()
     
@@ -238,7 +355,9 @@ class BasePage:
         self.driver.close()
     
     def take_screenshot(self, description=""):
-        """Take a screenshot."""
+        """Take a screenshot (only when step screenshots are enabled)."""
+        if TestConfig.SCREENSHOTS != "always":
+            return None
         test_name = getattr(self, '_test_name', 'unknown_test')
         return self.screenshot_util.capture_screenshot(test_name, description)
     
@@ -246,83 +365,83 @@ class BasePage:
         """Verify page title."""
         actual_title = self.get_page_title()
         if expected_title in actual_title:
-            ReportHelpers.log_test_step(f"Verify page title", "PASS", f"Expected: {expected_title}, Actual: {actual_title}")
+            ReportHelpers.log_test_step("Verify page title", "PASS", expected_title, actual_title)
             return True
         else:
-            ReportHelpers.log_test_step(f"Verify page title", "FAIL", f"Expected: {expected_title}, Actual: {actual_title}")
+            ReportHelpers.log_test_step("Verify page title", "FAIL", expected_title, actual_title)
             return False
     
     def verify_url_contains(self, expected_url_part):
         """Verify URL contains expected part."""
         actual_url = self.get_current_url()
         if expected_url_part in actual_url:
-            ReportHelpers.log_test_step(f"Verify URL contains {expected_url_part}", "PASS", f"Actual URL: {actual_url}")
+            ReportHelpers.log_test_step("Verify URL contains", "PASS", expected_url_part, actual_url)
             return True
         else:
-            ReportHelpers.log_test_step(f"Verify URL contains {expected_url_part}", "FAIL", f"Actual URL: {actual_url}")
+            ReportHelpers.log_test_step("Verify URL contains", "FAIL", expected_url_part, actual_url)
             return False
     
     def verify_element_text(self, locator, expected_text):
         """Verify element text."""
         actual_text = self.get_element_text(locator)
         if actual_text and expected_text in actual_text:
-            ReportHelpers.log_test_step(f"Verify element text", "PASS", f"Expected: {expected_text}, Actual: {actual_text}")
+            ReportHelpers.log_test_step("Verify element text", "PASS", expected_text, actual_text)
             return True
         else:
-            ReportHelpers.log_test_step(f"Verify element text", "FAIL", f"Expected: {expected_text}, Actual: {actual_text}")
+            ReportHelpers.log_test_step("Verify element text", "FAIL", expected_text, actual_text)
             return False
     
     def verify_element_present(self, locator, timeout=5):
         """Verify element is present."""
         is_present = self.is_element_present(locator, timeout)
         if is_present:
-            ReportHelpers.log_test_step(f"Verify element present {locator}", "PASS")
+            ReportHelpers.log_test_step("Verify element present", "PASS", locator)
         else:
-            ReportHelpers.log_test_step(f"Verify element present {locator}", "FAIL")
+            ReportHelpers.log_test_step("Verify element present", "FAIL", locator)
         return is_present
     
     def verify_element_not_present(self, locator, timeout=5):
         """Verify element is not present."""
         is_present = self.is_element_present(locator, timeout)
         if not is_present:
-            ReportHelpers.log_test_step(f"Verify element not present {locator}", "PASS")
+            ReportHelpers.log_test_step("Verify element not present", "PASS", locator)
         else:
-            ReportHelpers.log_test_step(f"Verify element not present {locator}", "FAIL")
+            ReportHelpers.log_test_step("Verify element not present", "FAIL", locator)
         return not is_present
     
     def clear_browser_cache(self):
         """Clear browser cache and storage."""
-        self.driver.delete_all_cookies()
-        self.driver.execute_script("window.localStorage.clear();")
-        self.driver.execute_script("window.sessionStorage.clear();")
+        # Chromium clears cookies for every domain in one CDP call
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            self.driver.delete_all_cookies()
+        self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
         ReportHelpers.log_test_step("Clear browser cache", "PASS")
     
     def execute_javascript(self, script, *args):
         """Execute JavaScript code."""
         try:
             result = self.driver.execute_script(script, *args)
-            ReportHelpers.log_test_step("Execute JavaScript", "PASS", f"Script: {script}")
+            ReportHelpers.log_test_step("Execute JavaScript", "PASS", script)
             return result
         except Exception as e:
-            ReportHelpers.log_test_step("Execute JavaScript", "FAIL", f"Script: {script}, Error: {e}")
+            ReportHelpers.log_test_step("Execute JavaScript", "FAIL", script, e)
             return None
     
     def wait_for_ajax_complete(self, timeout=30):
         """Wait for AJAX requests to complete."""
+        # window.__pendingRequests is maintained by the tracking script DriverFactory
+        # installs on Chromium browsers; elsewhere only the document state is checked
         try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda driver: driver.execute_script("return jQuery.active == 0")
+            self._get_wait(timeout).until(
+                lambda driver: driver.execute_script(
+                    "return document.readyState === 'complete' && !window.__pendingRequests;"
+                )
             )
             return True
-        except:
-            # If jQuery is not available, wait for general document ready
-            try:
-                WebDriverWait(self.driver, timeout).until(
-                    lambda driver: driver.execute_script("return document.readyState") == "complete"
-                )
-                return True
-            except TimeoutException:
-                return False
+        except TimeoutException:
+            return False
     
     def get_browser_logs(self):
         """Get browser console logs."""
@@ -340,7 +459,7 @@ class BasePage:
         
         if errors:
             error_messages = [log['message'] for log in errors]
-            ReportHelpers.log_test_step("Check console errors", "FAIL", f"Errors found: {error_messages}")
+            ReportHelpers.log_test_step("Check console errors", "FAIL", error_messages)
             return False
         else:
             ReportHelpers.log_test_step("Check console errors", "PASS")
@@ -348,31 +467,56 @@ class BasePage:
     
     def get_all_links(self):
         """Get all links on the page."""
-        link_elements = self.driver.find_elements(By.TAG_NAME, "a")
-        links = []
-        for link in link_elements:
-            href = link.get_attribute("href")
-            text = link.text
-            if href:
-                links.append({"text": text, "href": href})
-        return links
-    
-    def verify_no_broken_links(self):
+        # Collect text and href for every link in a single round-trip
+        return self.driver.execute_script("""
+            return Array.from(document.querySelectorAll('a'))
+                .filter(link => link.href)
+                .map(link => ({text: link.innerText.trim(), href: link.href}));
+        """)
+    
+    def verify_no_broken_links(self, max_workers=16):
         """Verify there are no broken links on the page."""
         import requests
+        from concurrent.futures import ThreadPoolExecutor
+        from urllib.parse import urlparse
+        
         links = self.get_all_links()
-        broken_links = []
+        unique_hrefs = {link["href"] for link in links}
+        head_supported = {}
+        
+        # Check each distinct URL once, overlapping the requests on a shared session
+        with requests.Session() as session:
+            # The default adapter pools only 10 connections per host, fewer than the workers
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=max_workers)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            
+            def is_broken(href):
+                host = urlparse(href).netloc
+                try:
+                    if head_supported.get(host, True):
+                        response = session.head(href, timeout=10)
+                        if response.status_code not in (405, 501):
+                            return response.status_code >= 400
+                        # Host rejects HEAD; remember it and fall back to GET
+                        head_supported[host] = False
+                    
+                    # Stream so only the headers are read before closing
+                    with session.get(href, timeout=10, stream=True) as response:
+                        return response.status_code >= 400
+                except requests.exceptions.RequestException:
+                    return True
+            
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                broken_hrefs = {
+                    href for href, broken in zip(unique_hrefs, executor.map(is_broken, unique_hrefs))
+                    if broken
+                }
         
-        for link in links:
-            try:
-                response = requests.head(link["href"], timeout=10)
-                if response.status_code >= 400:
-                    broken_links.append(link)
-            except requests.exceptions.RequestException:
-                broken_links.append(link)
+        broken_links = [link for link in links if link["href"] in broken_hrefs]
         
         if broken_links:
-            ReportHelpers.log_test_step("Check broken links", "FAIL", f"Broken links: {broken_links}")
+            ReportHelpers.log_test_step("Check broken links", "FAIL", broken_links)
             return False
         else:
             ReportHelpers.log_test_step("Check broken links", "PASS")
@@ -9,6 +9,8 @@ from page_objects.base_page import BasePage
 from utilities.helpers import ReportHelpers
 from test_data.test_config import TestConfig
 import logging
+import re
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
@@ -21,122 +23,139 @@ class LoginPage(BasePage):
         self.register_url = f"{self.base_url}/register"
     
     # Login form locators
-    EMAIL_INPUT = (By.ID, "email")
-    PASSWORD_INPUT = (By.ID, "password")
-    LOGIN_BUTTON = (By.XPATH, "//button[contains(text(), 'Sign In') or contains(text(), 'Login')]")
-    FORGOT_PASSWORD_LINK = (By.LINK_TEXT, "Forgot Password?")
-    REGISTER_LINK = (By.LINK_TEXT, "Register")
+    EMAIL_INPUT = (By.CSS_SELECTOR, "#email")
+    PASSWORD_INPUT = (By.CSS_SELECTOR, "#password")
+    LOGIN_BUTTON = (By.CSS_SELECTOR, "button[type='submit']")
+    FORGOT_PASSWORD_LINK = (By.CSS_SELECTOR, "a[href='/forgot-password']")
+    REGISTER_LINK = (By.CSS_SELECTOR, "a[href='/register']")
     
     # Error and success message locators
-    ERROR_MESSAGE = (By.CLASS_NAME, "error-message")
     SUCCESS_MESSAGE = (By.CLASS_NAME, "success-message")
-    VALIDATION_ERROR = (By.CLASS_NAME, "validation-error")
     FIELD_ERROR = (By.CLASS_NAME, "field-error")
     
     # Form validation locators
-    EMAIL_REQUIRED_ERROR = (By.XPATH, "//span[contains(text(), 'Email is required')]")
-    PASSWORD_REQUIRED_ERROR = (By.XPATH, "//span[contains(text(), 'Password is required')]")
-    INVALID_EMAIL_ERROR = (By.XPATH, "//span[contains(text(), 'Please enter a valid email')]")
-    INVALID_CREDENTIALS_ERROR = (By.XPATH, "//span[contains(text(), 'Invalid credentials')]")
+    EMAIL_FIELD_ERROR = (By.CSS_SELECTOR, "#email-error")
+    PASSWORD_FIELD_ERROR = (By.CSS_SELECTOR, "#password-error")
+    VALIDATION_ERROR = (By.CSS_SELECTOR, "#email-error, #password-error")
+    LOGIN_ALERT = (By.CSS_SELECTOR, "[role='alert']")
+    # The app (src/app/(auth)/login/page.tsx) renders the credential error
+    # and both field errors with role="alert"
+    ERROR_MESSAGE = LOGIN_ALERT
+    # Every place a failed login reports its error, credential alert first
+    LOGIN_ERROR_LOCATORS = MappingProxyType({
+        "alert": LOGIN_ALERT,
+        "email": EMAIL_FIELD_ERROR,
+        "password": PASSWORD_FIELD_ERROR
+    })
+    
+    # Form validation errors as (locator, expected message)
+    EMAIL_REQUIRED_ERROR = (EMAIL_FIELD_ERROR, "Email is required")
+    PASSWORD_REQUIRED_ERROR = (PASSWORD_FIELD_ERROR, "Password is required")
+    INVALID_EMAIL_ERROR = (EMAIL_FIELD_ERROR, "Please enter a valid email")
+    INVALID_CREDENTIALS_ERROR = (LOGIN_ALERT, "Invalid credentials")
+    LOGIN_ERRORS = {
+        "email_required": EMAIL_REQUIRED_ERROR,
+        "password_required": PASSWORD_REQUIRED_ERROR,
+        "invalid_email": INVALID_EMAIL_ERROR,
+        "invalid_credentials": INVALID_CREDENTIALS_ERROR
+    }
     
     # Login form elements
-    REMEMBER_ME_CHECKBOX = (By.ID, "remember-me")
-    SHOW_PASSWORD_BUTTON = (By.XPATH, "//button[contains(@class, 'show-password')]")
+    REMEMBER_ME_CHECKBOX = (By.CSS_SELECTOR, "#rememberMe, #remember-me")
+    SHOW_PASSWORD_BUTTON = (By.CSS_SELECTOR, "button[aria-label='Show password'], button[class*='show-password']")
     
     # Social login (if available)
-    GOOGLE_LOGIN_BUTTON = (By.XPATH, "//button[contains(text(), 'Google')]")
-    FACEBOOK_LOGIN_BUTTON = (By.XPATH, "//button[contains(text(), 'Facebook')]")
+    GOOGLE_LOGIN_BUTTON = (By.CSS_SELECTOR, "button[data-provider='google'], button[aria-label*='Google']")
+    FACEBOOK_LOGIN_BUTTON = (By.CSS_SELECTOR, "button[data-provider='facebook'], button[aria-label*='Facebook']")
+    
+    # Logout controls rendered by the authenticated layouts
+    LOGOUT_BUTTON = (By.CSS_SELECTOR, "[data-action='logout'], .logout-btn, button[title='Sign out'], a[href='/logout']")
+    
+    # Post-login landing areas (matched in the path only, not e.g. ?redirect=/admin)
+    LOGIN_REDIRECT_PATTERN = re.compile(r"^[^?#]*/(dashboard|admin|company|consumer)([/?#]|$)")
+    # Landing area each role may be redirected to after login
+    ROLE_REDIRECT_PATTERNS = MappingProxyType({
+        role: re.compile(rf"^[^?#]*/({role}|dashboard)([/?#]|$)")
+        for role in ("admin", "company", "consumer")
+    })
     
     # Navigation elements
     LOGO = (By.CLASS_NAME, "logo")
-    HOME_LINK = (By.LINK_TEXT, "Home")
+    HOME_LINK = (By.CSS_SELECTOR, "a[href='/']")
+    
+    @staticmethod
+    def _type_into(field, text):
+        """Replace the contents of an input field."""
+        field.clear()
+        field.send_keys(text)
     
+    @ReportHelpers.log_step("Navigate to login page")
     def navigate_to_login(self):
-        """Navigate to login page."""
-        success = self.navigate_to(self.login_url)
-        if success:
-            self.wait_for_page_load()
-            ReportHelpers.log_test_step("Navigate to login page", "PASS")
-        else:
-            ReportHelpers.log_test_step("Navigate to login page", "FAIL")
-        return success
+        """Navigate to login page and wait until the form can be submitted."""
+        if not self.navigate_to(self.login_url):
+            return False
+        try:
+            self.wait_for_clickable_element(self.LOGIN_BUTTON)
+            return True
+        except TimeoutException:
+            logger.error("Login form did not become interactive")
+            return False
     
+    @ReportHelpers.log_step("Navigate to register page")
     def navigate_to_register(self):
         """Navigate to register page."""
-        success = self.navigate_to(self.register_url)
-        if success:
-            self.wait_for_page_load()
-            ReportHelpers.log_test_step("Navigate to register page", "PASS")
-        else:
-            ReportHelpers.log_test_step("Navigate to register page", "FAIL")
-        return success
+        return self.navigate_to(self.register_url)
     
+    @ReportHelpers.log_step("Enter email", lambda self, email: f"Email: {email}")
     def enter_email(self, email):
         """Enter email address."""
-        success = self.send_keys_to_element(self.EMAIL_INPUT, email)
-        if success:
-            ReportHelpers.log_test_step("Enter email", "PASS", f"Email: {email}")
-        else:
-            ReportHelpers.log_test_step("Enter email", "FAIL", f"Email: {email}")
-        return success
+        try:
+            self.on_cached_element(self.EMAIL_INPUT, lambda field: self._type_into(field, email))
+            return True
+        except TimeoutException:
+            return False
     
+    @ReportHelpers.log_step("Enter password")
     def enter_password(self, password):
         """Enter password."""
-        success = self.send_keys_to_element(self.PASSWORD_INPUT, password)
-        if success:
-            ReportHelpers.log_test_step("Enter password", "PASS", "Password entered")
-        else:
-            ReportHelpers.log_test_step("Enter password", "FAIL", "Failed to enter password")
-        return success
+        try:
+            self.on_cached_element(self.PASSWORD_INPUT, lambda field: self._type_into(field, password))
+            return True
+        except TimeoutException:
+            return False
     
+    @ReportHelpers.log_step("Click login button")
     def click_login_button(self):
         """Click login button."""
-        success = self.click_element(self.LOGIN_BUTTON)
-        if success:
-            ReportHelpers.log_test_step("Click login button", "PASS")
-        else:
-            ReportHelpers.log_test_step("Click login button", "FAIL")
-        return success
+        try:
+            self.on_cached_element(self.LOGIN_BUTTON, lambda button: button.click())
+            return True
+        except TimeoutException:
+            return False
     
+    @ReportHelpers.log_step("Click forgot password link")
     def click_forgot_password_link(self):
         """Click forgot password link."""
-        success = self.click_element(self.FORGOT_PASSWORD_LINK)
-        if success:
-            ReportHelpers.log_test_step("Click forgot password link", "PASS")
-        else:
-            ReportHelpers.log_test_step("Click forgot password link", "FAIL")
-        return success
+        return self.click_element(self.FORGOT_PASSWORD_LINK)
     
+    @ReportHelpers.log_step("Click register link")
     def click_register_link(self):
         """Click register link."""
-        success = self.click_element(self.REGISTER_LINK)
-        if success:
-            ReportHelpers.log_test_step("Click register link", "PASS")
-        else:
-            ReportHelpers.log_test_step("Click register link", "FAIL")
-        return success
+        return self.click_element(self.REGISTER_LINK)
     
+    @ReportHelpers.log_step("Toggle remember me")
     def toggle_remember_me(self):
         """Toggle remember me checkbox."""
-        success = self.click_element(self.REMEMBER_ME_CHECKBOX)
-        if success:
-            ReportHelpers.log_test_step("Toggle remember me", "PASS")
-        else:
-            ReportHelpers.log_test_step("Toggle remember me", "FAIL")
-        return success
+        return self.click_element(self.REMEMBER_ME_CHECKBOX)
     
+    @ReportHelpers.log_step("Show password")
     def show_password(self):
         """Click show password button."""
-        success = self.click_element(self.SHOW_PASSWORD_BUTTON)
-        if success:
-            ReportHelpers.log_test_step("Show password", "PASS")
-        else:
-            ReportHelpers.log_test_step("Show password", "FAIL")
-        return success
+        return self.click_element(self.SHOW_PASSWORD_BUTTON)
     
     def login(self, email, password):
         """Perform login with email and password."""
-        ReportHelpers.log_test_step("Start login process", "INFO", f"Email: {email}")
+        ReportHelpers.log_test_step("Start login process", "INFO", email)
         
         # Enter credentials
         if not self.enter_email(email):
@@ -149,88 +168,173 @@ class LoginPage(BasePage):
         if not self.click_login_button():
             return False
         
-        # Wait for page to load after login
-        self.wait_for_page_load()
+        self._wait_for_login_submit()
         
         # Check for errors
-        if self.is_error_present():
-            error_message = self.get_error_message()
-            ReportHelpers.log_test_step("Login process", "FAIL", f"Error: {error_message}")
+        error_message = self._read_login_error()
+        if error_message:
+            ReportHelpers.log_test_step("Login process", "FAIL", error_message)
             return False
         
         ReportHelpers.log_test_step("Login process", "PASS")
         return True
     
+    def _wait_for_login_submit(self):
+        """Wait until a submitted login leaves the login page or renders an error."""
+        # The app routes client-side, so document.readyState is already complete;
+        # the URL change or the error is the real signal
+        try:
+            self.short_wait.until(EC.any_of(
+                EC.none_of(EC.url_contains("/login")),
+                *(EC.presence_of_element_located(locator) for locator in self.LOGIN_ERROR_LOCATORS.values())
+            ))
+        except TimeoutException:
+            pass
+    
+    def _read_login_error(self):
+        """Return the first login error text shown, or None, in one round-trip."""
+        texts = self.helpers.safe_get_texts(self.LOGIN_ERROR_LOCATORS)
+        return next((text for text in texts.values() if text), None)
+    
     def quick_login(self, user_data):
         """Quick login using user data dictionary."""
         return self.login(user_data["email"], user_data["password"])
     
     def is_login_successful(self):
         """Check if login was successful by verifying URL change."""
+        # The app redirects admins, companies and consumers to their own areas
+        # rather than /dashboard, so wait for any of them and poll the client-side
+        # route change quickly instead of waiting out the /dashboard timeout
         try:
-            # Wait for URL to change from login page
-            self.wait.until(EC.url_contains("/dashboard"))
-            ReportHelpers.log_test_step("Verify login success", "PASS", "Redirected to dashboard")
-            return True
+            self.wait.until(
+                EC.url_matches(self.LOGIN_REDIRECT_PATTERN)
+            )
         except TimeoutException:
-            # Check for specific redirect URLs
-            current_url = self.get_current_url()
-            if any(path in current_url for path in ["/dashboard", "/admin", "/company", "/consumer"]):
-                ReportHelpers.log_test_step("Verify login success", "PASS", f"Redirected to {current_url}")
-                return True
-            else:
-                ReportHelpers.log_test_step("Verify login success", "FAIL", f"Still on login page: {current_url}")
-                return False
+            pass
+        
+        current_url = self.get_current_url()
+        if self.LOGIN_REDIRECT_PATTERN.search(current_url):
+            ReportHelpers.log_test_step("Verify login success", "PASS", current_url)
+            return True
+        else:
+            ReportHelpers.log_test_step("Verify login success", "FAIL", current_url)
+            return False
     
     def is_error_present(self):
         """Check if error message is present."""
-        return self.is_element_present(self.ERROR_MESSAGE, timeout=3)
+        # Stop waiting as soon as the error shows or the login has redirected;
+        # url_matches yields True, the visibility check yields the element
+        try:
+            found = self._get_wait(3).until(EC.any_of(
+                *(EC.visibility_of_element_located(locator) for locator in self.LOGIN_ERROR_LOCATORS.values()),
+                EC.url_matches(self.LOGIN_REDIRECT_PATTERN)
+            ))
+        except TimeoutException:
+            return False
+        return found is not True
     
     def get_error_message(self):
         """Get error message text."""
         if self.is_error_present():
-            return self.get_element_text(self.ERROR_MESSAGE)
+            return self._read_login_error()
         return None
     
+    def login_failure_state(self, timeout=3):
+        """
+        Read the URL and error message after a failed login in one script,
+        polling until the error text appears or the timeout passes.
+        
+        Returns:
+            dict: url and error_text (None if no error message is shown)
+        """
+        state = {}
+        
+        def error_shown(driver):
+            state.update(driver.execute_script(
+                """
+                const errors = arguments[0].map(selector => document.querySelector(selector));
+                const error = errors.find(element => element && element.innerText);
+                return {url: location.href, error_text: error ? error.innerText : null};
+                """,
+                [locator[1] for locator in self.LOGIN_ERROR_LOCATORS.values()]
+            ))
+            return bool(state["error_text"])
+        
+        try:
+            self._get_wait(timeout).until(error_shown)
+        except TimeoutException:
+            pass
+        return state
+    
     def get_validation_errors(self):
         """Get all validation error messages."""
         errors = []
         try:
-            error_elements = self.driver.find_elements(*self.VALIDATION_ERROR)
-            for element in error_elements:
-                errors.append(element.text)
+            # Collect every message in one script instead of a .text call per element
+            errors = self.driver.execute_script(
+                "return Array.from(document.querySelectorAll(arguments[0]), e => e.innerText);",
+                self.VALIDATION_ERROR[1]
+            )
         except Exception as e:
             logger.error(f"Failed to get validation errors: {e}")
         return errors
     
     def has_validation_errors(self):
         """Check if there are validation errors."""
-        return len(self.get_validation_errors()) > 0
+        return bool(self.driver.find_elements(*self.VALIDATION_ERROR))
+    
+    def get_error_flags(self, timeout=5):
+        """
+        Check every known login error message with one script per poll.
+        
+        Args:
+            timeout (int): Seconds to wait for any of the errors to appear
+            
+        Returns:
+            dict: LOGIN_ERRORS key -> whether that message is shown
+        """
+        checks = {name: [locator[1], message] for name, (locator, message) in self.LOGIN_ERRORS.items()}
+        
+        def error_flags_once_shown(driver):
+            flags = driver.execute_script(
+                """
+                const flags = {};
+                for (const [name, [selector, message]] of Object.entries(arguments[0])) {
+                    const element = document.querySelector(selector);
+                    flags[name] = !!element && element.innerText.includes(message);
+                }
+                return flags;
+                """,
+                checks
+            )
+            return flags if any(flags.values()) else False
+        
+        try:
+            return self._get_wait(timeout).until(error_flags_once_shown)
+        except TimeoutException:
+            return dict.fromkeys(self.LOGIN_ERRORS, False)
     
     def verify_email_required_error(self):
         """Verify email required error message."""
-        return self.is_element_present(self.EMAIL_REQUIRED_ERROR, timeout=5)
+        return self.get_error_flags()["email_required"]
     
     def verify_password_required_error(self):
         """Verify password required error message."""
-        return self.is_element_present(self.PASSWORD_REQUIRED_ERROR, timeout=5)
+        return self.get_error_flags()["password_required"]
     
     def verify_invalid_email_error(self):
         """Verify invalid email format error message."""
-        return self.is_element_present(self.INVALID_EMAIL_ERROR, timeout=5)
+        return self.get_error_flags()["invalid_email"]
     
     def verify_invalid_credentials_error(self):
         """Verify invalid credentials error message."""
-        return self.is_element_present(self.INVALID_CREDENTIALS_ERROR, timeout=5)
+        return self.get_error_flags()["invalid_credentials"]
     
     def clear_login_form(self):
         """Clear login form fields."""
         try:
-            email_field = self.wait_for_element(self.EMAIL_INPUT, timeout=5)
-            password_field = self.wait_for_element(self.PASSWORD_INPUT, timeout=5)
-            
-            email_field.clear()
-            password_field.clear()
+            self.on_cached_element(self.EMAIL_INPUT, lambda field: field.clear(), timeout=5)
+            self.on_cached_element(self.PASSWORD_INPUT, lambda field: field.clear(), timeout=5)
             
             ReportHelpers.log_test_step("Clear login form", "PASS")
             return True
@@ -238,57 +342,142 @@ class LoginPage(BasePage):
             ReportHelpers.log_test_step("Clear login form", "FAIL", "Form fields not found")
             return False
     
+    def fill_login_form(self, email, password):
+        """
+        Set both login fields and read them back in a single browser round-trip.
+        
+        Values go through the native input value setter followed by an input
+        event, so React-controlled fields update their state as with typing.
+        
+        Returns:
+            dict: email and password field values after the update, or None
+            if the form is not rendered
+        """
+        return self.driver.execute_script(
+            """
+            const email = document.querySelector(arguments[0]);
+            const password = document.querySelector(arguments[1]);
+            if (!email || !password) return null;
+            const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+            for (const [field, value] of [[email, arguments[2]], [password, arguments[3]]]) {
+                setValue.call(field, value);
+                field.dispatchEvent(new Event('input', {bubbles: true}));
+            }
+            return {email: email.value, password: password.value};
+            """,
+            self.EMAIL_INPUT[1],
+            self.PASSWORD_INPUT[1],
+            email,
+            password
+        )
+    
+    def snapshot_login_form(self):
+        """
+        Read the login form state in a single browser round-trip.
+        
+        Returns:
+            dict: Field values, focus, password input type, submit button and
+            remember me state (None for anything not rendered)
+        """
+        state = {}
+        
+        def form_rendered(driver):
+            state.update(driver.execute_script(
+                """
+                const email = document.querySelector(arguments[0]);
+                const password = document.querySelector(arguments[1]);
+                const button = document.querySelector(arguments[2]);
+                const rememberMe = document.querySelector(arguments[3]);
+                const active = document.activeElement;
+                return {
+                    email: email ? email.value : null,
+                    password: password ? password.value : null,
+                    email_focused: !!email && active === email,
+                    password_focused: !!password && active === password,
+                    password_type: password ? password.type : null,
+                    login_button_enabled: !!button && !button.disabled,
+                    remember_me_checked: !!rememberMe && rememberMe.checked
+                };
+                """,
+                self.EMAIL_INPUT[1],
+                self.PASSWORD_INPUT[1],
+                self.LOGIN_BUTTON[1],
+                self.REMEMBER_ME_CHECKBOX[1]
+            ))
+            return state["email"] is not None
+        
+        # The script doubles as the readiness check, so a rendered form costs
+        # exactly one round-trip instead of a find_element plus the script
+        try:
+            self._get_wait(5).until(form_rendered)
+        except TimeoutException:
+            pass
+        return state
+    
+    def probe_login_page(self):
+        """
+        Read the login page title, URL and which elements are rendered in a
+        single browser round-trip.
+        
+        Returns:
+            dict: title, url, and a presence flag per login page element
+        """
+        return self.driver.execute_script(
+            """
+            return {
+                title: document.title,
+                url: location.href,
+                email_input: !!document.querySelector(arguments[0]),
+                password_input: !!document.querySelector(arguments[1]),
+                login_button: !!document.querySelector(arguments[2]),
+                remember_me: !!document.querySelector(arguments[3]),
+                forgot_password_link: !!document.querySelector(arguments[4]),
+                register_link: !!document.querySelector(arguments[5])
+            };
+            """,
+            self.EMAIL_INPUT[1],
+            self.PASSWORD_INPUT[1],
+            self.LOGIN_BUTTON[1],
+            self.REMEMBER_ME_CHECKBOX[1],
+            self.FORGOT_PASSWORD_LINK[1],
+            self.REGISTER_LINK[1]
+        )
+    
     def get_email_field_value(self):
         """Get current value of email field."""
-        return self.get_element_attribute(self.EMAIL_INPUT, "value")
+        return self.snapshot_login_form()["email"]
     
     def get_password_field_value(self):
         """Get current value of password field."""
-        return self.get_element_attribute(self.PASSWORD_INPUT, "value")
+        return self.snapshot_login_form()["password"]
     
     def is_email_field_focused(self):
         """Check if email field is focused."""
-        email_field = self.wait_for_element(self.EMAIL_INPUT, timeout=5)
-        return email_field == self.driver.switch_to.active_element
+        return self.snapshot_login_form()["email_focused"]
     
     def is_password_field_focused(self):
         """Check if password field is focused."""
-        password_field = self.wait_for_element(self.PASSWORD_INPUT, timeout=5)
-        return password_field == self.driver.switch_to.active_element
+        return self.snapshot_login_form()["password_focused"]
     
     def is_login_button_enabled(self):
         """Check if login button is enabled."""
-        try:
-            button = self.wait_for_element(self.LOGIN_BUTTON, timeout=5)
-            return button.is_enabled()
-        except TimeoutException:
-            return False
+        return self.snapshot_login_form()["login_button_enabled"]
     
     def is_remember_me_checked(self):
         """Check if remember me checkbox is checked."""
-        try:
-            checkbox = self.wait_for_element(self.REMEMBER_ME_CHECKBOX, timeout=5)
-            return checkbox.is_selected()
-        except TimeoutException:
-            return False
+        return self.snapshot_login_form()["remember_me_checked"]
     
     def logout(self):
         """Perform logout."""
         try:
-            # Look for logout button or link
-            logout_locators = [
-                (By.XPATH, "//button[contains(text(), 'Logout') or contains(text(), 'Sign Out')]"),
-                (By.LINK_TEXT, "Logout"),
-                (By.LINK_TEXT, "Sign Out"),
-                (By.CLASS_NAME, "logout-btn")
-            ]
-            
-            for locator in logout_locators:
-                if self.is_element_present(locator, timeout=2):
-                    self.click_element(locator)
-                    self.wait_for_page_load()
-                    ReportHelpers.log_test_step("Logout", "PASS")
-                    return True
+            # Look for logout button or link; find_elements returns at once when
+            # there is none instead of waiting out a timeout
+            logout_elements = self.driver.find_elements(*self.LOGOUT_BUTTON)
+            if logout_elements:
+                logout_elements[0].click()
+                self.wait_for_page_load()
+                ReportHelpers.log_test_step("Logout", "PASS")
+                return True
             
             # If no logout button found, clear session manually
             self.clear_browser_cache()
@@ -303,19 +492,29 @@ class LoginPage(BasePage):
     
     def verify_login_page_elements(self):
         """Verify all login page elements are present."""
-        required_elements = [
-            (self.EMAIL_INPUT, "Email input field"),
-            (self.PASSWORD_INPUT, "Password input field"),
-            (self.LOGIN_BUTTON, "Login button")
-        ]
+        required_elements = {
+            "email_input": "Email input field",
+            "password_input": "Password input field",
+            "login_button": "Login button"
+        }
         
-        missing_elements = []
-        for locator, description in required_elements:
-            if not self.is_element_present(locator, timeout=5):
-                missing_elements.append(description)
+        # Probe every element per poll instead of one wait per element
+        page_state = {}
+        
+        def all_present(driver):
+            page_state.update(self.probe_login_page())
+            return all(page_state[key] for key in required_elements)
+        
+        try:
+            self._get_wait(5).until(all_present)
+        except TimeoutException:
+            pass
+        
+        missing_elements = [description for key, description in required_elements.items()
+                            if not page_state.get(key)]
         
         if missing_elements:
-            ReportHelpers.log_test_step("Verify login page elements", "FAIL", f"Missing: {missing_elements}")
+            ReportHelpers.log_test_step("Verify login page elements", "FAIL", missing_elements)
             return False
         else:
             ReportHelpers.log_test_step("Verify login page elements", "PASS")
@@ -330,6 +529,19 @@ class LoginPage(BasePage):
         """Verify login page URL."""
         return self.verify_url_contains("/login")
     
+    def is_redirected_to_login(self, timeout=5):
+        """Check whether the app sent the user back to the login form."""
+        # One poll loop checks both signals instead of a URL read followed by
+        # a separate element wait
+        try:
+            self._get_wait(timeout).until(EC.any_of(
+                EC.url_contains("/login"),
+                EC.presence_of_element_located(self.LOGIN_BUTTON)
+            ))
+            return True
+        except TimeoutException:
+            return False
+    
     def test_login_with_enter_key(self, email, password):
         """Test login using Enter key instead of button click."""
         from selenium.webdriver.common.keys import Keys
@@ -338,10 +550,9 @@ class LoginPage(BasePage):
         self.enter_password(password)
         
         # Press Enter key in password field
-        password_field = self.wait_for_element(self.PASSWORD_INPUT)
-        password_field.send_keys(Keys.RETURN)
+        self.on_cached_element(self.PASSWORD_INPUT, lambda field: field.send_keys(Keys.RETURN))
         
-        self.wait_for_page_load()
+        self._wait_for_login_submit()
         return self.is_login_successful()
     
     def test_login_with_tab_navigation(self, email, password):
@@ -367,32 +578,31 @@ class LoginPage(BasePage):
         login_button = self.driver.switch_to.active_element
         login_button.send_keys(Keys.RETURN)
         
-        self.wait_for_page_load()
+        self._wait_for_login_submit()
         return self.is_login_successful()
     
     def verify_password_masking(self):
         """Verify password field is masked."""
-        password_field = self.wait_for_element(self.PASSWORD_INPUT)
-        field_type = password_field.get_attribute("type")
+        field_type = self.snapshot_login_form()["password_type"]
         
         if field_type == "password":
             ReportHelpers.log_test_step("Verify password masking", "PASS")
             return True
         else:
-            ReportHelpers.log_test_step("Verify password masking", "FAIL", f"Field type: {field_type}")
+            ReportHelpers.log_test_step("Verify password masking", "FAIL", field_type)
             return False
     
     def verify_social_login_options(self):
         """Verify social login options are available."""
-        social_buttons = [
-            (self.GOOGLE_LOGIN_BUTTON, "Google login"),
-            (self.FACEBOOK_LOGIN_BUTTON, "Facebook login")
-        ]
+        social_buttons = {
+            "Google login": self.GOOGLE_LOGIN_BUTTON,
+            "Facebook login": self.FACEBOOK_LOGIN_BUTTON
+        }
         
-        available_options = []
-        for locator, description in social_buttons:
-            if self.is_element_present(locator, timeout=3):
-                available_options.append(description)
+        # The page is already loaded, so absent buttons are not waited for;
+        # every button is checked in one round-trip
+        present = self.helpers.are_elements_present(social_buttons)
+        available_options = [description for description, found in present.items() if found]
         
-        ReportHelpers.log_test_step("Verify social login options", "INFO", f"Available: {available_options}")
+        ReportHelpers.log_test_step("Verify social login options", "INFO", available_options)
         return available_options
@@ -6,26 +6,37 @@ import os
 import sys
 import subprocess
 import argparse
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from test_data.test_config import TestConfig
 
-def run_smoke_tests(browser="chrome", headless=False, parallel=True, markers=None, output_dir="reports"):
+# Keeps the buffered output of concurrent runs from interleaving
+_output_lock = threading.Lock()
+
+def run_smoke_tests(browser="chrome", headless=None, parallel=True, markers=None, output_dir="reports",
+                    isolate=False, workers=None, buffer_output=False):
     """
     Run smoke tests with specified configuration.
     
     Args:
         browser (str): Browser to use (chrome, firefox, edge)
-        headless (bool): Run in headless mode
+        headless (bool): Run in headless mode; None uses the HEADLESS default
         parallel (bool): Run tests in parallel
         markers (str): pytest markers to filter tests
         output_dir (str): Output directory for reports
+        isolate (bool): Run pytest in a fresh interpreter instead of in-process
+        workers (int|str): xdist worker count or "auto"; defaults to TestConfig.PARALLEL_WORKERS
+        buffer_output (bool): With isolate, collect the run's output and print it
+            as one block when it finishes instead of streaming it
     """
     
     # Ensure output directory exists
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
     
-    # Build pytest command
-    cmd = ["python", "-m", "pytest"]
+    # Build pytest arguments
+    cmd = []
     
     # Add test directory
     cmd.append("test_suites/")
@@ -34,23 +45,30 @@ def run_smoke_tests(browser="chrome", headless=False, parallel=True, markers=Non
     cmd.extend(["--browser", browser])
     
     # Add headless option if specified
-    if headless:
-        cmd.append("--headless")
+    if headless is not None:
+        cmd.append("--headless" if headless else "--headed")
     
     # Add parallel execution if specified
     if parallel:
-        cmd.extend(["-n", "4"])
+        workers = str(workers or TestConfig.PARALLEL_WORKERS)
+        # Keep each file's tests on one worker to reuse its login
+        cmd.extend(["-n", workers, "--dist=loadfile"])
+    else:
+        cmd.extend(["-n", "0"])
     
     # Add markers if specified
     if markers:
         cmd.extend(["-m", markers])
     
+    # Use one timestamp so the HTML and JUnit reports of a run always pair up
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    
     # Add HTML report
-    html_report = os.path.join(output_dir, f"smoke_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html")
+    html_report = os.path.join(output_dir, f"smoke_report_{timestamp}.html")
     cmd.extend(["--html", html_report, "--self-contained-html"])
     
     # Add JUnit XML report
-    xml_report = os.path.join(output_dir, f"smoke_junit_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xml")
+    xml_report = os.path.join(output_dir, f"smoke_junit_{timestamp}.xml")
     cmd.extend(["--junitxml", xml_report])
     
     # Add verbose output
@@ -62,18 +80,39 @@ def run_smoke_tests(browser="chrome", headless=False, parallel=True, markers=Non
     # Add duration report
     cmd.append("--durations=10")
     
-    print(f"Running smoke tests with command: {' '.join(cmd)}")
-    print(f"Browser: {browser}")
-    print(f"Headless: {headless}")
-    print(f"Parallel: {parallel}")
-    print(f"Markers: {markers}")
-    print(f"Output directory: {output_dir}")
-    print("-" * 50)
+    header = "\n".join([
+        f"Running smoke tests with arguments: {' '.join(cmd)}",
+        f"Browser: {browser}",
+        f"Headless: {headless}",
+        f"Parallel: {parallel} (workers: {workers if parallel else 0})",
+        f"Markers: {markers}",
+        f"Output directory: {output_dir}",
+        "-" * 50
+    ])
+    if not (isolate and buffer_output):
+        print(header)
     
     # Run the tests
+    test_dir = os.path.dirname(os.path.abspath(__file__))
     try:
-        result = subprocess.run(cmd, cwd=os.path.dirname(__file__), capture_output=False)
-        return result.returncode
+        if isolate:
+            if buffer_output:
+                result = subprocess.run([sys.executable, "-m", "pytest", *cmd], cwd=test_dir,
+                                        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+                with _output_lock:
+                    print(header)
+                    print(result.stdout, end="", flush=True)
+            else:
+                result = subprocess.run([sys.executable, "-m", "pytest", *cmd], cwd=test_dir, capture_output=False)
+            return result.returncode
+        
+        # In-process run skips a second interpreter start-up and re-import
+        previous_dir = os.getcwd()
+        os.chdir(test_dir)
+        try:
+            return int(pytest.main(cmd))
+        finally:
+            os.chdir(previous_dir)
     except Exception as e:
         print(f"Error running tests: {e}")
         return 1
@@ -117,21 +156,30 @@ def run_dashboard_tests():
 def run_cross_browser_tests():
     """Run tests across multiple browsers."""
     browsers = ["chrome", "firefox", "edge"]
-    results = []
     
-    for browser in browsers:
-        print(f"\n{'='*60}")
-        print(f"Running tests on {browser.upper()}")
-        print('='*60)
-        
-        result = run_smoke_tests(
-            browser=browser,
-            headless=True,
-            parallel=True,
-            markers="smoke and critical",
-            output_dir=f"reports/{browser}"
-        )
-        results.append((browser, result))
+    # Each browser run is an independent pytest process with its own xdist
+    # workers, so run them side by side; budget ~4 cores per run
+    max_concurrent = min(len(browsers), max(1, (os.cpu_count() or 1) // 4))
+    print(f"\n{'='*60}")
+    print(f"Running tests on {', '.join(b.upper() for b in browsers)} ({max_concurrent} at a time)")
+    print('='*60)
+    
+    with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+        futures = [
+            executor.submit(
+                run_smoke_tests,
+                browser=browser,
+                headless=True,
+                parallel=True,
+                markers="smoke and critical",
+                output_dir=f"reports/{browser}",
+                isolate=True,  # pytest.main cannot run concurrently in one process
+                buffer_output=True,  # Print each browser's output as one block
+                workers=max(1, (os.cpu_count() or 1) // max_concurrent)
+            )
+            for browser in browsers
+        ]
+        results = [(browser, future.result()) for browser, future in zip(browsers, futures)]
     
     # Summary
     print(f"\n{'='*60}")
@@ -158,7 +206,15 @@ def main():
     parser.add_argument(
         "--headless",
         action="store_true",
-        help="Run tests in headless mode"
+        default=None,
+        help="Run tests in headless mode (the default unless HEADLESS=false)"
+    )
+    
+    parser.add_argument(
+        "--headed",
+        action="store_false",
+        dest="headless",
+        help="Run tests with a visible browser window"
     )
     
     parser.add_argument(
@@ -168,6 +224,11 @@ def main():
         help="Run tests in parallel"
     )
     
+    parser.add_argument(
+        "--workers",
+        help="Number of parallel workers, or 'auto' for one per CPU (default: PARALLEL_WORKERS)"
+    )
+    
     parser.add_argument(
         "--markers",
         help="pytest markers to filter tests (e.g., 'smoke and critical')"
@@ -179,6 +240,12 @@ def main():
         help="Output directory for test reports"
     )
     
+    parser.add_argument(
+        "--isolate",
+        action="store_true",
+        help="Run pytest in a separate interpreter instead of in-process"
+    )
+    
     parser.add_argument(
         "--preset",
         choices=["quick", "full", "auth", "dashboard", "cross-browser"],
@@ -209,7 +276,9 @@ def main():
             headless=args.headless,
             parallel=args.parallel,
             markers=args.markers,
-            output_dir=args.output_dir
+            output_dir=args.output_dir,
+            isolate=args.isolate,
+            workers=args.workers
         )
     
     # Exit with appropriate code
@@ -0,0 +1,88 @@
+"""
+Minimal fake data providers for generated test users.
+
+Only the handful of providers the generators use, backed by small static
+word lists. Values look plausible but are not locale-aware.
+"""
+
+import random
+
+FIRST_NAMES = (
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
+    "William", "Elizabeth", "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+    "Thomas", "Sarah", "Charles", "Karen", "Christopher", "Lisa", "Daniel", "Nancy",
+    "Matthew", "Betty", "Anthony", "Margaret", "Mark", "Sandra", "Donald", "Ashley",
+    "Steven", "Kimberly", "Paul", "Emily", "Andrew", "Donna", "Joshua", "Michelle",
+    "Kenneth", "Carol", "Kevin", "Amanda", "Brian", "Dorothy", "George", "Melissa",
+    "Timothy", "Deborah", "Ronald", "Stephanie", "Edward", "Rebecca", "Jason", "Sharon",
+    "Jeffrey", "Laura", "Ryan", "Cynthia", "Jacob", "Kathleen", "Gary", "Amy",
+    "Nicholas", "Angela", "Eric", "Shirley", "Jonathan", "Anna", "Stephen", "Brenda",
+    "Larry", "Pamela", "Justin", "Emma", "Scott", "Nicole", "Brandon", "Helen",
+    "Benjamin", "Samantha", "Samuel", "Katherine", "Gregory", "Christine", "Alexander", "Debra",
+    "Patrick", "Rachel", "Frank", "Carolyn", "Raymond", "Janet", "Jack", "Maria",
+    "Dennis", "Olivia", "Jerry", "Heather"
+)
+
+LAST_NAMES = (
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas",
+    "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson", "White",
+    "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson", "Walker", "Young",
+    "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill", "Flores",
+    "Green", "Adams", "Nelson", "Baker", "Hall", "Rivera", "Campbell", "Mitchell",
+    "Carter", "Roberts", "Gomez", "Phillips", "Evans", "Turner", "Diaz", "Parker",
+    "Cruz", "Edwards", "Collins", "Reyes", "Stewart", "Morris", "Morales", "Murphy",
+    "Cook", "Rogers", "Gutierrez", "Ortiz", "Morgan", "Cooper", "Peterson", "Bailey",
+    "Reed", "Kelly", "Howard", "Ramos", "Kim", "Cox", "Ward", "Richardson",
+    "Watson", "Brooks", "Chavez", "Wood", "James", "Bennett", "Gray", "Mendoza",
+    "Ruiz", "Hughes", "Price", "Alvarez", "Castillo", "Sanders", "Patel", "Myers",
+    "Long", "Ross", "Foster", "Jimenez"
+)
+
+COMPANY_SUFFIXES = ("Inc", "LLC", "Ltd", "Group", "PLC", "and Sons")
+
+EMAIL_DOMAINS = ("example.com", "example.org", "example.net")
+
+STREET_NAMES = (
+    "Maple", "Oak", "Pine", "Cedar", "Elm", "Washington", "Lake", "Hill",
+    "Park", "Main", "Church", "River", "Sunset", "Highland", "Meadow", "Forest"
+)
+
+STREET_SUFFIXES = ("Street", "Avenue", "Road", "Lane", "Drive", "Court", "Way", "Boulevard")
+
+CITIES = (
+    "Springfield", "Riverside", "Franklin", "Greenville", "Bristol", "Clinton", "Fairview",
+    "Salem", "Madison", "Georgetown", "Arlington", "Ashland", "Dover", "Oxford", "Jackson"
+)
+
+STATES = (
+    "AL", "AZ", "CA", "CO", "FL", "GA", "IL", "IN", "MA", "MI",
+    "MN", "NC", "NJ", "NY", "OH", "OR", "PA", "TX", "VA", "WA"
+)
+
+def first_name():
+    """Return a random first name."""
+    return random.choice(FIRST_NAMES)
+
+def last_name():
+    """Return a random last name."""
+    return random.choice(LAST_NAMES)
+
+def company():
+    """Return a random company name."""
+    if random.random() < 0.5:
+        return f"{random.choice(LAST_NAMES)} {random.choice(COMPANY_SUFFIXES)}"
+    return f"{random.choice(LAST_NAMES)}, {random.choice(LAST_NAMES)} and {random.choice(LAST_NAMES)}"
+
+def email():
+    """Return a random email address on a reserved example domain."""
+    return f"{first_name().lower()}.{last_name().lower()}@{random.choice(EMAIL_DOMAINS)}"
+
+def phone_number():
+    """Return a random US-style phone number."""
+    return f"{random.randint(200, 999)}-555-{random.randint(0, 9999):04d}"
+
+def address():
+    """Return a random two-line street address."""
+    street = f"{random.randint(1, 9999)} {random.choice(STREET_NAMES)} {random.choice(STREET_SUFFIXES)}"
+    return f"{street}\n{random.choice(CITIES)}, {random.choice(STATES)} {random.randint(10000, 99999)}"
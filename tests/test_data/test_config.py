@@ -3,10 +3,23 @@ Test configuration and constants for IoT Platform smoke tests.
 """
 
 import os
+from types import MappingProxyType
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables once; xdist workers and subprocess runs inherit
+# them from the parent, so they skip re-reading .env. Variables that are
+# already set (e.g. on CI) take precedence over the file.
+if not os.environ.get("_DOTENV_LOADED"):
+    load_dotenv(verbose=False, override=False)
+    os.environ["_DOTENV_LOADED"] = "1"
+
+def _freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
 
 class TestConfig:
     """Configuration class for test settings."""
@@ -17,40 +30,52 @@ class TestConfig:
     
     # Browser settings
     BROWSER = os.getenv("BROWSER", "chrome")
-    HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
+    # Headless by default; set HEADLESS=false or pass --headed to watch the browser
+    HEADLESS = os.getenv("HEADLESS", "true").lower() == "true"
     
-    # Timeout settings
-    IMPLICIT_WAIT = int(os.getenv("IMPLICIT_WAIT", "10"))
+    # Timeout settings (no implicit wait: mixing it with explicit waits
+    # makes negative checks block for the implicit timeout on every poll)
     EXPLICIT_WAIT = int(os.getenv("EXPLICIT_WAIT", "20"))
     PAGE_LOAD_TIMEOUT = int(os.getenv("PAGE_LOAD_TIMEOUT", "30"))
+    # Explicit waits poll every 100 ms instead of Selenium's 500 ms default,
+    # so client-side route changes and renders are picked up promptly
+    POLL_FREQUENCY = float(os.getenv("POLL_FREQUENCY", "0.1"))
+    
+    # Page load strategy: "eager" returns on DOMContentLoaded instead of waiting
+    # for every subresource; page objects rely on explicit waits for readiness
+    PAGE_LOAD_STRATEGY = os.getenv("PAGE_LOAD_STRATEGY", "eager")
+    
+    # Images are blocked through browser content settings unless LOAD_IMAGES=true;
+    # the smoke tests only check DOM state, so image bytes are wasted bandwidth
+    LOAD_IMAGES = os.getenv("LOAD_IMAGES", "false").lower() == "true"
     
     # Test environment
     ENVIRONMENT = os.getenv("ENVIRONMENT", "local")
     
     # Test users - Demo credentials from the application
-    ADMIN_USER = {
+    ADMIN_USER = _freeze({
         "email": "admin@iotplatform.com",
         "password": "Admin123!",
         "role": "admin",
         "expected_redirect": "/admin/dashboard"
-    }
+    })
     
-    COMPANY_USER = {
+    COMPANY_USER = _freeze({
         "email": "manager@acmecorp.com",
         "password": "Manager456!",
         "role": "company",
         "expected_redirect": "/company/dashboard"
-    }
+    })
     
-    CONSUMER_USER = {
+    CONSUMER_USER = _freeze({
         "email": "jane.doe@example.com",
         "password": "Consumer789!",
         "role": "consumer",
         "expected_redirect": "/consumer/dashboard"
-    }
+    })
     
     # Test data for registration
-    NEW_USER_DATA = {
+    NEW_USER_DATA = _freeze({
         "first_name": "Test",
         "last_name": "User",
         "email": "testuser@example.com",
@@ -58,16 +83,16 @@ class TestConfig:
         "confirm_password": "TestPass123!",
         "company": "Test Company",
         "role": "consumer"
-    }
+    })
     
     # Invalid test data
-    INVALID_USER = {
+    INVALID_USER = _freeze({
         "email": "invalid@email.com",
         "password": "wrongpassword"
-    }
+    })
     
     # API endpoints
-    API_ENDPOINTS = {
+    API_ENDPOINTS = _freeze({
         "auth": {
             "login": "/auth/login",
             "register": "/auth/register",
@@ -85,10 +110,10 @@ class TestConfig:
             "delete": "/devices/{id}",
             "status": "/devices/{id}/status"
         }
-    }
+    })
     
     # Expected page titles
-    PAGE_TITLES = {
+    PAGE_TITLES = _freeze({
         "home": "IoT Platform - Device Management & Analytics",
         "login": "Login - IoT Platform",
         "register": "Register - IoT Platform",
@@ -96,29 +121,29 @@ class TestConfig:
         "devices": "Devices - IoT Platform",
         "analytics": "Analytics - IoT Platform",
         "admin": "Admin Panel - IoT Platform"
-    }
+    })
     
     # Navigation menu items
-    NAVIGATION_ITEMS = [
+    NAVIGATION_ITEMS = _freeze([
         {"name": "Dashboard", "href": "/", "icon": "HomeIcon"},
         {"name": "Devices", "href": "/login", "icon": "CpuChipIcon"},
         {"name": "Analytics", "href": "/login", "icon": "ChartBarIcon"},
         {"name": "Users", "href": "/login", "icon": "UserGroupIcon"},
         {"name": "Settings", "href": "/login", "icon": "CogIcon"},
         {"name": "Security", "href": "/login", "icon": "ShieldCheckIcon"}
-    ]
+    ])
     
     # Test data for devices
-    DEVICE_DATA = {
+    DEVICE_DATA = _freeze({
         "name": "Test Device",
         "type": "sensor",
         "location": "Test Location",
         "status": "active",
         "firmware_version": "1.0.0"
-    }
+    })
     
     # Expected error messages
-    ERROR_MESSAGES = {
+    ERROR_MESSAGES = _freeze({
         "invalid_credentials": "Invalid credentials",
         "email_required": "Email is required",
         "password_required": "Password is required",
@@ -129,11 +154,14 @@ class TestConfig:
         "email_already_exists": "Email already exists",
         "session_expired": "Session expired",
         "access_denied": "Access denied"
-    }
+    })
     
     # Screenshot settings
     SCREENSHOT_DIR = os.path.join(os.path.dirname(__file__), "..", "reports", "screenshots")
     SCREENSHOT_ON_FAILURE = True
+    # Step screenshots from take_screenshot: "on-failure" (skip them; failures
+    # are still captured), "always", or "never" (no screenshots at all)
+    SCREENSHOTS = os.getenv("SCREENSHOTS", "on-failure")
     
     # Report settings
     REPORT_DIR = os.path.join(os.path.dirname(__file__), "..", "reports")
@@ -143,15 +171,15 @@ class TestConfig:
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     LOG_FILE = os.path.join(REPORT_DIR, "test.log")
     
-    # Parallel execution settings
-    PARALLEL_WORKERS = int(os.getenv("PARALLEL_WORKERS", "4"))
+    # Parallel execution settings ("auto" lets pytest-xdist use one worker per CPU)
+    PARALLEL_WORKERS = os.getenv("PARALLEL_WORKERS", "auto")
     
     # Retry settings
     MAX_RETRIES = int(os.getenv("MAX_RETRIES", "2"))
     RETRY_DELAY = int(os.getenv("RETRY_DELAY", "1"))
     
     # Mobile device settings for responsive testing
-    MOBILE_DEVICES = {
+    MOBILE_DEVICES = _freeze({
         "iPhone 12": {
             "width": 390,
             "height": 844,
@@ -170,18 +198,53 @@ class TestConfig:
             "pixel_ratio": 2,
             "user_agent": "Mozilla/5.0 (iPad; CPU OS 14_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1"
         }
-    }
+    })
+    
+    # Pre-provisioned WebDriver binaries (skips webdriver_manager lookups when set)
+    DRIVER_PATHS = _freeze({
+        "chrome": os.getenv("CHROMEDRIVER_PATH"),
+        "firefox": os.getenv("GECKODRIVER_PATH"),
+        "edge": os.getenv("EDGEDRIVER_PATH")
+    })
+    
+    # Third-party hosts blocked on Chromium browsers during test runs
+    BLOCKED_URLS = (
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*doubleclick.net*",
+        "*.hotjar.com*",
+        "*sentry.io*"
+    )
     
     # Browser-specific settings
-    BROWSER_SETTINGS = {
+    BROWSER_SETTINGS = _freeze({
         "chrome": {
             "options": [
                 "--disable-web-security",
-                "--disable-features=VizDisplayCompositor",
+                # Chrome only honours the last --disable-features switch, so
+                # every disabled feature has to be listed in this one
+                "--disable-features=VizDisplayCompositor,Translate,BackForwardCache,AcceptCHFrame",
                 "--disable-dev-shm-usage",
-                "--no-sandbox",
                 "--disable-gpu",
-                "--window-size=1920,1080"
+                "--window-size=1920,1080",
+                # Skip background services and first-run work that slow start-up
+                "--disable-background-networking",
+                "--disable-default-apps",
+                "--disable-extensions",
+                "--disable-sync",
+                "--disable-component-update",
+                "--metrics-recording-only",
+                "--no-first-run",
+                "--safebrowsing-disable-auto-update",
+                "--disable-renderer-backgrounding",
+                "--disable-backgrounding-occluded-windows",
+                "--mute-audio",
+                # Keep Chrome's own logging and crash reporting out of test runs
+                "--log-level=3",
+                "--silent",
+                "--disable-logging",
+                "--disable-breakpad",
+                "--disable-software-rasterizer"
             ]
         },
         "firefox": {
@@ -193,11 +256,25 @@ class TestConfig:
         "edge": {
             "options": [
                 "--disable-web-security",
-                "--disable-features=VizDisplayCompositor",
-                "--window-size=1920,1080"
+                "--disable-features=VizDisplayCompositor,Translate,BackForwardCache,AcceptCHFrame",
+                "--disable-dev-shm-usage",
+                "--window-size=1920,1080",
+                "--disable-background-networking",
+                "--disable-default-apps",
+                "--disable-sync",
+                "--disable-component-update",
+                "--metrics-recording-only",
+                "--no-first-run",
+                "--mute-audio"
             ]
         }
-    }
+    })
+    
+    # Set CONTAINER_MODE=true on CI containers to launch Chrome/Edge without
+    # the sandbox and the zygote process; it saves start-up time and memory
+    # there (and lets the browser run as root) but is less safe on desktops
+    CONTAINER_MODE = os.getenv("CONTAINER_MODE", "false").lower() == "true"
+    CONTAINER_OPTIONS = ("--no-zygote", "--no-sandbox")
 
 class TestUrls:
     """URL constants for different pages."""
@@ -205,41 +282,16 @@ class TestUrls:
     def __init__(self, base_url):
         self.base_url = base_url.rstrip('/')
         
-    @property
-    def home(self):
-        return f"{self.base_url}/"
-    
-    @property
-    def login(self):
-        return f"{self.base_url}/login"
-    
-    @property
-    def register(self):
-        return f"{self.base_url}/register"
-    
-    @property
-    def dashboard(self):
-        return f"{self.base_url}/dashboard"
-    
-    @property
-    def devices(self):
-        return f"{self.base_url}/devices"
-    
-    @property
-    def analytics(self):
-        return f"{self.base_url}/analytics"
-    
-    @property
-    def admin(self):
-        return f"{self.base_url}/admin"
-    
-    @property
-    def company(self):
-        return f"{self.base_url}/company"
-    
-    @property
-    def consumer(self):
-        return f"{self.base_url}/consumer"
+        # Page URLs are fixed once the base URL is known, so build them up front
+        self.home = f"{self.base_url}/"
+        self.login = f"{self.base_url}/login"
+        self.register = f"{self.base_url}/register"
+        self.dashboard = f"{self.base_url}/dashboard"
+        self.devices = f"{self.base_url}/devices"
+        self.analytics = f"{self.base_url}/analytics"
+        self.admin = f"{self.base_url}/admin"
+        self.company = f"{self.base_url}/company"
+        self.consumer = f"{self.base_url}/consumer"
 
 # Environment-specific configurations
 ENVIRONMENT_CONFIGS = {
@@ -3,81 +3,129 @@ Test user data and generators for IoT Platform smoke tests.
 """
 
 import random
+import time
 import string
 from datetime import datetime, timedelta
-from faker import Faker
+from types import MappingProxyType
+from test_data import _mini_faker
 
-# Initialize Faker
-fake = Faker()
+# Character classes for generated passwords
+_PW_LOWER = string.ascii_lowercase
+_PW_UPPER = string.ascii_uppercase
+_PW_DIGITS = string.digits
+_PW_SPECIAL = "!@#$%^&*"
+_PW_ALL = _PW_LOWER + _PW_UPPER + _PW_DIGITS + _PW_SPECIAL
+
+# Generated timestamps only need to be accurate to about a second, so the
+# current time is cached and re-read once the cache is older than that
+_NOW_MAX_AGE = 1.0
+_now_cache = [float("-inf"), None, ""]
+
+def _cached_now():
+    """Return (datetime, ISO string) for the current time, refreshed at most once a second."""
+    tick = time.monotonic()
+    if tick - _now_cache[0] > _NOW_MAX_AGE:
+        now = datetime.now()
+        _now_cache[:] = [tick, now, now.isoformat()]
+    return _now_cache[1], _now_cache[2]
+
+# Permissions and expected dashboard for each generated user role
+_ROLE_DEFAULTS = MappingProxyType({
+    "admin": (("read", "write", "delete", "admin"), "/admin/dashboard"),
+    "company": (("read", "write"), "/company/dashboard"),
+    "consumer": (("read",), "/consumer/dashboard")
+})
 
 class TestUsers:
-    """Static test user data."""
+    """Static test user data (read-only; copy with dict() before changing)."""
     
     # Primary test users (matching the demo credentials)
-    ADMIN = {
+    ADMIN = MappingProxyType({
         "email": "admin@iotplatform.com",
         "password": "Admin123!",
         "role": "admin",
         "first_name": "Admin",
         "last_name": "User",
         "company": "IoT Platform",
-        "permissions": ["read", "write", "delete", "admin"],
+        "permissions": ("read", "write", "delete", "admin"),
         "expected_dashboard": "/admin/dashboard"
-    }
+    })
     
-    COMPANY_MANAGER = {
+    COMPANY_MANAGER = MappingProxyType({
         "email": "manager@acmecorp.com",
         "password": "Manager456!",
         "role": "company",
         "first_name": "Company",
         "last_name": "Manager",
         "company": "ACME Corp",
-        "permissions": ["read", "write"],
+        "permissions": ("read", "write"),
         "expected_dashboard": "/company/dashboard"
-    }
+    })
     
-    CONSUMER = {
+    CONSUMER = MappingProxyType({
         "email": "jane.doe@example.com",
         "password": "Consumer789!",
         "role": "consumer",
         "first_name": "Jane",
         "last_name": "Doe",
         "company": "Example Inc",
-        "permissions": ["read"],
+        "permissions": ("read",),
         "expected_dashboard": "/consumer/dashboard"
-    }
+    })
     
     # Invalid test users
-    INVALID_EMAIL = {
+    INVALID_EMAIL = MappingProxyType({
         "email": "invalid@email.com",
         "password": "wrongpassword",
         "expected_error": "Invalid credentials"
-    }
+    })
     
-    INVALID_PASSWORD = {
+    INVALID_PASSWORD = MappingProxyType({
         "email": "admin@iotplatform.com",
         "password": "wrongpassword",
         "expected_error": "Invalid credentials"
-    }
+    })
     
-    EMPTY_FIELDS = {
+    EMPTY_FIELDS = MappingProxyType({
         "email": "",
         "password": "",
         "expected_error": "Email is required"
-    }
+    })
     
-    INVALID_EMAIL_FORMAT = {
+    INVALID_EMAIL_FORMAT = MappingProxyType({
         "email": "invalid-email",
         "password": "password123",
         "expected_error": "Please enter a valid email address"
-    }
+    })
+
+# Field overrides that make generated registration data invalid, by error type
+_INVALID_PATCHES = MappingProxyType({
+    "email_exists": MappingProxyType({"email": TestUsers.ADMIN["email"]}),
+    "password_mismatch": MappingProxyType({"confirm_password": "different_password"}),
+    "weak_password": MappingProxyType({"password": "weak", "confirm_password": "weak"}),
+    "invalid_email": MappingProxyType({"email": "invalid-email-format"}),
+    "missing_required": MappingProxyType({"email": "", "password": ""})
+})
 
 class TestUserGenerator:
     """Dynamic test user generator."""
     
+    __slots__ = ("_pools", "_email_prefix", "_email_counter")
+    
+    # Number of values pre-generated per fake data provider
+    POOL_SIZE = 200
+    
     def __init__(self):
-        self.fake = Faker()
-        self.used_emails = set()
+        self._pools = {}
+        # Emails are unique by construction: a per-instance nanosecond prefix
+        # plus a running counter, so no set of used addresses is needed
+        self._email_prefix = f"user{time.time_ns()}"
+        self._email_counter = 0
+    
+    @property
+    def fake(self):
+        """Fake data providers used for generated fields."""
+        return _mini_faker
     
     def generate_user(self, role="consumer", company=None):
         """Generate a unique test user."""
@@ -86,87 +134,135 @@ class TestUserGenerator:
         user_data = {
             "email": email,
             "password": self._generate_password(),
-            "first_name": self.fake.first_name(),
-            "last_name": self.fake.last_name(),
-            "company": company or self.fake.company(),
+            "first_name": self._sample("first_name"),
+            "last_name": self._sample("last_name"),
+            "company": company or self._sample("company"),
             "role": role,
-            "phone": self.fake.phone_number(),
-            "address": self.fake.address(),
-            "created_at": datetime.now().isoformat(),
+            "phone": self._sample("phone_number"),
+            "address": self._sample("address"),
+            "created_at": _cached_now()[1],
             "is_active": True,
             "is_verified": True
         }
-        
-        # Add role-specific permissions
-        if role == "admin":
-            user_data["permissions"] = ["read", "write", "delete", "admin"]
-            user_data["expected_dashboard"] = "/admin/dashboard"
-        elif role == "company":
-            user_data["permissions"] = ["read", "write"]
-            user_data["expected_dashboard"] = "/company/dashboard"
-        else:  # consumer
-            user_data["permissions"] = ["read"]
-            user_data["expected_dashboard"] = "/consumer/dashboard"
+        self._apply_role(user_data, role)
         
         return user_data
     
-    def generate_registration_data(self, role="consumer"):
-        """Generate data for user registration."""
-        password = self._generate_password()
+    def generate_users(self, n, role="consumer", company=None):
+        """
+        Generate n unique test users in one batch.
+        
+        Random picks are drawn for the whole batch at once and the creation
+        timestamp is shared, which is much cheaper than n generate_user calls.
+        """
+        first_names = random.choices(self._pool("first_name"), k=n)
+        last_names = random.choices(self._pool("last_name"), k=n)
+        companies = [company] * n if company else random.choices(self._pool("company"), k=n)
+        phones = random.choices(self._pool("phone_number"), k=n)
+        addresses = random.choices(self._pool("address"), k=n)
+        created_at = _cached_now()[1]
+        
+        users = []
+        for first_name, last_name, user_company, phone, address in zip(
+                first_names, last_names, companies, phones, addresses):
+            user_data = {
+                "email": self._generate_unique_email(),
+                "password": self._generate_password(),
+                "first_name": first_name,
+                "last_name": last_name,
+                "company": user_company,
+                "role": role,
+                "phone": phone,
+                "address": address,
+                "created_at": created_at,
+                "is_active": True,
+                "is_verified": True
+            }
+            self._apply_role(user_data, role)
+            users.append(user_data)
+        
+        return users
+    
+    def generate_registration_data(self, role="consumer", password=None):
+        """
+        Generate data for user registration.
+        
+        Args:
+            role (str): Role to register as
+            password (str): Password to use; a valid one is generated when None
+        """
+        if password is None:
+            password = self._generate_password()
         
         return {
-            "first_name": self.fake.first_name(),
-            "last_name": self.fake.last_name(),
+            "first_name": self._sample("first_name"),
+            "last_name": self._sample("last_name"),
             "email": self._generate_unique_email(),
             "password": password,
             "confirm_password": password,
-            "company": self.fake.company(),
+            "company": self._sample("company"),
             "role": role,
-            "phone": self.fake.phone_number(),
+            "phone": self._sample("phone_number"),
             "terms_accepted": True,
             "newsletter_subscribed": random.choice([True, False])
         }
     
     def generate_invalid_registration_data(self, error_type="email_exists"):
         """Generate invalid registration data for testing."""
-        base_data = self.generate_registration_data()
-        
-        if error_type == "email_exists":
-            base_data["email"] = TestUsers.ADMIN["email"]
-        elif error_type == "password_mismatch":
-            base_data["confirm_password"] = "different_password"
-        elif error_type == "weak_password":
-            base_data["password"] = "weak"
-            base_data["confirm_password"] = "weak"
-        elif error_type == "invalid_email":
-            base_data["email"] = "invalid-email-format"
-        elif error_type == "missing_required":
-            base_data["email"] = ""
-            base_data["password"] = ""
+        patch = _INVALID_PATCHES.get(error_type, {})
+        # Skip generating a password the patch would overwrite anyway
+        base_data = self.generate_registration_data(password=patch.get("password"))
+        base_data.update(patch)
         
         return base_data
     
-    def _generate_unique_email(self):
-        """Generate a unique email address."""
-        while True:
-            email = self.fake.email()
-            if email not in self.used_emails:
-                self.used_emails.add(email)
-                return email
+    def _apply_role(self, user_data, role):
+        """Add role-specific permissions and the expected dashboard."""
+        permissions, dashboard = _ROLE_DEFAULTS.get(role, _ROLE_DEFAULTS["consumer"])
+        user_data["permissions"] = permissions
+        user_data["expected_dashboard"] = dashboard
+    
+    def _pool(self, provider):
+        """Return the values pre-generated for a fake data provider, building them on first use."""
+        pool = self._pools.get(provider)
+        if pool is None:
+            generate = getattr(self.fake, provider)
+            pool = self._pools[provider] = tuple(generate() for _ in range(self.POOL_SIZE))
+        return pool
+    
+    def _sample(self, provider):
+        """Pick a value for a fake data provider from its pre-generated pool."""
+        return random.choice(self._pool(provider))
+    
+    def _generate_unique_email(self, faker_email=False):
+        """
+        Generate a unique email address.
+        
+        Args:
+            faker_email (bool): Use a realistic-looking fake address, made
+                unique by prefixing the counter
+        """
+        self._email_counter += 1
+        if faker_email:
+            return f"{self._email_counter}.{self.fake.email()}"
+        return f"{self._email_prefix}_{self._email_counter}@test.local"
     
     def _generate_password(self):
         """Generate a valid password."""
         # Ensure password meets requirements: min 8 chars, uppercase, lowercase, number, special char
-        password = (
-            self.fake.password(length=12, special_chars=True, digits=True, 
-                             upper_case=True, lower_case=True)
-        )
-        return password
+        chars = [
+            random.choice(_PW_LOWER),
+            random.choice(_PW_UPPER),
+            random.choice(_PW_DIGITS),
+            random.choice(_PW_SPECIAL)
+        ] + random.choices(_PW_ALL, k=8)
+        random.shuffle(chars)
+        return "".join(chars)
 
 class TestCompanies:
     """Test company data."""
     
-    ACME_CORP = {
+    ACME_CORP = MappingProxyType({
         "name": "ACME Corp",
         "email": "contact@acmecorp.com",
         "phone": "+1-555-123-4567",
@@ -176,9 +272,9 @@ class TestCompanies:
         "subscription_plan": "Premium",
         "created_at": "2024-01-01T00:00:00Z",
         "is_active": True
-    }
+    })
     
-    TECH_SOLUTIONS = {
+    TECH_SOLUTIONS = MappingProxyType({
         "name": "Tech Solutions Inc",
         "email": "info@techsolutions.com",
         "phone": "+1-555-987-6543",
@@ -188,9 +284,9 @@ class TestCompanies:
         "subscription_plan": "Enterprise",
         "created_at": "2024-01-15T00:00:00Z",
         "is_active": True
-    }
+    })
     
-    STARTUP_CO = {
+    STARTUP_CO = MappingProxyType({
         "name": "Startup Co",
         "email": "hello@startupco.com",
         "phone": "+1-555-456-7890",
@@ -200,12 +296,14 @@ class TestCompanies:
         "subscription_plan": "Basic",
         "created_at": "2024-02-01T00:00:00Z",
         "is_active": True
-    }
+    })
 
 class TestDevices:
     """Test device data."""
     
-    SENSOR_DEVICE = {
+    # Static fixtures use fixed timestamps rather than the import time
+    
+    SENSOR_DEVICE = MappingProxyType({
         "id": "DEV_001",
         "name": "Temperature Sensor",
         "type": "sensor",
@@ -213,13 +311,13 @@ class TestDevices:
         "firmware_version": "1.2.3",
         "location": "Building A - Floor 1",
         "status": "active",
-        "last_seen": datetime.now().isoformat(),
+        "last_seen": "2024-01-01T00:00:00",
         "battery_level": 85,
         "signal_strength": -45,
         "company_id": "acme_corp"
-    }
+    })
     
-    ACTUATOR_DEVICE = {
+    ACTUATOR_DEVICE = MappingProxyType({
         "id": "DEV_002",
         "name": "Smart Valve",
         "type": "actuator",
@@ -227,13 +325,13 @@ class TestDevices:
         "firmware_version": "2.1.0",
         "location": "Building B - Floor 2",
         "status": "active",
-        "last_seen": datetime.now().isoformat(),
+        "last_seen": "2024-01-01T00:00:00",
         "battery_level": 92,
         "signal_strength": -38,
         "company_id": "acme_corp"
-    }
+    })
     
-    GATEWAY_DEVICE = {
+    GATEWAY_DEVICE = MappingProxyType({
         "id": "DEV_003",
         "name": "IoT Gateway",
         "type": "gateway",
@@ -241,13 +339,13 @@ class TestDevices:
         "firmware_version": "3.0.1",
         "location": "Data Center",
         "status": "active",
-        "last_seen": datetime.now().isoformat(),
+        "last_seen": "2024-01-01T00:00:00",
         "battery_level": None,  # Powered device
         "signal_strength": -25,
         "company_id": "acme_corp"
-    }
+    })
     
-    OFFLINE_DEVICE = {
+    OFFLINE_DEVICE = MappingProxyType({
         "id": "DEV_004",
         "name": "Offline Sensor",
         "type": "sensor",
@@ -255,106 +353,142 @@ class TestDevices:
         "firmware_version": "1.0.0",
         "location": "Building C - Floor 3",
         "status": "offline",
-        "last_seen": (datetime.now() - timedelta(hours=2)).isoformat(),
+        "last_seen": "2023-12-31T22:00:00",  # Two hours before the others
         "battery_level": 15,
         "signal_strength": None,
         "company_id": "tech_solutions"
-    }
+    })
+
+# Model name prefixes for generated devices, by device type
+_MODEL_NAMES = MappingProxyType({
+    "sensor": ("SensorPro", "SmartSense", "TempTracker", "DataCollector"),
+    "actuator": ("ActuatorX", "SmartControl", "AutoSwitch", "FlowMaster"),
+    "gateway": ("Gateway Pro", "Hub Master", "DataBridge", "ConnectPoint")
+})
+_DEFAULT_MODELS = ("Device",)
+
+# Display form of the known device types, used in generated device names
+_TITLED_TYPES = MappingProxyType({
+    device_type: device_type.title() for device_type in _MODEL_NAMES
+})
+
+# Every "<building> - <floor>" combination a generated device can be placed in
+_LOCATIONS = tuple(
+    f"{building} - {floor}"
+    for building in ("Building A", "Building B", "Building C", "Warehouse", "Data Center")
+    for floor in ("Floor 1", "Floor 2", "Floor 3", "Basement", "Rooftop")
+)
+
+# Width of each random field sliced out of a device's shared random draw;
+# wide enough that reducing it modulo a small range is effectively unbiased
+_FIELD_BITS = 20
+_FIELD_MASK = (1 << _FIELD_BITS) - 1
 
 class TestDeviceGenerator:
     """Dynamic test device generator."""
     
+    __slots__ = ("device_counter",)
+    
     def __init__(self):
-        self.fake = Faker()
         self.device_counter = 1000
     
+    @property
+    def fake(self):
+        """Fake data providers used for generated fields."""
+        return _mini_faker
+    
     def generate_device(self, device_type="sensor", status="active", company_id=None):
         """Generate a test device."""
         self.device_counter += 1
+        counter = self.device_counter
+        now, now_iso = _cached_now()
+        # One random draw feeds the firmware, battery and signal fields,
+        # each taking its own 20-bit slice
+        bits = random.getrandbits(60)
         
         device_data = {
-            "id": f"DEV_{self.device_counter}",
-            "name": f"Test {device_type.title()} {self.device_counter}",
+            "id": f"DEV_{counter}",
+            "name": f"Test {_TITLED_TYPES.get(device_type) or device_type.title()} {counter}",
             "type": device_type,
             "model": self._generate_model_name(device_type),
-            "firmware_version": self._generate_firmware_version(),
+            "firmware_version": self._generate_firmware_version(bits & _FIELD_MASK),
             "location": self._generate_location(),
             "status": status,
-            "last_seen": self._generate_last_seen(status),
-            "battery_level": self._generate_battery_level(device_type),
-            "signal_strength": self._generate_signal_strength(status),
+            "last_seen": self._generate_last_seen(status, now),
+            "battery_level": self._generate_battery_level(device_type, (bits >> _FIELD_BITS) & _FIELD_MASK),
+            "signal_strength": self._generate_signal_strength(status, bits >> 2 * _FIELD_BITS),
             "company_id": company_id or "test_company",
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
+            "created_at": now_iso,
+            "updated_at": now_iso
         }
         
         return device_data
     
     def _generate_model_name(self, device_type):
         """Generate a device model name."""
-        models = {
-            "sensor": ["SensorPro", "SmartSense", "TempTracker", "DataCollector"],
-            "actuator": ["ActuatorX", "SmartControl", "AutoSwitch", "FlowMaster"],
-            "gateway": ["Gateway Pro", "Hub Master", "DataBridge", "ConnectPoint"]
-        }
-        return f"{random.choice(models.get(device_type, ['Device']))} {random.randint(100, 999)}"
+        models = _MODEL_NAMES.get(device_type, _DEFAULT_MODELS)
+        return f"{random.choice(models)} {random.randint(100, 999)}"
     
-    def _generate_firmware_version(self):
-        """Generate a firmware version."""
-        major = random.randint(1, 5)
-        minor = random.randint(0, 9)
-        patch = random.randint(0, 9)
-        return f"{major}.{minor}.{patch}"
+    def _generate_firmware_version(self, bits=None):
+        """Generate a firmware version from random bits (drawn if not given)."""
+        if bits is None:
+            bits = random.getrandbits(_FIELD_BITS)
+        bits, major = divmod(bits, 5)
+        patch, minor = divmod(bits % 100, 10)
+        return f"{major + 1}.{minor}.{patch}"
     
     def _generate_location(self):
         """Generate a device location."""
-        buildings = ["Building A", "Building B", "Building C", "Warehouse", "Data Center"]
-        floors = ["Floor 1", "Floor 2", "Floor 3", "Basement", "Rooftop"]
-        return f"{random.choice(buildings)} - {random.choice(floors)}"
+        return random.choice(_LOCATIONS)
     
-    def _generate_last_seen(self, status):
+    def _generate_last_seen(self, status, now):
         """Generate last seen timestamp based on status."""
         if status == "active":
-            return datetime.now().isoformat()
+            return now.isoformat()
         elif status == "offline":
-            return (datetime.now() - timedelta(hours=random.randint(1, 24))).isoformat()
+            return (now - timedelta(hours=random.randint(1, 24))).isoformat()
         else:
-            return (datetime.now() - timedelta(minutes=random.randint(1, 60))).isoformat()
+            return (now - timedelta(minutes=random.randint(1, 60))).isoformat()
     
-    def _generate_battery_level(self, device_type):
+    def _generate_battery_level(self, device_type, bits=None):
         """Generate battery level (None for powered devices)."""
         if device_type == "gateway":
             return None  # Gateways are usually powered
-        return random.randint(10, 100)
+        if bits is None:
+            bits = random.getrandbits(_FIELD_BITS)
+        return 10 + bits % 91
     
-    def _generate_signal_strength(self, status):
+    def _generate_signal_strength(self, status, bits=None):
         """Generate signal strength based on status."""
         if status == "offline":
             return None
-        return random.randint(-80, -20)
+        if bits is None:
+            bits = random.getrandbits(_FIELD_BITS)
+        return -80 + bits % 61
 
 # Pre-generated test datasets
 TEST_USER_DATASETS = {
-    "valid_users": [TestUsers.ADMIN, TestUsers.COMPANY_MANAGER, TestUsers.CONSUMER],
-    "invalid_users": [TestUsers.INVALID_EMAIL, TestUsers.INVALID_PASSWORD, TestUsers.EMPTY_FIELDS],
-    "companies": [TestCompanies.ACME_CORP, TestCompanies.TECH_SOLUTIONS, TestCompanies.STARTUP_CO],
-    "devices": [TestDevices.SENSOR_DEVICE, TestDevices.ACTUATOR_DEVICE, TestDevices.GATEWAY_DEVICE, TestDevices.OFFLINE_DEVICE]
+    "valid_users": (TestUsers.ADMIN, TestUsers.COMPANY_MANAGER, TestUsers.CONSUMER),
+    "invalid_users": (TestUsers.INVALID_EMAIL, TestUsers.INVALID_PASSWORD, TestUsers.EMPTY_FIELDS),
+    "companies": (TestCompanies.ACME_CORP, TestCompanies.TECH_SOLUTIONS, TestCompanies.STARTUP_CO),
+    "devices": (TestDevices.SENSOR_DEVICE, TestDevices.ACTUATOR_DEVICE, TestDevices.GATEWAY_DEVICE, TestDevices.OFFLINE_DEVICE)
 }
 
+_ROLE_TO_USER = MappingProxyType({
+    "admin": TestUsers.ADMIN,
+    "company": TestUsers.COMPANY_MANAGER,
+    "consumer": TestUsers.CONSUMER
+})
+
 # Utility functions
 def get_user_by_role(role):
     """Get test user by role."""
-    role_mapping = {
-        "admin": TestUsers.ADMIN,
-        "company": TestUsers.COMPANY_MANAGER,
-        "consumer": TestUsers.CONSUMER
-    }
-    return role_mapping.get(role)
+    return _ROLE_TO_USER.get(role)
 
 def get_all_valid_users():
     """Get all valid test users."""
-    return [TestUsers.ADMIN, TestUsers.COMPANY_MANAGER, TestUsers.CONSUMER]
+    return TEST_USER_DATASETS["valid_users"]
 
 def get_all_invalid_users():
     """Get all invalid test users."""
-    return [TestUsers.INVALID_EMAIL, TestUsers.INVALID_PASSWORD, TestUsers.EMPTY_FIELDS]
+    return TEST_USER_DATASETS["invalid_users"]
@@ -3,6 +3,8 @@ Smoke tests for authentication functionality.
 """
 
 import pytest
+import requests
+from concurrent.futures import ThreadPoolExecutor
 from page_objects.login_page import LoginPage
 from test_data.test_users import TestUsers, get_all_valid_users, get_all_invalid_users
 from test_data.test_config import TestConfig
@@ -11,17 +13,13 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only parametrize data, built once per worker process
+VALID_USERS = get_all_valid_users()
+INVALID_USERS = get_all_invalid_users()
+
 class TestAuthenticationSmoke:
     """Smoke tests for authentication functionality."""
     
-    def setup_method(self):
-        """Setup method for each test."""
-        self.test_data = {}
-    
-    def teardown_method(self):
-        """Teardown method for each test."""
-        pass
-    
     @pytest.mark.smoke
     @pytest.mark.auth
     @pytest.mark.critical
@@ -32,14 +30,20 @@ class TestAuthenticationSmoke:
         # Navigate to login page
         assert login_page.navigate_to_login(), "Failed to navigate to login page"
         
+        # Read title, URL and element presence in one round-trip
+        page_state = login_page.probe_login_page()
+        
         # Verify page title
-        assert login_page.verify_login_page_title(), "Login page title is incorrect"
+        assert TestConfig.PAGE_TITLES["login"] in page_state["title"], \
+            f"Login page title is incorrect: {page_state['title']}"
         
         # Verify page URL
-        assert login_page.verify_login_page_url(), "Login page URL is incorrect"
+        assert "/login" in page_state["url"], f"Login page URL is incorrect: {page_state['url']}"
         
         # Verify essential elements are present
-        assert login_page.verify_login_page_elements(), "Login page elements are missing"
+        assert page_state["email_input"], "Email input field is missing"
+        assert page_state["password_input"], "Password input field is missing"
+        assert page_state["login_button"], "Login button is missing"
         
         # Take screenshot
         login_page.take_screenshot("login_page_loaded")
@@ -47,7 +51,7 @@ class TestAuthenticationSmoke:
     @pytest.mark.smoke
     @pytest.mark.auth
     @pytest.mark.critical
-    @pytest.mark.parametrize("user_data", get_all_valid_users())
+    @pytest.mark.parametrize("user_data", VALID_USERS)
     def test_valid_login_all_roles(self, driver, base_url, user_data):
         """Test login with valid credentials for all user roles."""
         login_page = LoginPage(driver)
@@ -76,79 +80,35 @@ class TestAuthenticationSmoke:
     @pytest.mark.smoke
     @pytest.mark.auth
     @pytest.mark.critical
-    def test_admin_login_specific(self, driver, base_url, admin_user):
-        """Test admin login with specific verifications."""
-        login_page = LoginPage(driver)
-        
-        # Navigate to login page
-        assert login_page.navigate_to_login(), "Failed to navigate to login page"
-        
-        # Perform admin login
-        assert login_page.quick_login(admin_user), "Admin login failed"
-        
-        # Verify admin dashboard access
-        assert login_page.is_login_successful(), "Admin login verification failed"
-        
-        # Verify URL contains admin or dashboard
-        current_url = login_page.get_current_url()
-        assert any(path in current_url for path in ["/admin", "/dashboard"]), \
-            f"Admin not redirected to correct page: {current_url}"
-        
-        # Take screenshot
-        login_page.take_screenshot("admin_login_success")
-    
-    @pytest.mark.smoke
-    @pytest.mark.auth
-    @pytest.mark.critical
-    def test_company_login_specific(self, driver, base_url, company_user):
-        """Test company user login with specific verifications."""
-        login_page = LoginPage(driver)
-        
-        # Navigate to login page
-        assert login_page.navigate_to_login(), "Failed to navigate to login page"
-        
-        # Perform company login
-        assert login_page.quick_login(company_user), "Company login failed"
-        
-        # Verify company dashboard access
-        assert login_page.is_login_successful(), "Company login verification failed"
-        
-        # Verify URL contains company or dashboard
-        current_url = login_page.get_current_url()
-        assert any(path in current_url for path in ["/company", "/dashboard"]), \
-            f"Company user not redirected to correct page: {current_url}"
-        
-        # Take screenshot
-        login_page.take_screenshot("company_login_success")
-    
-    @pytest.mark.smoke
-    @pytest.mark.auth
-    @pytest.mark.critical
-    def test_consumer_login_specific(self, driver, base_url, consumer_user):
-        """Test consumer user login with specific verifications."""
+    @pytest.mark.parametrize("user_fixture", ["admin_user", "company_user", "consumer_user"],
+                             ids=["admin", "company", "consumer"])
+    def test_role_login_specific(self, request, driver, base_url, user_fixture):
+        """Test each role's login with role-specific verifications."""
+        user = request.getfixturevalue(user_fixture)
+        role = user["role"]
         login_page = LoginPage(driver)
         
         # Navigate to login page
         assert login_page.navigate_to_login(), "Failed to navigate to login page"
         
-        # Perform consumer login
-        assert login_page.quick_login(consumer_user), "Consumer login failed"
+        # Perform login
+        assert login_page.quick_login(user), f"{role.title()} login failed"
         
-        # Verify consumer dashboard access
-        assert login_page.is_login_successful(), "Consumer login verification failed"
+        # Verify role dashboard access
+        assert login_page.is_login_successful(), f"{role.title()} login verification failed"
         
-        # Verify URL contains consumer or dashboard
+        # Verify URL is in the role area or dashboard
         current_url = login_page.get_current_url()
-        assert any(path in current_url for path in ["/consumer", "/dashboard"]), \
-            f"Consumer user not redirected to correct page: {current_url}"
+        assert LoginPage.ROLE_REDIRECT_PATTERNS[role].search(current_url), \
+            f"{role.title()} user not redirected to correct page: {current_url}"
         
         # Take screenshot
-        login_page.take_screenshot("consumer_login_success")
+        login_page.take_screenshot(f"{role}_login_success")
     
     @pytest.mark.smoke
     @pytest.mark.auth
     @pytest.mark.high
-    @pytest.mark.parametrize("invalid_user", get_all_invalid_users())
+    @pytest.mark.parametrize("invalid_user", INVALID_USERS)
     def test_invalid_login_attempts(self, driver, base_url, invalid_user):
         """Test login with invalid credentials."""
         login_page = LoginPage(driver)
@@ -160,18 +120,19 @@ class TestAuthenticationSmoke:
         assert not login_page.login(invalid_user["email"], invalid_user["password"]), \
             "Login should fail with invalid credentials"
         
+        # Read the error message and URL together
+        failure_state = login_page.login_failure_state()
+        
         # Verify error message is present
-        assert login_page.is_error_present(), \
-            "Error message not displayed for invalid credentials"
+        error_message = failure_state["error_text"]
+        assert error_message, "Error message not displayed for invalid credentials"
         
         # Verify specific error message
-        error_message = login_page.get_error_message()
-        assert error_message is not None, "Error message is None"
         assert "invalid" in error_message.lower() or "credentials" in error_message.lower(), \
             f"Unexpected error message: {error_message}"
         
         # Verify still on login page
-        assert login_page.verify_login_page_url(), "Should remain on login page after failed login"
+        assert "/login" in failure_state["url"], "Should remain on login page after failed login"
         
         # Take screenshot
         login_page.take_screenshot("invalid_login_attempt")
@@ -286,19 +247,15 @@ class TestAuthenticationSmoke:
         # Navigate to login page
         assert login_page.navigate_to_login(), "Failed to navigate to login page"
         
-        # Enter some data
-        login_page.enter_email("test@example.com")
-        login_page.enter_password("testpassword")
-        
-        # Verify data is entered
-        assert login_page.get_email_field_value() == "test@example.com", "Email not entered correctly"
-        
-        # Clear form
-        assert login_page.clear_login_form(), "Failed to clear login form"
+        # Enter some data and verify it was entered (one round-trip)
+        form_state = login_page.fill_login_form("test@example.com", "testpassword")
+        assert form_state is not None, "Login form fields not found"
+        assert form_state["email"] == "test@example.com", "Email not entered correctly"
         
-        # Verify form is cleared
-        assert login_page.get_email_field_value() == "", "Email field not cleared"
-        assert login_page.get_password_field_value() == "", "Password field not cleared"
+        # Clear form and verify it is cleared (one round-trip)
+        form_state = login_page.fill_login_form("", "")
+        assert form_state["email"] == "", "Email field not cleared"
+        assert form_state["password"] == "", "Password field not cleared"
         
         # Take screenshot
         login_page.take_screenshot("login_form_clearing")
@@ -314,7 +271,7 @@ class TestAuthenticationSmoke:
         assert login_page.navigate_to_login(), "Failed to navigate to login page"
         
         # Verify remember me checkbox is present
-        if login_page.is_element_present(login_page.REMEMBER_ME_CHECKBOX):
+        if login_page.probe_login_page()["remember_me"]:
             # Test checkbox toggle
             initial_state = login_page.is_remember_me_checked()
             login_page.toggle_remember_me()
@@ -339,7 +296,7 @@ class TestAuthenticationSmoke:
         assert login_page.navigate_to_login(), "Failed to navigate to login page"
         
         # Check if forgot password link is present
-        if login_page.is_element_present(login_page.FORGOT_PASSWORD_LINK):
+        if login_page.probe_login_page()["forgot_password_link"]:
             # Click forgot password link
             assert login_page.click_forgot_password_link(), "Failed to click forgot password link"
             
@@ -365,7 +322,7 @@ class TestAuthenticationSmoke:
         assert login_page.navigate_to_login(), "Failed to navigate to login page"
         
         # Check if register link is present
-        if login_page.is_element_present(login_page.REGISTER_LINK):
+        if login_page.probe_login_page()["register_link"]:
             # Click register link
             assert login_page.click_register_link(), "Failed to click register link"
             
@@ -402,13 +359,14 @@ class TestAuthenticationSmoke:
     @pytest.mark.smoke
     @pytest.mark.auth
     @pytest.mark.critical
-    def test_logout_functionality(self, driver, base_url, admin_user):
+    def test_logout_functionality(self, driver, base_url, login_admin):
         """Test logout functionality."""
         login_page = LoginPage(driver)
         
-        # Navigate to login page and login
-        assert login_page.navigate_to_login(), "Failed to navigate to login page"
-        assert login_page.quick_login(admin_user), "Admin login failed"
+        # Start from the cached admin session (the logout API is stateless, so
+        # logging out does not invalidate it for later tests) and open the
+        # admin area, whose layout renders the logout button
+        assert login_page.navigate_to("/admin"), "Failed to navigate to admin area"
         assert login_page.is_login_successful(), "Login verification failed"
         
         # Perform logout
@@ -425,15 +383,10 @@ class TestAuthenticationSmoke:
     @pytest.mark.smoke
     @pytest.mark.auth
     @pytest.mark.high
-    def test_session_timeout_handling(self, driver, base_url, admin_user):
+    def test_session_timeout_handling(self, driver, base_url, login_admin):
         """Test session timeout handling."""
         login_page = LoginPage(driver)
         
-        # Navigate to login page and login
-        assert login_page.navigate_to_login(), "Failed to navigate to login page"
-        assert login_page.quick_login(admin_user), "Admin login failed"
-        assert login_page.is_login_successful(), "Login verification failed"
-        
         # Clear session manually to simulate timeout
         login_page.clear_browser_cache()
         
@@ -441,9 +394,8 @@ class TestAuthenticationSmoke:
         login_page.navigate_to("/dashboard")
         
         # Should be redirected to login page
-        current_url = login_page.get_current_url()
-        assert "/login" in current_url or login_page.is_element_present(login_page.LOGIN_BUTTON), \
-            f"Not redirected to login page after session timeout: {current_url}"
+        assert login_page.is_redirected_to_login(), \
+            f"Not redirected to login page after session timeout: {login_page.get_current_url()}"
         
         # Take screenshot
         login_page.take_screenshot("session_timeout_handling")
@@ -493,38 +445,26 @@ class TestAuthenticationSmoke:
     @pytest.mark.smoke
     @pytest.mark.auth
     @pytest.mark.critical
-    def test_concurrent_login_attempts(self, driver, base_url, admin_user):
+    def test_concurrent_login_attempts(self, driver, api_base_url, admin_user, login_admin):
         """Test handling of concurrent login attempts."""
         login_page = LoginPage(driver)
         
-        # Navigate to login page
-        assert login_page.navigate_to_login(), "Failed to navigate to login page"
-        
-        # Perform first login
-        assert login_page.quick_login(admin_user), "First login failed"
-        assert login_page.is_login_successful(), "First login verification failed"
-        
-        # Open new tab and try to login again
-        original_window = login_page.get_current_window_handle()
-        
-        # Open new tab
-        login_page.execute_javascript("window.open('');")
-        new_window = login_page.switch_to_new_window()
-        
-        # Navigate to login page in new tab
-        assert login_page.navigate_to_login(), "Failed to navigate to login page in new tab"
-        
-        # Try to login again
-        login_page.quick_login(admin_user)
-        
-        # Should handle concurrent login gracefully
-        current_url = login_page.get_current_url()
-        assert "/dashboard" in current_url or "/login" in current_url, \
-            f"Unexpected behavior with concurrent login: {current_url}"
-        
-        # Close new tab and switch back
-        login_page.close_current_window()
-        login_page.switch_to_window(original_window)
+        # The browser session from login_admin stays open while two more logins
+        # for the same user hit the API at once; the browser adds nothing to
+        # exercising the backend's session handling
+        login_url = f"{api_base_url}{TestConfig.API_ENDPOINTS['auth']['login']}"
+        credentials = {"email": admin_user["email"], "password": admin_user["password"]}
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            responses = list(executor.map(
+                lambda _: requests.post(login_url, json=credentials, timeout=10), range(2)
+            ))
+        
+        # Should handle concurrent login gracefully, giving each login its own session
+        assert all(response.status_code == 200 for response in responses), \
+            f"Unexpected behavior with concurrent login: {[response.status_code for response in responses]}"
+        session_ids = {response.json().get("sessionId") for response in responses}
+        assert None not in session_ids and len(session_ids) == 2, \
+            f"Concurrent logins did not get separate sessions: {session_ids}"
         
         # Take screenshot
         login_page.take_screenshot("concurrent_login_attempts")
@@ -3,11 +3,12 @@ Smoke tests for dashboard functionality.
 """
 
 import pytest
+import time
+from types import MappingProxyType
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException, JavascriptException
 from page_objects.login_page import LoginPage
 from page_objects.base_page import BasePage
-from test_data.test_users import TestUsers
-from test_data.test_config import TestConfig
 from utilities.helpers import ReportHelpers
 import logging
 
@@ -23,33 +24,45 @@ class DashboardPage(BasePage):
     # Navigation sidebar locators
     SIDEBAR = (By.CLASS_NAME, "sidebar")
     SIDEBAR_MENU = (By.CLASS_NAME, "sidebar-menu")
-    DASHBOARD_LINK = (By.XPATH, "//a[contains(text(), 'Dashboard')]")
-    DEVICES_LINK = (By.XPATH, "//a[contains(text(), 'Devices')]")
-    ANALYTICS_LINK = (By.XPATH, "//a[contains(text(), 'Analytics')]")
-    USERS_LINK = (By.XPATH, "//a[contains(text(), 'Users')]")
-    SETTINGS_LINK = (By.XPATH, "//a[contains(text(), 'Settings')]")
-    SECURITY_LINK = (By.XPATH, "//a[contains(text(), 'Security')]")
+    # Locators use the data-testid attributes the app renders for tests
+    # (src/app/page.tsx, src/components/layout/Sidebar.tsx); the desktop
+    # sidebar links are "nav-*", the collapsed mobile menu's are "mobile-nav-*"
+    DASHBOARD_LINK = (By.CSS_SELECTOR, "a[data-testid='nav-dashboard']")
+    DEVICES_LINK = (By.CSS_SELECTOR, "a[data-testid='nav-devices']")
+    ANALYTICS_LINK = (By.CSS_SELECTOR, "a[data-testid='nav-analytics']")
+    USERS_LINK = (By.CSS_SELECTOR, "a[data-testid='nav-users']")
+    SETTINGS_LINK = (By.CSS_SELECTOR, "a[data-testid='nav-settings']")
+    SECURITY_LINK = (By.CSS_SELECTOR, "a[data-testid='nav-security']")
+    _LINK_LOCATORS = MappingProxyType({
+        "Dashboard": DASHBOARD_LINK,
+        "Devices": DEVICES_LINK,
+        "Analytics": ANALYTICS_LINK,
+        "Users": USERS_LINK,
+        "Settings": SETTINGS_LINK,
+        "Security": SECURITY_LINK
+    })
+    NAV_LINK_NAMES = tuple(_LINK_LOCATORS)
     
     # Main content locators
     MAIN_CONTENT = (By.TAG_NAME, "main")
-    WELCOME_HEADER = (By.XPATH, "//h1[contains(text(), 'Welcome')]")
+    WELCOME_HEADER = (By.CSS_SELECTOR, "[data-testid='welcome-header']")
     DASHBOARD_STATS = (By.CLASS_NAME, "dashboard-stats")
-    STAT_CARD = (By.CLASS_NAME, "stat-card")
+    STAT_CARD = (By.CSS_SELECTOR, ".stat-card")
     
     # Demo credentials section
-    DEMO_CREDENTIALS = (By.XPATH, "//h2[contains(text(), 'Demo Credentials')]")
-    ADMIN_CARD = (By.XPATH, "//h3[contains(text(), 'Admin Account')]")
-    COMPANY_CARD = (By.XPATH, "//h3[contains(text(), 'Company Account')]")
-    CONSUMER_CARD = (By.XPATH, "//h3[contains(text(), 'Consumer Account')]")
+    DEMO_CREDENTIALS = (By.CSS_SELECTOR, "[data-testid='demo-credentials']")
+    ADMIN_CARD = (By.CSS_SELECTOR, "[data-testid='demo-card-admin']")
+    COMPANY_CARD = (By.CSS_SELECTOR, "[data-testid='demo-card-company']")
+    CONSUMER_CARD = (By.CSS_SELECTOR, "[data-testid='demo-card-consumer']")
     
     # API status section
-    API_STATUS = (By.XPATH, "//h2[contains(text(), 'API Status') or contains(text(), 'Dummy API Status')]")
-    API_ENDPOINT = (By.XPATH, "//span[contains(text(), 'Login') or contains(text(), 'Register')]")
+    API_STATUS = (By.CSS_SELECTOR, "[data-testid='api-status']")
+    API_ENDPOINT = (By.CSS_SELECTOR, "[data-testid='api-endpoint']")
     
     # Authentication demo section
-    AUTH_STATUS = (By.XPATH, "//dt[contains(text(), 'Authentication Status')]")
-    TRY_LOGIN_BUTTON = (By.XPATH, "//a[contains(text(), 'Try Login')]")
-    REGISTER_BUTTON = (By.XPATH, "//a[contains(text(), 'Register')]")
+    AUTH_STATUS = (By.CSS_SELECTOR, "[data-testid='auth-status']")
+    TRY_LOGIN_BUTTON = (By.CSS_SELECTOR, "a[data-testid='try-login']")
+    REGISTER_BUTTON = (By.CSS_SELECTOR, "a[data-testid='demo-register']")
     
     def navigate_to_dashboard(self):
         """Navigate to dashboard page."""
@@ -65,48 +78,79 @@ class DashboardPage(BasePage):
     
     def get_welcome_message(self):
         """Get welcome message text."""
-        return self.get_element_text(self.WELCOME_HEADER)
-    
-    def get_navigation_links(self):
-        """Get all navigation links."""
-        nav_links = [
-            (self.DASHBOARD_LINK, "Dashboard"),
-            (self.DEVICES_LINK, "Devices"),
-            (self.ANALYTICS_LINK, "Analytics"),
-            (self.USERS_LINK, "Users"),
-            (self.SETTINGS_LINK, "Settings"),
-            (self.SECURITY_LINK, "Security")
-        ]
-        
+        try:
+            return self.on_cached_element(self.WELCOME_HEADER, lambda header: header.text)
+        except TimeoutException:
+            logger.error(f"Element not found: {self.WELCOME_HEADER}")
+            return None
+    
+    def get_navigation_links(self, timeout=5):
+        """Get all navigation links, reading every link text in one script call per poll."""
         available_links = []
-        for locator, name in nav_links:
-            if self.is_element_present(locator):
-                available_links.append(name)
         
+        def all_links_rendered(driver):
+            link_texts = driver.execute_script(
+                "return Array.from(document.querySelectorAll(\"a[data-testid^='nav-']\"), a => a.textContent.trim());"
+            )
+            available_links[:] = [name for name in self.NAV_LINK_NAMES
+                                  if any(name in text for text in link_texts)]
+            return len(available_links) == len(self.NAV_LINK_NAMES)
+        
+        try:
+            self._get_wait(timeout).until(all_links_rendered)
+        except TimeoutException:
+            pass
         return available_links
     
     def click_navigation_link(self, link_name):
         """Click a navigation link."""
-        link_locators = {
-            "Dashboard": self.DASHBOARD_LINK,
-            "Devices": self.DEVICES_LINK,
-            "Analytics": self.ANALYTICS_LINK,
-            "Users": self.USERS_LINK,
-            "Settings": self.SETTINGS_LINK,
-            "Security": self.SECURITY_LINK
-        }
-        
-        if link_name in link_locators:
-            return self.click_element(link_locators[link_name])
-        return False
+        locator = self._LINK_LOCATORS.get(link_name)
+        if locator is None:
+            return False
+        
+        # Following a link replaces the page, so drop any cached elements
+        self._element_cache.clear()
+        return self.click_element(locator)
+    
+    def count_elements(self, locator):
+        """Count elements matching a CSS selector locator without fetching them."""
+        try:
+            return self.driver.execute_script(
+                "return document.querySelectorAll(arguments[0]).length;", locator[1]
+            )
+        except JavascriptException:
+            return 0
+    
+    def is_any_element_present(self, locators):
+        """Check whether any of several CSS selector locators matches, in one script call."""
+        selector = ", ".join(locator[1] for locator in locators)
+        return self.driver.execute_script("return document.querySelector(arguments[0]) !== null;", selector)
     
     def get_stat_cards_count(self):
         """Get number of stat cards."""
+        return self.count_elements(self.STAT_CARD)
+    
+    def check_sections(self, sections, timeout=5):
+        """
+        Check which page sections are rendered, in one script call per poll.
+        
+        Args:
+            sections: dict mapping a section name to its locator
+            
+        Returns:
+            dict: section name -> whether the section is present
+        """
+        present = {}
+        
+        def all_sections_present(driver):
+            present.update(self.helpers.are_elements_present(sections))
+            return all(present.values())
+        
         try:
-            stat_cards = self.driver.find_elements(*self.STAT_CARD)
-            return len(stat_cards)
-        except:
-            return 0
+            self._get_wait(timeout).until(all_sections_present)
+        except TimeoutException:
+            pass
+        return present
     
     def verify_demo_credentials_section(self):
         """Verify demo credentials section is present."""
@@ -118,33 +162,23 @@ class DashboardPage(BasePage):
     
     def get_api_endpoints_count(self):
         """Get number of API endpoints displayed."""
-        try:
-            endpoints = self.driver.find_elements(*self.API_ENDPOINT)
-            return len(endpoints)
-        except:
-            return 0
+        return self.count_elements(self.API_ENDPOINT)
+
+@pytest.fixture
+def dashboard_page(driver):
+    """Fixture to provide a DashboardPage already loaded on the home page."""
+    dashboard_page = DashboardPage(driver)
+    assert dashboard_page.navigate_to("/"), "Failed to navigate to home page"
+    return dashboard_page
 
 class TestDashboardSmoke:
     """Smoke tests for dashboard functionality."""
     
-    def setup_method(self):
-        """Setup method for each test."""
-        self.test_data = {}
-    
-    def teardown_method(self):
-        """Teardown method for each test."""
-        pass
-    
     @pytest.mark.smoke
     @pytest.mark.dashboard
     @pytest.mark.critical
-    def test_home_page_loads(self, driver, base_url):
+    def test_home_page_loads(self, dashboard_page):
         """Test that home page loads correctly."""
-        dashboard_page = DashboardPage(driver)
-        
-        # Navigate to home page
-        assert dashboard_page.navigate_to("/"), "Failed to navigate to home page"
-        
         # Verify page title
         page_title = dashboard_page.get_page_title()
         assert "IoT Platform" in page_title, f"Unexpected page title: {page_title}"
@@ -163,13 +197,8 @@ class TestDashboardSmoke:
     @pytest.mark.smoke
     @pytest.mark.dashboard
     @pytest.mark.critical
-    def test_sidebar_navigation_present(self, driver, base_url):
+    def test_sidebar_navigation_present(self, dashboard_page):
         """Test that sidebar navigation is present and functional."""
-        dashboard_page = DashboardPage(driver)
-        
-        # Navigate to home page
-        assert dashboard_page.navigate_to("/"), "Failed to navigate to home page"
-        
         # Verify sidebar is visible
         assert dashboard_page.is_sidebar_visible(), "Sidebar is not visible"
         
@@ -186,51 +215,33 @@ class TestDashboardSmoke:
     @pytest.mark.smoke
     @pytest.mark.dashboard
     @pytest.mark.critical
-    def test_navigation_links_functionality(self, driver, base_url):
+    @pytest.mark.parametrize("link_name", ["Devices", "Analytics", "Users", "Settings", "Security"])
+    def test_navigation_links_functionality(self, dashboard_page, link_name):
         """Test that navigation links work correctly."""
-        dashboard_page = DashboardPage(driver)
-        
-        # Navigate to home page
-        assert dashboard_page.navigate_to("/"), "Failed to navigate to home page"
+        # Click the link
+        assert dashboard_page.click_navigation_link(link_name), f"Failed to click {link_name} link"
         
-        # Test each navigation link
-        navigation_links = ["Devices", "Analytics", "Users", "Settings", "Security"]
-        
-        for link_name in navigation_links:
-            # Click the link
-            assert dashboard_page.click_navigation_link(link_name), f"Failed to click {link_name} link"
-            
-            # Wait for page to load
-            dashboard_page.wait_for_page_load()
-            
-            # Verify redirect to login page (since these are protected routes)
-            current_url = dashboard_page.get_current_url()
-            assert "/login" in current_url, f"Expected redirect to login page after clicking {link_name}, got: {current_url}"
-            
-            # Go back to home page
-            dashboard_page.navigate_to("/")
-            dashboard_page.wait_for_page_load()
+        # Verify redirect to login page (since these are protected routes)
+        assert dashboard_page.wait_for_url_contains("/login", timeout=5), \
+            f"Expected redirect to login page after clicking {link_name}, got: {dashboard_page.get_current_url()}"
         
         # Take screenshot
-        dashboard_page.take_screenshot("navigation_links_functionality")
+        dashboard_page.take_screenshot(f"navigation_link_{link_name.lower()}")
     
     @pytest.mark.smoke
     @pytest.mark.dashboard
     @pytest.mark.critical
-    def test_demo_credentials_section(self, driver, base_url):
+    def test_demo_credentials_section(self, dashboard_page):
         """Test that demo credentials section is present and displays correctly."""
-        dashboard_page = DashboardPage(driver)
-        
-        # Navigate to home page
-        assert dashboard_page.navigate_to("/"), "Failed to navigate to home page"
-        
-        # Verify demo credentials section is present
-        assert dashboard_page.verify_demo_credentials_section(), "Demo credentials section not found"
-        
-        # Verify all user type cards are present
-        assert dashboard_page.is_element_present(dashboard_page.ADMIN_CARD), "Admin card not found"
-        assert dashboard_page.is_element_present(dashboard_page.COMPANY_CARD), "Company card not found"
-        assert dashboard_page.is_element_present(dashboard_page.CONSUMER_CARD), "Consumer card not found"
+        # Verify demo credentials section and all user type cards are present
+        sections = dashboard_page.check_sections({
+            "Demo credentials section": dashboard_page.DEMO_CREDENTIALS,
+            "Admin card": dashboard_page.ADMIN_CARD,
+            "Company card": dashboard_page.COMPANY_CARD,
+            "Consumer card": dashboard_page.CONSUMER_CARD
+        })
+        for name, present in sections.items():
+            assert present, f"{name} not found"
         
         # Take screenshot
         dashboard_page.take_screenshot("demo_credentials_section")
@@ -238,13 +249,8 @@ class TestDashboardSmoke:
     @pytest.mark.smoke
     @pytest.mark.dashboard
     @pytest.mark.critical
-    def test_api_status_section(self, driver, base_url):
+    def test_api_status_section(self, dashboard_page):
         """Test that API status section is present and displays correctly."""
-        dashboard_page = DashboardPage(driver)
-        
-        # Navigate to home page
-        assert dashboard_page.navigate_to("/"), "Failed to navigate to home page"
-        
         # Verify API status section is present
         assert dashboard_page.verify_api_status_section(), "API status section not found"
         
@@ -258,21 +264,16 @@ class TestDashboardSmoke:
     @pytest.mark.smoke
     @pytest.mark.dashboard
     @pytest.mark.critical
-    def test_authentication_demo_section(self, driver, base_url):
+    def test_authentication_demo_section(self, dashboard_page):
         """Test that authentication demo section is present."""
-        dashboard_page = DashboardPage(driver)
-        
-        # Navigate to home page
-        assert dashboard_page.navigate_to("/"), "Failed to navigate to home page"
-        
-        # Verify authentication status is present
-        assert dashboard_page.is_element_present(dashboard_page.AUTH_STATUS), "Authentication status not found"
-        
-        # Verify Try Login button is present
-        assert dashboard_page.is_element_present(dashboard_page.TRY_LOGIN_BUTTON), "Try Login button not found"
-        
-        # Verify Register button is present
-        assert dashboard_page.is_element_present(dashboard_page.REGISTER_BUTTON), "Register button not found"
+        # Verify authentication status, Try Login button and Register button are present
+        sections = dashboard_page.check_sections({
+            "Authentication status": dashboard_page.AUTH_STATUS,
+            "Try Login button": dashboard_page.TRY_LOGIN_BUTTON,
+            "Register button": dashboard_page.REGISTER_BUTTON
+        })
+        for name, present in sections.items():
+            assert present, f"{name} not found"
         
         # Take screenshot
         dashboard_page.take_screenshot("authentication_demo_section")
@@ -280,20 +281,14 @@ class TestDashboardSmoke:
     @pytest.mark.smoke
     @pytest.mark.dashboard
     @pytest.mark.high
-    def test_try_login_button_functionality(self, driver, base_url):
+    def test_try_login_button_functionality(self, driver, dashboard_page):
         """Test that Try Login button redirects to login page."""
-        dashboard_page = DashboardPage(driver)
-        
-        # Navigate to home page
-        assert dashboard_page.navigate_to("/"), "Failed to navigate to home page"
-        
         # Click Try Login button
         assert dashboard_page.click_element(dashboard_page.TRY_LOGIN_BUTTON), "Failed to click Try Login button"
         
         # Verify redirect to login page
-        dashboard_page.wait_for_page_load()
-        current_url = dashboard_page.get_current_url()
-        assert "/login" in current_url, f"Expected redirect to login page, got: {current_url}"
+        assert dashboard_page.wait_for_url_contains("/login", timeout=5), \
+            f"Expected redirect to login page, got: {dashboard_page.get_current_url()}"
         
         # Verify login page elements are present
         login_page = LoginPage(driver)
@@ -305,20 +300,14 @@ class TestDashboardSmoke:
     @pytest.mark.smoke
     @pytest.mark.dashboard
     @pytest.mark.high
-    def test_register_button_functionality(self, driver, base_url):
+    def test_register_button_functionality(self, dashboard_page):
         """Test that Register button redirects to register page."""
-        dashboard_page = DashboardPage(driver)
-        
-        # Navigate to home page
-        assert dashboard_page.navigate_to("/"), "Failed to navigate to home page"
-        
         # Click Register button
         assert dashboard_page.click_element(dashboard_page.REGISTER_BUTTON), "Failed to click Register button"
         
         # Verify redirect to register page
-        dashboard_page.wait_for_page_load()
-        current_url = dashboard_page.get_current_url()
-        assert "/register" in current_url, f"Expected redirect to register page, got: {current_url}"
+        assert dashboard_page.wait_for_url_contains("/register", timeout=5), \
+            f"Expected redirect to register page, got: {dashboard_page.get_current_url()}"
         
         # Take screenshot
         dashboard_page.take_screenshot("register_button_functionality")
@@ -326,20 +315,16 @@ class TestDashboardSmoke:
     @pytest.mark.smoke
     @pytest.mark.dashboard
     @pytest.mark.high
-    def test_dashboard_after_admin_login(self, driver, base_url, admin_user):
+    def test_dashboard_after_admin_login(self, driver, login_admin):
         """Test dashboard access after admin login."""
-        login_page = LoginPage(driver)
         dashboard_page = DashboardPage(driver)
         
-        # Login as admin
-        assert login_page.navigate_to_login(), "Failed to navigate to login page"
-        assert login_page.quick_login(admin_user), "Admin login failed"
-        assert login_page.is_login_successful(), "Admin login verification failed"
+        # The admin session is restored from the cached login; open the role's area
+        assert dashboard_page.navigate_to("/admin"), "Failed to navigate to admin area"
         
-        # Verify dashboard/admin page is accessible
-        current_url = dashboard_page.get_current_url()
-        assert any(path in current_url for path in ["/dashboard", "/admin"]), \
-            f"Admin not redirected to dashboard/admin: {current_url}"
+        # Verify dashboard/admin page is accessible; a rejected session redirects to /login
+        assert dashboard_page.wait_for_url_matches(LoginPage.ROLE_REDIRECT_PATTERNS["admin"]), \
+            f"Admin not redirected to dashboard/admin: {dashboard_page.get_current_url()}"
         
         # Take screenshot
         dashboard_page.take_screenshot("dashboard_after_admin_login")
@@ -347,20 +332,16 @@ class TestDashboardSmoke:
     @pytest.mark.smoke
     @pytest.mark.dashboard
     @pytest.mark.high
-    def test_dashboard_after_company_login(self, driver, base_url, company_user):
+    def test_dashboard_after_company_login(self, driver, login_company):
         """Test dashboard access after company login."""
-        login_page = LoginPage(driver)
         dashboard_page = DashboardPage(driver)
         
-        # Login as company user
-        assert login_page.navigate_to_login(), "Failed to navigate to login page"
-        assert login_page.quick_login(company_user), "Company login failed"
-        assert login_page.is_login_successful(), "Company login verification failed"
+        # The company user session is restored from the cached login; open the role's area
+        assert dashboard_page.navigate_to("/company"), "Failed to navigate to company area"
         
-        # Verify dashboard/company page is accessible
-        current_url = dashboard_page.get_current_url()
-        assert any(path in current_url for path in ["/dashboard", "/company"]), \
-            f"Company user not redirected to dashboard/company: {current_url}"
+        # Verify dashboard/company page is accessible; a rejected session redirects to /login
+        assert dashboard_page.wait_for_url_matches(LoginPage.ROLE_REDIRECT_PATTERNS["company"]), \
+            f"Company user not redirected to dashboard/company: {dashboard_page.get_current_url()}"
         
         # Take screenshot
         dashboard_page.take_screenshot("dashboard_after_company_login")
@@ -368,20 +349,16 @@ class TestDashboardSmoke:
     @pytest.mark.smoke
     @pytest.mark.dashboard
     @pytest.mark.high
-    def test_dashboard_after_consumer_login(self, driver, base_url, consumer_user):
+    def test_dashboard_after_consumer_login(self, driver, login_consumer):
         """Test dashboard access after consumer login."""
-        login_page = LoginPage(driver)
         dashboard_page = DashboardPage(driver)
         
-        # Login as consumer user
-        assert login_page.navigate_to_login(), "Failed to navigate to login page"
-        assert login_page.quick_login(consumer_user), "Consumer login failed"
-        assert login_page.is_login_successful(), "Consumer login verification failed"
+        # The consumer user session is restored from the cached login; open the role's area
+        assert dashboard_page.navigate_to("/consumer"), "Failed to navigate to consumer area"
         
-        # Verify dashboard/consumer page is accessible
-        current_url = dashboard_page.get_current_url()
-        assert any(path in current_url for path in ["/dashboard", "/consumer"]), \
-            f"Consumer user not redirected to dashboard/consumer: {current_url}"
+        # Verify dashboard/consumer page is accessible; a rejected session redirects to /login
+        assert dashboard_page.wait_for_url_matches(LoginPage.ROLE_REDIRECT_PATTERNS["consumer"]), \
+            f"Consumer user not redirected to dashboard/consumer: {dashboard_page.get_current_url()}"
         
         # Take screenshot
         dashboard_page.take_screenshot("dashboard_after_consumer_login")
@@ -389,62 +366,27 @@ class TestDashboardSmoke:
     @pytest.mark.smoke
     @pytest.mark.dashboard
     @pytest.mark.medium
-    def test_responsive_design_desktop(self, driver, base_url):
-        """Test responsive design on desktop viewport."""
-        dashboard_page = DashboardPage(driver)
-        
-        # Set desktop viewport
-        driver.set_window_size(1920, 1080)
-        
-        # Navigate to home page
-        assert dashboard_page.navigate_to("/"), "Failed to navigate to home page"
+    @pytest.mark.parametrize("viewport, width, height", [
+        ("desktop", 1920, 1080),
+        ("tablet", 768, 1024),
+        ("mobile", 375, 667)
+    ], ids=["desktop", "tablet", "mobile"])
+    def test_responsive_design(self, request, dashboard_page, viewport, width, height):
+        """Test responsive design on desktop, tablet and mobile viewports."""
+        # Resize the loaded home page; the layout reflows without reloading.
+        # Reset at teardown so a failure screenshot still shows this viewport
+        dashboard_page.set_viewport_size(width, height)
+        request.addfinalizer(dashboard_page.reset_viewport_size)
         
         # Verify sidebar is visible on desktop
-        assert dashboard_page.is_sidebar_visible(), "Sidebar should be visible on desktop"
-        
-        # Verify main content is visible
-        assert dashboard_page.is_main_content_visible(), "Main content should be visible on desktop"
-        
-        # Take screenshot
-        dashboard_page.take_screenshot("responsive_design_desktop")
-    
-    @pytest.mark.smoke
-    @pytest.mark.dashboard
-    @pytest.mark.medium
-    def test_responsive_design_tablet(self, driver, base_url):
-        """Test responsive design on tablet viewport."""
-        dashboard_page = DashboardPage(driver)
-        
-        # Set tablet viewport
-        driver.set_window_size(768, 1024)
-        
-        # Navigate to home page
-        assert dashboard_page.navigate_to("/"), "Failed to navigate to home page"
-        
-        # Verify page loads correctly on tablet
-        assert dashboard_page.is_main_content_visible(), "Main content should be visible on tablet"
-        
-        # Take screenshot
-        dashboard_page.take_screenshot("responsive_design_tablet")
-    
-    @pytest.mark.smoke
-    @pytest.mark.dashboard
-    @pytest.mark.medium
-    def test_responsive_design_mobile(self, driver, base_url):
-        """Test responsive design on mobile viewport."""
-        dashboard_page = DashboardPage(driver)
-        
-        # Set mobile viewport
-        driver.set_window_size(375, 667)
+        if viewport == "desktop":
+            assert dashboard_page.is_sidebar_visible(), "Sidebar should be visible on desktop"
         
-        # Navigate to home page
-        assert dashboard_page.navigate_to("/"), "Failed to navigate to home page"
-        
-        # Verify page loads correctly on mobile
-        assert dashboard_page.is_main_content_visible(), "Main content should be visible on mobile"
+        # Verify page loads correctly on this viewport
+        assert dashboard_page.is_main_content_visible(), f"Main content should be visible on {viewport}"
         
         # Take screenshot
-        dashboard_page.take_screenshot("responsive_design_mobile")
+        dashboard_page.take_screenshot(f"responsive_design_{viewport}")
     
     @pytest.mark.smoke
     @pytest.mark.dashboard
@@ -453,22 +395,27 @@ class TestDashboardSmoke:
         """Test page load performance."""
         dashboard_page = DashboardPage(driver)
         
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Navigate to home page
         assert dashboard_page.navigate_to("/"), "Failed to navigate to home page"
         
-        # Wait for page to be fully loaded
-        dashboard_page.wait_for_page_load()
-        
-        end_time = time.time()
-        load_time = end_time - start_time
+        # Wait for the load event and read the browser's own timings, which
+        # leave out WebDriver round-trips
+        timing = dashboard_page.get_navigation_timing()
+        wall_time = time.perf_counter() - start_time
+        assert timing is not None, "Page did not finish loading"
         
         # Verify page loads within acceptable time (10 seconds)
+        load_time = timing["load"] / 1000
         assert load_time < 10, f"Page load time too slow: {load_time:.2f} seconds"
         
-        ReportHelpers.log_test_step("Page load performance", "PASS", f"Load time: {load_time:.2f} seconds")
+        ReportHelpers.log_test_step(
+            "Page load performance", "PASS",
+            f"Load time: {load_time:.2f} seconds",
+            f"DOMContentLoaded: {timing['dom_content_loaded'] / 1000:.2f} seconds",
+            f"Wall time: {wall_time:.2f} seconds"
+        )
         
         # Take screenshot
         dashboard_page.take_screenshot("page_load_performance")
@@ -476,13 +423,8 @@ class TestDashboardSmoke:
     @pytest.mark.smoke
     @pytest.mark.dashboard
     @pytest.mark.medium
-    def test_no_console_errors_on_home_page(self, driver, base_url):
+    def test_no_console_errors_on_home_page(self, dashboard_page):
         """Test that home page has no console errors."""
-        dashboard_page = DashboardPage(driver)
-        
-        # Navigate to home page
-        assert dashboard_page.navigate_to("/"), "Failed to navigate to home page"
-        
         # Check for console errors
         assert dashboard_page.assert_no_console_errors(), "Console errors found on home page"
         
@@ -492,21 +434,20 @@ class TestDashboardSmoke:
     @pytest.mark.smoke
     @pytest.mark.dashboard
     @pytest.mark.low
-    def test_page_accessibility_basics(self, driver, base_url):
+    def test_page_accessibility_basics(self, dashboard_page):
         """Test basic accessibility features."""
-        dashboard_page = DashboardPage(driver)
-        
-        # Navigate to home page
-        assert dashboard_page.navigate_to("/"), "Failed to navigate to home page"
-        
         # Check for basic accessibility elements
         # Verify page has a proper title
         page_title = dashboard_page.get_page_title()
         assert page_title and page_title.strip(), "Page should have a title"
         
         # Verify main content has proper structure
-        assert dashboard_page.is_element_present((By.TAG_NAME, "main")), "Page should have main element"
-        assert dashboard_page.is_element_present((By.TAG_NAME, "h1")), "Page should have h1 heading"
+        structure = dashboard_page.check_sections({
+            "main": dashboard_page.MAIN_CONTENT,
+            "h1": (By.TAG_NAME, "h1")
+        })
+        assert structure["main"], "Page should have main element"
+        assert structure["h1"], "Page should have h1 heading"
         
         # Take screenshot
         dashboard_page.take_screenshot("page_accessibility_basics")
@@ -514,25 +455,14 @@ class TestDashboardSmoke:
     @pytest.mark.smoke
     @pytest.mark.dashboard
     @pytest.mark.medium
-    def test_navigation_breadcrumbs(self, driver, base_url):
+    def test_navigation_breadcrumbs(self, dashboard_page):
         """Test navigation breadcrumbs if present."""
-        dashboard_page = DashboardPage(driver)
-        
-        # Navigate to home page
-        assert dashboard_page.navigate_to("/"), "Failed to navigate to home page"
-        
         # Check for breadcrumbs
-        breadcrumb_selectors = [
-            (By.CLASS_NAME, "breadcrumb"),
-            (By.CLASS_NAME, "breadcrumbs"),
-            (By.XPATH, "//nav[@aria-label='breadcrumb']")
-        ]
-        
-        breadcrumbs_found = False
-        for selector in breadcrumb_selectors:
-            if dashboard_page.is_element_present(selector):
-                breadcrumbs_found = True
-                break
+        breadcrumbs_found = dashboard_page.is_any_element_present([
+            (By.CSS_SELECTOR, ".breadcrumb"),
+            (By.CSS_SELECTOR, ".breadcrumbs"),
+            (By.CSS_SELECTOR, "nav[aria-label='breadcrumb']")
+        ])
         
         if breadcrumbs_found:
             ReportHelpers.log_test_step("Navigation breadcrumbs", "PASS", "Breadcrumbs found")
@@ -545,25 +475,14 @@ class TestDashboardSmoke:
     @pytest.mark.smoke
     @pytest.mark.dashboard
     @pytest.mark.low
-    def test_footer_information(self, driver, base_url):
+    def test_footer_information(self, dashboard_page):
         """Test footer information if present."""
-        dashboard_page = DashboardPage(driver)
-        
-        # Navigate to home page
-        assert dashboard_page.navigate_to("/"), "Failed to navigate to home page"
-        
         # Check for footer
-        footer_selectors = [
-            (By.TAG_NAME, "footer"),
-            (By.CLASS_NAME, "footer"),
-            (By.ID, "footer")
-        ]
-        
-        footer_found = False
-        for selector in footer_selectors:
-            if dashboard_page.is_element_present(selector):
-                footer_found = True
-                break
+        footer_found = dashboard_page.is_any_element_present([
+            (By.CSS_SELECTOR, "footer"),
+            (By.CSS_SELECTOR, ".footer"),
+            (By.CSS_SELECTOR, "#footer")
+        ])
         
         if footer_found:
             ReportHelpers.log_test_step("Footer information", "PASS", "Footer found")
@@ -3,23 +3,99 @@ Driver factory for creating WebDriver instances with different browsers.
 """
 
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.edge.options import Options as EdgeOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
 from test_data.test_config import TestConfig
+import importlib
 import logging
+import threading
+import time
+from collections import defaultdict, deque
 
 logger = logging.getLogger(__name__)
 
+# webdriver_manager (and the requests/urllib3 stack behind it) is only
+# imported when a driver binary actually has to be resolved, so pinned
+# driver paths and suite collection never pay for it
+DRIVER_MANAGERS = {
+    "chrome": ("webdriver_manager.chrome", "ChromeDriverManager"),
+    "firefox": ("webdriver_manager.firefox", "GeckoDriverManager"),
+    "edge": ("webdriver_manager.microsoft", "EdgeChromiumDriverManager")
+}
+
+# Counts in-flight fetch/XHR requests in window.__pendingRequests so waits can
+# detect network idle without relying on jQuery
+TRACK_PENDING_REQUESTS_SCRIPT = """
+(function () {
+    if (window.__pendingRequests !== undefined) return;
+    window.__pendingRequests = 0;
+    var done = function () { window.__pendingRequests--; };
+    var originalFetch = window.fetch;
+    if (originalFetch) {
+        window.fetch = function () {
+            window.__pendingRequests++;
+            return originalFetch.apply(this, arguments).finally(done);
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        window.__pendingRequests++;
+        this.addEventListener('loadend', done);
+        try {
+            return originalSend.apply(this, arguments);
+        } catch (e) {
+            done();
+            throw e;
+        }
+    };
+})();
+"""
+
+class _QuickStartMixin:
+    """
+    Start a driver service, polling its port every 50 ms.
+    
+    Selenium's Service.start() sleeps 500 ms between connection attempts, but
+    chromedriver and friends usually listen within ~100 ms of launch, so
+    most of that first sleep is wasted on every driver start.
+    """
+    
+    START_POLL_INTERVAL = 0.05
+    START_TIMEOUT = 30
+    
+    def start(self):
+        self._start_process(self._path)
+        
+        deadline = time.monotonic() + self.START_TIMEOUT
+        while True:
+            self.assert_process_still_running()
+            if self.is_connectable():
+                return
+            if time.monotonic() >= deadline:
+                raise WebDriverException(f"Can not connect to the Service {self._path}")
+            time.sleep(self.START_POLL_INTERVAL)
+
+class _ChromeService(_QuickStartMixin, ChromeService):
+    pass
+
+class _FirefoxService(_QuickStartMixin, FirefoxService):
+    pass
+
+class _EdgeService(_QuickStartMixin, EdgeService):
+    pass
+
 class DriverFactory:
     """Factory class for creating WebDriver instances."""
     
+    # Driver binary paths already resolved in this process, keyed by browser
+    _driver_path_cache = {}
+    _driver_path_lock = threading.Lock()
+    
     @staticmethod
     def get_driver(browser_name="chrome", headless=False, mobile_device=None):
         """
@@ -44,20 +120,61 @@ class DriverFactory:
         else:
             raise ValueError(f"Unsupported browser: {browser_name}")
     
+    @staticmethod
+    def _get_driver_path(browser_name):
+        """
+        Resolve the WebDriver binary path for a browser.
+        
+        A path pinned through TestConfig.DRIVER_PATHS is used as-is, so
+        webdriver_manager's online version check is skipped entirely.
+        Otherwise webdriver_manager runs once per browser and process, and
+        later drivers reuse the path it returned.
+        
+        Args:
+            browser_name (str): Browser name (chrome, firefox, edge)
+            
+        Returns:
+            str: Path to the WebDriver binary
+        """
+        pinned_path = TestConfig.DRIVER_PATHS.get(browser_name)
+        if pinned_path:
+            logger.info(f"Using pinned {browser_name} driver: {pinned_path}")
+            return pinned_path
+        
+        with DriverFactory._driver_path_lock:
+            driver_path = DriverFactory._driver_path_cache.get(browser_name)
+            if driver_path is None:
+                module_name, class_name = DRIVER_MANAGERS[browser_name]
+                driver_manager_class = getattr(importlib.import_module(module_name), class_name)
+                driver_path = driver_manager_class().install()
+                DriverFactory._driver_path_cache[browser_name] = driver_path
+        return driver_path
+    
+    @staticmethod
+    def _chromium_prefs():
+        """Content-setting preferences shared by Chrome and Edge (2 = block)."""
+        prefs = {"profile.default_content_setting_values.notifications": 2}
+        if not TestConfig.LOAD_IMAGES:
+            prefs["profile.managed_default_content_settings.images"] = 2
+        return prefs
+    
     @staticmethod
     def _create_chrome_driver(headless=False, mobile_device=None):
         """Create Chrome WebDriver instance."""
         options = ChromeOptions()
+        options.page_load_strategy = TestConfig.PAGE_LOAD_STRATEGY
         
         # Add default Chrome options
         default_options = TestConfig.BROWSER_SETTINGS["chrome"]["options"]
         for option in default_options:
             options.add_argument(option)
+        if TestConfig.CONTAINER_MODE:
+            for option in TestConfig.CONTAINER_OPTIONS:
+                options.add_argument(option)
         
         # Add headless mode if requested
         if headless:
-            options.add_argument("--headless")
-            options.add_argument("--disable-gpu")
+            options.add_argument("--headless=new")
         
         # Add mobile device emulation if requested
         if mobile_device:
@@ -71,30 +188,34 @@ class DriverFactory:
             }
             options.add_experimental_option("mobileEmulation", mobile_emulation)
         
-        # Additional Chrome options for stability
+        # Additional Chrome options for stability ("enable-logging" would
+        # otherwise switch chromedriver's verbose console logging back on)
         options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
         options.add_experimental_option('useAutomationExtension', False)
         
-        # Performance optimization
-        options.add_argument("--disable-extensions")
+        # Performance optimization ("--disable-images" is not a Chrome switch;
+        # images are blocked through content settings instead)
         options.add_argument("--disable-plugins")
-        options.add_argument("--disable-images")
-        options.add_argument("--disable-javascript")  # Remove this if JS is needed
+        options.add_experimental_option("prefs", DriverFactory._chromium_prefs())
+        if not TestConfig.LOAD_IMAGES:
+            options.add_argument("--blink-settings=imagesEnabled=false")
         
         # Create service
-        service = ChromeService(ChromeDriverManager().install())
+        service = _ChromeService(DriverFactory._get_driver_path("chrome"))
         
         # Create and configure driver
         driver = webdriver.Chrome(service=service, options=options)
         
         # Set timeouts
         driver.set_page_load_timeout(TestConfig.PAGE_LOAD_TIMEOUT)
-        driver.implicitly_wait(TestConfig.IMPLICIT_WAIT)
         
         # Execute script to hide automation flags
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
+        # Track pending network requests on every page
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": TRACK_PENDING_REQUESTS_SCRIPT})
+        
         logger.info(f"Chrome driver created successfully. Headless: {headless}")
         return driver
     
@@ -102,6 +223,7 @@ class DriverFactory:
     def _create_firefox_driver(headless=False, mobile_device=None):
         """Create Firefox WebDriver instance."""
         options = FirefoxOptions()
+        options.page_load_strategy = TestConfig.PAGE_LOAD_STRATEGY
         
         # Add default Firefox options
         default_options = TestConfig.BROWSER_SETTINGS["firefox"]["options"]
@@ -125,9 +247,12 @@ class DriverFactory:
         options.set_preference("browser.cache.disk.enable", False)
         options.set_preference("browser.cache.memory.enable", False)
         options.set_preference("browser.cache.offline.enable", False)
+        options.set_preference("permissions.default.desktop-notification", 2)
+        if not TestConfig.LOAD_IMAGES:
+            options.set_preference("permissions.default.image", 2)
         
         # Create service
-        service = FirefoxService(GeckoDriverManager().install())
+        service = _FirefoxService(DriverFactory._get_driver_path("firefox"))
         
         # Create and configure driver
         driver = webdriver.Firefox(service=service, options=options)
@@ -138,7 +263,6 @@ class DriverFactory:
         
         # Set timeouts
         driver.set_page_load_timeout(TestConfig.PAGE_LOAD_TIMEOUT)
-        driver.implicitly_wait(TestConfig.IMPLICIT_WAIT)
         
         logger.info(f"Firefox driver created successfully. Headless: {headless}")
         return driver
@@ -147,11 +271,15 @@ class DriverFactory:
     def _create_edge_driver(headless=False, mobile_device=None):
         """Create Edge WebDriver instance."""
         options = EdgeOptions()
+        options.page_load_strategy = TestConfig.PAGE_LOAD_STRATEGY
         
         # Add default Edge options
         default_options = TestConfig.BROWSER_SETTINGS["edge"]["options"]
         for option in default_options:
             options.add_argument(option)
+        if TestConfig.CONTAINER_MODE:
+            for option in TestConfig.CONTAINER_OPTIONS:
+                options.add_argument(option)
         
         # Add headless mode if requested
         if headless:
@@ -178,16 +306,19 @@ class DriverFactory:
         # Performance optimization
         options.add_argument("--disable-extensions")
         options.add_argument("--disable-plugins")
+        options.add_experimental_option("prefs", DriverFactory._chromium_prefs())
         
         # Create service
-        service = EdgeService(EdgeChromiumDriverManager().install())
+        service = _EdgeService(DriverFactory._get_driver_path("edge"))
         
         # Create and configure driver
         driver = webdriver.Edge(service=service, options=options)
         
         # Set timeouts
         driver.set_page_load_timeout(TestConfig.PAGE_LOAD_TIMEOUT)
-        driver.implicitly_wait(TestConfig.IMPLICIT_WAIT)
+        
+        # Track pending network requests on every page
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": TRACK_PENDING_REQUESTS_SCRIPT})
         
         logger.info(f"Edge driver created successfully. Headless: {headless}")
         return driver
@@ -219,37 +350,99 @@ class DriverFactory:
         return list(TestConfig.MOBILE_DEVICES.keys())
 
 class DriverManager:
-    """Manager class for WebDriver instances."""
+    """
+    Pool of WebDriver instances.
+    
+    Released drivers are reset and handed to the next get_driver call with
+    the same settings instead of being quit, so the browser start-up cost is
+    paid once per pooled instance.
+    """
     
-    def __init__(self):
-        self.drivers = {}
-        self.active_drivers = []
+    def __init__(self, max_pool_size=2):
+        self.max_pool_size = max_pool_size
+        self.idle_drivers = defaultdict(deque)
+        self.driver_keys = {}
+        self.active_drivers = set()
+        self._lock = threading.Lock()
     
     def get_driver(self, browser_name="chrome", headless=False, mobile_device=None):
-        """Get or create a WebDriver instance."""
+        """Get an idle pooled WebDriver instance or create a new one."""
         key = f"{browser_name}_{headless}_{mobile_device}"
         
-        if key not in self.drivers:
-            self.drivers[key] = DriverFactory.get_driver(browser_name, headless, mobile_device)
-            self.active_drivers.append(self.drivers[key])
+        with self._lock:
+            idle = self.idle_drivers.get(key)
+            if idle:
+                return idle.pop()
         
-        return self.drivers[key]
+        # Launch outside the lock so concurrent callers start browsers in parallel
+        driver = DriverFactory.get_driver(browser_name, headless, mobile_device)
+        with self._lock:
+            self.driver_keys[driver] = key
+            self.active_drivers.add(driver)
+        return driver
+    
+    def release_driver(self, driver):
+        """Reset a driver's browser state and return it to the pool, or quit it if the pool is full."""
+        with self._lock:
+            key = self.driver_keys.get(driver)
+            if key is None:
+                return
+            idle = self.idle_drivers[key]
+            if driver in idle:
+                return  # Already released
+            pool_full = len(idle) >= self.max_pool_size
+        
+        if pool_full:
+            self.quit_driver(driver)
+            return
+        
+        try:
+            driver.delete_all_cookies()
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except WebDriverException:
+                pass  # Storage is not accessible on some pages (e.g. about:blank)
+            driver.get("about:blank")
+        except WebDriverException as e:
+            logger.warning(f"Error resetting driver, quitting it instead: {e}")
+            self.quit_driver(driver)
+            return
+        
+        # Other releases may have filled the pool, or parked this same driver,
+        # while the reset ran outside the lock
+        with self._lock:
+            if driver not in self.active_drivers or driver in idle:
+                return
+            pool_full = len(idle) >= self.max_pool_size
+            if not pool_full:
+                idle.append(driver)
+        if pool_full:
+            self.quit_driver(driver)
     
     def quit_driver(self, driver):
         """Quit a specific driver."""
-        if driver in self.active_drivers:
-            driver.quit()
+        with self._lock:
+            if driver not in self.active_drivers:
+                return
+            key = self.driver_keys.pop(driver)
+            if driver in self.idle_drivers[key]:
+                self.idle_drivers[key].remove(driver)
             self.active_drivers.remove(driver)
+        driver.quit()
     
     def quit_all_drivers(self):
         """Quit all active drivers."""
-        for driver in self.active_drivers[:]:
+        with self._lock:
+            drivers = list(self.active_drivers)
+            self.active_drivers.clear()
+            self.idle_drivers.clear()
+            self.driver_keys.clear()
+        
+        for driver in drivers:
             try:
                 driver.quit()
             except Exception as e:
                 logger.warning(f"Error quitting driver: {e}")
-        self.active_drivers.clear()
-        self.drivers.clear()
     
     def get_active_driver_count(self):
         """Get the number of active drivers."""
@@ -3,10 +3,15 @@ Helper utilities for test automation.
 """
 
 import time
+import functools
 import json
+import os
 import random
+import re
 import string
 from datetime import datetime, timedelta
+from pathlib import Path
+from types import MappingProxyType
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -18,55 +23,107 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# orjson serializes in C straight to bytes; fall back to the stdlib when it is
+# not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_dumps(data):
+    """Serialize data to indented JSON bytes."""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS stringifies int/float keys the way json.dumps does
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode()
+
+def _json_loads(raw):
+    """Parse JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+class _LazyJSON:
+    """Log argument that is only serialized if the record is actually emitted."""
+    
+    __slots__ = ("data",)
+    
+    def __init__(self, data):
+        self.data = data
+    
+    def __str__(self):
+        return _json_dumps(self.data).decode()
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_RE = re.compile(r'^\+?1?-?\d{3}-?\d{3}-?\d{4}$')
+_URL_RE = re.compile(r'^https?://(?:[-\w.])+(?::\d+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?$')
+
+_ALPHABET = string.ascii_letters + string.digits
+
+# Locator strategies batch_query can express as a CSS selector
+_CSS_SELECTOR_FORMATS = MappingProxyType({
+    By.CSS_SELECTOR: "{}",
+    By.ID: '[id="{}"]',
+    By.CLASS_NAME: ".{}",
+    By.TAG_NAME: "{}",
+    By.NAME: '[name="{}"]'
+})
+
 class WebDriverHelpers:
     """Helper methods for WebDriver operations."""
     
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, TestConfig.EXPLICIT_WAIT)
-        self.short_wait = WebDriverWait(driver, 5)
+        self.wait = WebDriverWait(driver, TestConfig.EXPLICIT_WAIT, poll_frequency=TestConfig.POLL_FREQUENCY)
+        self.short_wait = WebDriverWait(driver, 5, poll_frequency=TestConfig.POLL_FREQUENCY)
+        self._waits = {TestConfig.EXPLICIT_WAIT: self.wait, 5: self.short_wait}
+        # Short, fast-polling wait for scrolls and hovers to take effect
+        self.settle_wait = WebDriverWait(driver, 1, poll_frequency=0.05)
+    
+    def _get_wait(self, timeout):
+        """Return a cached WebDriverWait for the given timeout."""
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = WebDriverWait(self.driver, timeout, poll_frequency=TestConfig.POLL_FREQUENCY)
+        return wait
     
     def wait_for_element(self, locator, timeout=None):
         """Wait for an element to be present and return it."""
         timeout = timeout or TestConfig.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.presence_of_element_located(locator))
+        return self._get_wait(timeout).until(EC.presence_of_element_located(locator))
     
     def wait_for_clickable_element(self, locator, timeout=None):
         """Wait for an element to be clickable and return it."""
         timeout = timeout or TestConfig.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.element_to_be_clickable(locator))
+        return self._get_wait(timeout).until(EC.element_to_be_clickable(locator))
     
     def wait_for_visible_element(self, locator, timeout=None):
         """Wait for an element to be visible and return it."""
         timeout = timeout or TestConfig.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.visibility_of_element_located(locator))
+        return self._get_wait(timeout).until(EC.visibility_of_element_located(locator))
     
     def wait_for_elements(self, locator, timeout=None):
         """Wait for multiple elements to be present and return them."""
         timeout = timeout or TestConfig.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.presence_of_all_elements_located(locator))
+        return self._get_wait(timeout).until(EC.presence_of_all_elements_located(locator))
     
     def wait_for_text_in_element(self, locator, text, timeout=None):
         """Wait for specific text to appear in an element."""
         timeout = timeout or TestConfig.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.text_to_be_present_in_element(locator, text))
+        return self._get_wait(timeout).until(EC.text_to_be_present_in_element(locator, text))
     
     def wait_for_url_contains(self, url_part, timeout=None):
         """Wait for URL to contain specific text."""
         timeout = timeout or TestConfig.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.url_contains(url_part))
+        return self._get_wait(timeout).until(EC.url_contains(url_part))
     
     def wait_for_page_load(self, timeout=None):
-        """Wait for page to be fully loaded."""
+        """Wait for the page to reach the readiness the page load strategy promises."""
         timeout = timeout or TestConfig.PAGE_LOAD_TIMEOUT
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
+        # Under "eager"/"none" the driver hands control back at DOMContentLoaded
+        # (or earlier), so waiting for "complete" would reintroduce the full load
+        ready_states = ("complete",) if TestConfig.PAGE_LOAD_STRATEGY == "normal" else ("interactive", "complete")
+        return self._get_wait(timeout).until(lambda driver: driver.execute_script("return document.readyState") in ready_states)
     
     def safe_click(self, locator, timeout=None):
         """Safely click an element with retry logic."""
@@ -118,10 +175,54 @@ class WebDriverHelpers:
             logger.error(f"Failed to get attribute '{attribute}' from element: {locator}")
             return None
     
+    def batch_query(self, locators, attributes=()):
+        """
+        Query several locators in a single script call.
+        
+        Args:
+            locators: dict mapping a name to a CSS selector, ID, class name,
+                tag name or name locator
+            attributes: attribute names to read from every matched element
+            
+        Returns:
+            dict: name -> list of {"text", "visible", "attributes"} for each match
+        """
+        queries = []
+        for name, (by, value) in locators.items():
+            selector_format = _CSS_SELECTOR_FORMATS.get(by)
+            if selector_format is None:
+                raise ValueError(f"batch_query cannot express {by!r} locators as CSS, got one for {name!r}")
+            queries.append([name, selector_format.format(value)])
+        
+        return self.driver.execute_script(
+            """
+            const [queries, attributes] = arguments;
+            const result = {};
+            for (const [name, selector] of queries) {
+                result[name] = Array.from(document.querySelectorAll(selector), element => ({
+                    text: element.innerText,
+                    visible: element.getClientRects().length > 0,
+                    attributes: Object.fromEntries(attributes.map(attr => [attr, element.getAttribute(attr)]))
+                }));
+            }
+            return result;
+            """,
+            queries, list(attributes)
+        )
+    
+    def are_elements_present(self, locators):
+        """Return name -> bool for several locators in one round-trip."""
+        return {name: bool(matches) for name, matches in self.batch_query(locators).items()}
+    
+    def safe_get_texts(self, locators):
+        """Return name -> text of the first match (or None) for several locators in one round-trip."""
+        return {name: matches[0]["text"] if matches else None
+                for name, matches in self.batch_query(locators).items()}
+    
     def is_element_present(self, locator, timeout=5):
         """Check if an element is present without throwing exception."""
         try:
-            WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located(locator))
+            self._get_wait(timeout).until(EC.presence_of_element_located(locator))
             return True
         except TimeoutException:
             return False
@@ -129,7 +230,7 @@ class WebDriverHelpers:
     def is_element_visible(self, locator, timeout=5):
         """Check if an element is visible without throwing exception."""
         try:
-            WebDriverWait(self.driver, timeout).until(EC.visibility_of_element_located(locator))
+            self._get_wait(timeout).until(EC.visibility_of_element_located(locator))
             return True
         except TimeoutException:
             return False
@@ -137,17 +238,54 @@ class WebDriverHelpers:
     def is_element_clickable(self, locator, timeout=5):
         """Check if an element is clickable without throwing exception."""
         try:
-            WebDriverWait(self.driver, timeout).until(EC.element_to_be_clickable(locator))
+            self._get_wait(timeout).until(EC.element_to_be_clickable(locator))
             return True
         except TimeoutException:
             return False
     
+    def _actions(self):
+        """
+        Return an ActionChains whose pointer moves are instant.
+        
+        perform() already sends the whole chain in one request; the cost is
+        Selenium's default 250 ms animation of every pointer move.
+        """
+        return ActionChains(self.driver, duration=0)
+    
+    def _scroll_and_settle(self, scroll_script, target_script, *args):
+        """
+        Run a scroll script and wait until the scroll has taken effect.
+        
+        The scroll is done once target_script reports the target position,
+        or once the page has moved and then held still between two polls
+        (smooth scrolling, or a target that can't be reached exactly).
+        """
+        start = self.driver.execute_script(f"{scroll_script} return window.scrollY;", *args)
+        state = {"last": start}
+        
+        def scroll_settled(driver):
+            position, at_target = driver.execute_script(
+                f"return [window.scrollY, (function () {{ {target_script} }}).apply(null, arguments)];", *args
+            )
+            settled = at_target or (position != start and position == state["last"])
+            state["last"] = position
+            return settled
+        
+        try:
+            self.settle_wait.until(scroll_settled)
+        except TimeoutException:
+            logger.debug(f"Scroll did not settle; continuing at scrollY={state['last']}")
+    
     def scroll_to_element(self, locator, timeout=None):
         """Scroll to an element."""
         try:
             element = self.wait_for_element(locator, timeout)
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(0.5)  # Wait for scroll to complete
+            self._scroll_and_settle(
+                "arguments[0].scrollIntoView(true);",
+                "const maxY = document.documentElement.scrollHeight - window.innerHeight;"
+                " return Math.abs(arguments[0].getBoundingClientRect().top) < 2 || window.scrollY >= maxY - 1;",
+                element
+            )
             return True
         except TimeoutException:
             logger.error(f"Failed to scroll to element: {locator}")
@@ -155,20 +293,26 @@ class WebDriverHelpers:
     
     def scroll_to_top(self):
         """Scroll to the top of the page."""
-        self.driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(0.5)
+        self._scroll_and_settle("window.scrollTo(0, 0);", "return window.scrollY < 1;")
     
     def scroll_to_bottom(self):
         """Scroll to the bottom of the page."""
-        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(0.5)
+        self._scroll_and_settle(
+            "window.scrollTo(0, document.body.scrollHeight);",
+            "return window.scrollY >= document.documentElement.scrollHeight - window.innerHeight - 1;"
+        )
     
     def hover_over_element(self, locator, timeout=None):
         """Hover over an element."""
         try:
             element = self.wait_for_element(locator, timeout)
-            ActionChains(self.driver).move_to_element(element).perform()
-            time.sleep(0.5)
+            self._actions().move_to_element(element).perform()
+            try:
+                self.settle_wait.until(
+                    lambda driver: driver.execute_script("return arguments[0].matches(':hover');", element)
+                )
+            except TimeoutException:
+                logger.debug(f"Element did not report :hover after moving to it: {locator}")
             return True
         except TimeoutException:
             logger.error(f"Failed to hover over element: {locator}")
@@ -178,7 +322,7 @@ class WebDriverHelpers:
         """Double click an element."""
         try:
             element = self.wait_for_clickable_element(locator, timeout)
-            ActionChains(self.driver).double_click(element).perform()
+            self._actions().double_click(element).perform()
             return True
         except TimeoutException:
             logger.error(f"Failed to double click element: {locator}")
@@ -188,7 +332,7 @@ class WebDriverHelpers:
         """Right click an element."""
         try:
             element = self.wait_for_clickable_element(locator, timeout)
-            ActionChains(self.driver).context_click(element).perform()
+            self._actions().context_click(element).perform()
             return True
         except TimeoutException:
             logger.error(f"Failed to right click element: {locator}")
@@ -199,7 +343,7 @@ class WebDriverHelpers:
         try:
             source = self.wait_for_element(source_locator, timeout)
             target = self.wait_for_element(target_locator, timeout)
-            ActionChains(self.driver).drag_and_drop(source, target).perform()
+            self._actions().drag_and_drop(source, target).perform()
             return True
         except TimeoutException:
             logger.error(f"Failed to drag and drop from {source_locator} to {target_locator}")
@@ -284,7 +428,14 @@ class TestDataHelpers:
     @staticmethod
     def generate_random_string(length=10):
         """Generate a random string."""
-        return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+        return ''.join(random.choices(_ALPHABET, k=length))
+    
+    @staticmethod
+    def generate_random_strings(count, length=10):
+        """Generate several random strings of the same length."""
+        # Draw every character in one random.choices call and slice it up
+        characters = ''.join(random.choices(_ALPHABET, k=count * length))
+        return [characters[i * length:(i + 1) * length] for i in range(count)]
     
     @staticmethod
     def generate_random_email():
@@ -316,9 +467,10 @@ class TestDataHelpers:
     @staticmethod
     def generate_test_user_data():
         """Generate test user data."""
+        first_name, last_name = TestDataHelpers.generate_random_strings(2, 8)
         return {
-            'first_name': TestDataHelpers.generate_random_string(8),
-            'last_name': TestDataHelpers.generate_random_string(8),
+            'first_name': first_name,
+            'last_name': last_name,
             'email': TestDataHelpers.generate_random_email(),
             'phone': TestDataHelpers.generate_random_phone(),
             'password': 'TestPass123!',
@@ -331,23 +483,17 @@ class ValidationHelpers:
     @staticmethod
     def is_valid_email(email):
         """Check if email format is valid."""
-        import re
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.match(email) is not None
     
     @staticmethod
     def is_valid_phone(phone):
         """Check if phone number format is valid."""
-        import re
-        pattern = r'^\+?1?-?\d{3}-?\d{3}-?\d{4}$'
-        return re.match(pattern, phone) is not None
+        return _PHONE_RE.match(phone) is not None
     
     @staticmethod
     def is_valid_url(url):
         """Check if URL format is valid."""
-        import re
-        pattern = r'^https?://(?:[-\w.])+(?::\d+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?$'
-        return re.match(pattern, url) is not None
+        return _URL_RE.match(url) is not None
     
     @staticmethod
     def is_valid_date(date_string, format_string="%Y-%m-%d"):
@@ -361,28 +507,46 @@ class ValidationHelpers:
 class WaitHelpers:
     """Helper methods for waiting."""
     
+    @staticmethod
+    def _backoff_delays(timeout, max_delay, initial_delay=0.01):
+        """
+        Yield the sleep before each retry until the timeout runs out.
+        
+        Delays start at initial_delay and double up to max_delay, so a
+        condition that turns true within milliseconds is noticed promptly
+        while slow ones are still polled at max_delay.
+        """
+        end_time = time.monotonic() + timeout
+        delay = min(initial_delay, max_delay)
+        while True:
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                return
+            yield min(delay, remaining)
+            delay = min(delay * 2, max_delay)
+    
     @staticmethod
     def wait_for_condition(condition, timeout=30, poll_frequency=0.5):
-        """Wait for a custom condition to be true."""
-        end_time = time.time() + timeout
-        while time.time() < end_time:
+        """Wait for a custom condition to be true, polling at most every poll_frequency seconds."""
+        for delay in WaitHelpers._backoff_delays(timeout, poll_frequency):
             if condition():
                 return True
-            time.sleep(poll_frequency)
+            time.sleep(delay)
         return False
     
     @staticmethod
     def wait_for_api_response(api_call, expected_status=200, timeout=30):
         """Wait for API response with expected status."""
-        end_time = time.time() + timeout
-        while time.time() < end_time:
+        # Each poll is a real HTTP request, so start at half a second rather
+        # than the millisecond delays used for in-browser checks
+        for delay in WaitHelpers._backoff_delays(timeout, 1, initial_delay=0.5):
             try:
                 response = api_call()
                 if response.status_code == expected_status:
                     return response
             except Exception:
                 pass
-            time.sleep(1)
+            time.sleep(delay)
         return None
     
     @staticmethod
@@ -401,31 +565,43 @@ class FileHelpers:
     def read_json_file(filepath):
         """Read JSON file."""
         try:
-            with open(filepath, 'r') as file:
-                return json.load(file)
+            with open(filepath, 'rb') as file:
+                return _json_loads(file.read())
         except Exception as e:
             logger.error(f"Failed to read JSON file {filepath}: {e}")
             return None
     
     @staticmethod
     def write_json_file(filepath, data):
-        """Write JSON file."""
+        """Write JSON file atomically (readers never see a half-written file)."""
+        temp_path = None
         try:
-            with open(filepath, 'w') as file:
-                json.dump(data, file, indent=2)
+            payload = _json_dumps(data)
+            directory, filename = os.path.split(os.path.abspath(filepath))
+            candidate = os.path.join(directory, f".{filename}.{os.urandom(4).hex()}.tmp")
+            # Mode 0o666 lets the kernel apply the process umask, giving the
+            # file the mode a plain open() would (tempfile creates it 0600)
+            fd = os.open(candidate, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            temp_path = candidate
+            with os.fdopen(fd, 'wb') as file:
+                file.write(payload)
+            os.replace(temp_path, filepath)
             return True
         except Exception as e:
             logger.error(f"Failed to write JSON file {filepath}: {e}")
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
             return False
     
     @staticmethod
     def ensure_directory_exists(directory):
-        """Ensure directory exists."""
-        import os
-        if not os.path.exists(directory):
-            os.makedirs(directory)
+        """Ensure directory exists; returns True if it had to be created."""
+        # One mkdir call in the common case, and no exists()/makedirs() race
+        try:
+            Path(directory).mkdir(parents=True)
             return True
-        return False
+        except FileExistsError:
+            return False
 
 class BrowserHelpers:
     """Helper methods for browser operations."""
@@ -433,6 +609,20 @@ class BrowserHelpers:
     @staticmethod
     def clear_browser_cache(driver):
         """Clear browser cache."""
+        # Chromium browsers clear cookies, local storage and caches for the
+        # current origin in one CDP call (CDP cannot clear the per-tab session
+        # storage, so the script that reads the origin does that); pages
+        # without an origin (e.g. about:blank) and other browsers take the
+        # WebDriver round-trips instead
+        if hasattr(driver, "execute_cdp_cmd"):
+            origin = driver.execute_script("window.sessionStorage.clear(); return window.location.origin;")
+            if origin and origin != "null":
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                    "origin": origin,
+                    "storageTypes": "cookies,local_storage,indexeddb,cache_storage"
+                })
+                return
+        
         driver.delete_all_cookies()
         driver.execute_script("window.localStorage.clear();")
         driver.execute_script("window.sessionStorage.clear();")
@@ -466,18 +656,48 @@ class ReportHelpers:
     """Helper methods for reporting."""
     
     @staticmethod
-    def log_test_step(step_name, status="PASS", details=None):
-        """Log a test step."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_message = f"[{timestamp}] STEP: {step_name} - {status}"
-        if details:
-            log_message += f" - {details}"
+    def log_test_step(step_name, status="PASS", details=None, *extra_details):
+        """
+        Log a test step.
+        
+        Details are passed as raw values and only formatted when INFO
+        logging is enabled, so callers should not pre-format them. Extra
+        positional details after details are appended in order.
+        """
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        # The log formats in pytest.ini already stamp every record with %(asctime)s
+        log_message = f"STEP: {step_name} - {status}"
+        for detail in (details, *extra_details):
+            if detail is not None and detail != "":
+                log_message += f" - {detail}"
         logger.info(log_message)
     
+    @staticmethod
+    def log_step(step_name, details=None):
+        """
+        Decorator that logs a PASS/FAIL test step from a method's boolean result.
+        
+        Args:
+            step_name (str): Name of the step to log
+            details (callable): Optional function of the method's arguments that
+                returns extra detail; only called when INFO logging is enabled
+        """
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                result = func(*args, **kwargs)
+                if logger.isEnabledFor(logging.INFO):
+                    detail = details(*args, **kwargs) if details else None
+                    ReportHelpers.log_test_step(step_name, "PASS" if result else "FAIL", detail)
+                return result
+            return wrapper
+        return decorator
+    
     @staticmethod
     def log_test_data(test_name, data):
         """Log test data."""
-        logger.info(f"Test: {test_name} - Data: {json.dumps(data, indent=2)}")
+        logger.info("Test: %s - Data: %s", test_name, _LazyJSON(data))
     
     @staticmethod
     def create_test_report_entry(test_name, status, duration, error=None, screenshot=None):
@@ -2,30 +2,151 @@
 Screenshot utility for capturing screenshots during tests.
 """
 
+import base64
 import os
+import re
+import struct
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from PIL import Image
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from test_data.test_config import TestConfig
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Prefix screenshot names with the xdist worker id so parallel workers taking
+# the same screenshot in the same second do not overwrite each other's files
+_WORKER_PREFIX = f"{os.environ['PYTEST_XDIST_WORKER']}_" if os.environ.get("PYTEST_XDIST_WORKER") else ""
+
+# Screenshot directories already created by this process
+_DIR_READY = set()
+
+# Characters dropped from error messages used in file names (keeps the
+# alphanumerics, spaces, '-' and '_' that str.isalnum() filtering kept)
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w\- ]")
+
+# The capture timestamp every screenshot name carries (see _build_filepath)
+_FILENAME_TIMESTAMP = re.compile(r"_(\d{8}_\d{6})(?:_|\.)")
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# PIL image modes of 8-bit PNGs by IHDR colour type
+_PNG_MODES = {0: "L", 2: "RGB", 3: "P", 4: "LA", 6: "RGBA"}
+
+def _read_png_header(filepath):
+    """Return ((width, height), mode) from a PNG's IHDR chunk, or None if it can't be read that way."""
+    with open(filepath, 'rb') as file:
+        header = file.read(26)
+    if len(header) < 26 or header[:8] != _PNG_SIGNATURE or header[12:16] != b"IHDR":
+        return None
+    width, height, bit_depth, color_type = struct.unpack(">IIBB", header[16:26])
+    mode = _PNG_MODES.get(color_type) if bit_depth == 8 else None
+    if mode is None:
+        return None
+    return (width, height), mode
+
 class ScreenshotUtil:
-    """Utility class for taking screenshots during tests."""
+    """
+    Utility class for taking screenshots during tests.
+    
+    The browser capture happens on the calling thread, so the image shows the
+    page at the time of the call; decoding and writing the PNG run on a
+    background thread. Methods that read a screenshot back wait for its
+    pending write first.
+    """
+    
+    # Shared by every instance; queued writes finish before the interpreter exits
+    _executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="screenshot")
+    _pending = {}
+    _pending_lock = threading.Lock()
+    # Each queued write holds its screenshot data in memory, so a burst of
+    # failures blocks the capturing thread once this many writes are pending
+    MAX_PENDING_WRITES = 16
+    _backlog = threading.BoundedSemaphore(MAX_PENDING_WRITES)
+    
+    # staticmethod keeps the predicate from being bound to the instance
+    _BODY_PRESENT = staticmethod(EC.presence_of_element_located((By.TAG_NAME, "body")))
+    
+    # True once the document has loaded and no animation or transition is running
+    _PAGE_SETTLED_SCRIPT = (
+        "return document.readyState === 'complete' && (typeof document.getAnimations !== 'function'"
+        " || !document.getAnimations().some(animation => animation.playState === 'running'));"
+    )
     
     def __init__(self, driver):
         self.driver = driver
+        self._wait = WebDriverWait(driver, 5, poll_frequency=TestConfig.POLL_FREQUENCY)
+        self._settle_wait = WebDriverWait(driver, 0.5, poll_frequency=0.05)
         self.screenshot_dir = TestConfig.SCREENSHOT_DIR
+        # Directory and worker prefix shared by every screenshot path
+        self._path_prefix = os.path.join(self.screenshot_dir, _WORKER_PREFIX)
         self._ensure_screenshot_dir()
     
     def _ensure_screenshot_dir(self):
-        """Ensure screenshot directory exists."""
-        if not os.path.exists(self.screenshot_dir):
-            os.makedirs(self.screenshot_dir)
+        """Ensure screenshot directory exists (once per directory and process)."""
+        if self.screenshot_dir not in _DIR_READY:
+            os.makedirs(self.screenshot_dir, exist_ok=True)
+            _DIR_READY.add(self.screenshot_dir)
+    
+    @staticmethod
+    def _write_png(filepath, png_base64):
+        """Decode a base64 PNG from the driver and write it to disk."""
+        try:
+            with open(filepath, 'wb') as file:
+                file.write(base64.b64decode(png_base64))
+            logger.info("Screenshot saved: %s", filepath)
+        except Exception as e:
+            logger.error("Failed to write screenshot %s: %s", filepath, e)
+            raise
+    
+    @classmethod
+    def _save_in_background(cls, filepath, png_base64):
+        """Queue a screenshot write and track it until it finishes."""
+        cls._backlog.acquire()
+        try:
+            # Register under the lock so a write that finishes straight away
+            # cannot be unregistered before it was registered
+            with cls._pending_lock:
+                future = cls._executor.submit(cls._write_png, filepath, png_base64)
+                cls._pending[filepath] = future
+        except BaseException:
+            cls._backlog.release()
+            raise
+        
+        def write_done(done):
+            with cls._pending_lock:
+                # A later capture to the same path may have replaced the entry
+                if cls._pending.get(filepath) is done:
+                    del cls._pending[filepath]
+            cls._backlog.release()
+        
+        future.add_done_callback(write_done)
+        return future
+    
+    @classmethod
+    def wait_for_pending_write(cls, filepath):
+        """Block until a queued write of filepath (if any) has finished."""
+        with cls._pending_lock:
+            future = cls._pending.get(filepath)
+        if future is not None:
+            future.exception()
+    
+    def _build_filepath(self, test_name, description="", kind="", timestamp=None):
+        """
+        Build a screenshot path: <worker>_<test>_[<kind>_]<timestamp>[_<description>].png
+        
+        Batches pass one precomputed timestamp for all of their screenshots.
+        """
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        kind = f"{kind}_" if kind else ""
+        description = f"_{description}" if description else ""
+        return f"{self._path_prefix}{test_name}_{kind}{timestamp}{description}.png"
     
     def capture_screenshot(self, test_name, description=""):
         """
@@ -38,30 +159,30 @@ class ScreenshotUtil:
         Returns:
             str: Path to the saved screenshot
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{test_name}_{timestamp}"
-        
-        if description:
-            filename += f"_{description}"
-        
-        filename += ".png"
-        filepath = os.path.join(self.screenshot_dir, filename)
-        
+        return self._capture_viewport(self._build_filepath(test_name, description))
+    
+    def _capture_viewport(self, filepath, wait_for_body=True):
+        """Capture the current viewport to filepath; returns the path or None."""
         try:
             # Wait for page to be fully loaded
-            WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            if wait_for_body:
+                self._wait.until(self._BODY_PRESENT)
             
-            # Take screenshot
-            self.driver.save_screenshot(filepath)
-            logger.info(f"Screenshot saved: {filepath}")
+            # Take screenshot; the file is written in the background
+            self._save_in_background(filepath, self.driver.get_screenshot_as_base64())
             
             return filepath
         except Exception as e:
-            logger.error(f"Failed to capture screenshot: {e}")
+            logger.error("Failed to capture screenshot: %s", e)
             return None
     
+    def _wait_for_page_to_settle(self):
+        """Wait up to 0.5 s for loading and animations to finish before a capture."""
+        try:
+            self._settle_wait.until(lambda driver: driver.execute_script(self._PAGE_SETTLED_SCRIPT))
+        except TimeoutException:
+            pass  # Capture whatever is on screen after the cap, as the old fixed sleep did
+    
     def capture_failure_screenshot(self, test_name):
         """
         Capture a screenshot when a test fails.
@@ -72,7 +193,8 @@ class ScreenshotUtil:
         Returns:
             str: Path to the saved screenshot
         """
-        return self.capture_screenshot(test_name, "FAILURE")
+        # Capture the page in whatever state the failure left it
+        return self._capture_viewport(self._build_filepath(test_name, "FAILURE"), wait_for_body=False)
     
     def capture_element_screenshot(self, element, test_name, description=""):
         """
@@ -86,23 +208,15 @@ class ScreenshotUtil:
         Returns:
             str: Path to the saved screenshot
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{test_name}_element_{timestamp}"
-        
-        if description:
-            filename += f"_{description}"
-        
-        filename += ".png"
-        filepath = os.path.join(self.screenshot_dir, filename)
+        filepath = self._build_filepath(test_name, description, kind="element")
         
         try:
-            # Take screenshot of the element
-            element.screenshot(filepath)
-            logger.info(f"Element screenshot saved: {filepath}")
+            # Take screenshot of the element; the file is written in the background
+            self._save_in_background(filepath, element.screenshot_as_base64)
             
             return filepath
         except Exception as e:
-            logger.error(f"Failed to capture element screenshot: {e}")
+            logger.error("Failed to capture element screenshot: %s", e)
             return None
     
     def capture_full_page_screenshot(self, test_name, description=""):
@@ -116,39 +230,51 @@ class ScreenshotUtil:
         Returns:
             str: Path to the saved screenshot
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{test_name}_fullpage_{timestamp}"
-        
-        if description:
-            filename += f"_{description}"
-        
-        filename += ".png"
-        filepath = os.path.join(self.screenshot_dir, filename)
+        filepath = self._build_filepath(test_name, description, kind="fullpage")
         
         try:
+            # Chromium browsers render the whole page in one CDP capture, with
+            # no window resizes or reflows
+            if hasattr(self.driver, "execute_cdp_cmd"):
+                metrics = self.driver.execute_cdp_cmd("Page.getLayoutMetrics", {})
+                content_size = metrics.get("cssContentSize") or metrics["contentSize"]
+                screenshot = self.driver.execute_cdp_cmd("Page.captureScreenshot", {
+                    "format": "png",
+                    "captureBeyondViewport": True,
+                    "clip": {
+                        "x": 0,
+                        "y": 0,
+                        "width": content_size["width"],
+                        "height": content_size["height"],
+                        "scale": 1
+                    }
+                })
+                self._save_in_background(filepath, screenshot["data"])
+                return filepath
+            
             # Get original window size
             original_size = self.driver.get_window_size()
             
             # Get full page dimensions
-            total_width = self.driver.execute_script("return document.body.scrollWidth")
-            total_height = self.driver.execute_script("return document.body.scrollHeight")
+            total_width, total_height = self.driver.execute_script(
+                "return [document.body.scrollWidth, document.body.scrollHeight];"
+            )
             
             # Set window size to full page
             self.driver.set_window_size(total_width, total_height)
             
-            # Take screenshot
-            self.driver.save_screenshot(filepath)
+            # Take screenshot; the file is written in the background
+            self._save_in_background(filepath, self.driver.get_screenshot_as_base64())
             
             # Restore original window size
             self.driver.set_window_size(original_size['width'], original_size['height'])
             
-            logger.info(f"Full page screenshot saved: {filepath}")
             return filepath
         except Exception as e:
-            logger.error(f"Failed to capture full page screenshot: {e}")
+            logger.error("Failed to capture full page screenshot: %s", e)
             return None
     
-    def capture_comparison_screenshots(self, test_name, before_action, after_action):
+    def capture_comparison_screenshots(self, test_name, before_action, after_action, return_bytes=False):
         """
         Capture before and after screenshots for comparison.
         
@@ -156,28 +282,35 @@ class ScreenshotUtil:
             test_name (str): Name of the test
             before_action (callable): Function to execute before screenshot
             after_action (callable): Function to execute after screenshot
+            return_bytes (bool): Return the PNG bytes instead of writing files,
+                for callers that diff the images and only keep them on mismatch
             
         Returns:
-            tuple: Paths to before and after screenshots
+            tuple: Paths to (or PNG bytes of) before and after screenshots
         """
+        if return_bytes:
+            capture = lambda description: self.driver.get_screenshot_as_png()
+        else:
+            capture = lambda description: self.capture_screenshot(test_name, description)
+        
         # Capture before screenshot
-        before_path = self.capture_screenshot(test_name, "before")
+        before = capture("before")
         
         # Execute action
         if before_action:
             before_action()
         
-        # Wait a moment for any animations/transitions
-        time.sleep(0.5)
+        # Wait for any animations/transitions
+        self._wait_for_page_to_settle()
         
         # Capture after screenshot
-        after_path = self.capture_screenshot(test_name, "after")
+        after = capture("after")
         
         # Execute after action if provided
         if after_action:
             after_action()
         
-        return before_path, after_path
+        return before, after
     
     def capture_mobile_screenshot(self, test_name, device_name):
         """
@@ -203,32 +336,114 @@ class ScreenshotUtil:
         Returns:
             list: List of screenshot paths
         """
-        original_size = self.driver.get_window_size()
-        screenshot_paths = []
+        # Chromium browsers emulate each viewport through CDP, which re-lays
+        # out the page without resizing the OS window; other browsers resize
+        # the window, visiting viewports smallest first so each resize is a
+        # small step, and results are still returned in the caller's order
+        use_cdp = hasattr(self.driver, "execute_cdp_cmd")
+        original_size = None if use_cdp else self.driver.get_window_size()
+        captured = {}
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        for i, (width, height) in enumerate(viewports):
-            try:
+        order = sorted(range(len(viewports)), key=lambda i: viewports[i][0] * viewports[i][1])
+        width = height = None
+        try:
+            for i in order:
+                width, height = viewports[i]
+                
                 # Set viewport size
-                self.driver.set_window_size(width, height)
+                if use_cdp:
+                    self.driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+                        "width": width,
+                        "height": height,
+                        "deviceScaleFactor": 0,
+                        "mobile": width < 600
+                    })
+                else:
+                    self.driver.set_window_size(width, height)
                 
                 # Wait for responsive changes
-                time.sleep(0.5)
+                self._wait_for_page_to_settle()
                 
-                # Capture screenshot
-                path = self.capture_screenshot(test_name, f"responsive_{width}x{height}")
+                # Capture screenshot (logs its own failures)
+                path = self._capture_viewport(
+                    self._build_filepath(test_name, f"responsive_{width}x{height}", timestamp=timestamp)
+                )
                 if path:
-                    screenshot_paths.append(path)
-                
+                    captured[i] = path
+        except Exception as e:
+            # A viewport that cannot be set means the browser is unusable for
+            # the remaining sizes too
+            logger.error("Failed to capture responsive screenshot at %sx%s: %s", width, height, e)
+        finally:
+            # Restore original viewport, even if the loop was interrupted
+            try:
+                if use_cdp:
+                    self.driver.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
+                else:
+                    self.driver.set_window_size(original_size['width'], original_size['height'])
             except Exception as e:
-                logger.error(f"Failed to capture responsive screenshot at {width}x{height}: {e}")
+                logger.warning("Failed to restore window size: %s", e)
         
-        # Restore original window size
-        try:
-            self.driver.set_window_size(original_size['width'], original_size['height'])
-        except Exception as e:
-            logger.warning(f"Failed to restore window size: {e}")
+        return [captured[i] for i in sorted(captured)]
+    
+    def capture_responsive_screenshots_parallel(self, test_name, viewports, driver_factory=None):
+        """
+        Capture screenshots at different viewport sizes, one browser per viewport.
         
-        return screenshot_paths
+        Each viewport gets its own driver session, which loads the current URL
+        with the current cookies, so the captures run concurrently instead of
+        one resize after another. Only cookies are carried over; pages that
+        depend on other client-side state should use capture_responsive_screenshots.
+        
+        Args:
+            test_name (str): Name of the test
+            viewports (list): List of viewport sizes [(width, height), ...]
+            driver_factory (callable): Returns a new WebDriver; defaults to
+                DriverFactory.get_driver for the configured browser
+            
+        Returns:
+            list: List of screenshot paths
+        """
+        if not viewports:
+            return []
+        
+        if driver_factory is None:
+            from utilities.driver_factory import DriverFactory
+            driver_factory = lambda: DriverFactory.get_driver(TestConfig.BROWSER, TestConfig.HEADLESS)
+        
+        url = self.driver.current_url
+        cookies = self.driver.get_cookies()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        def capture(viewport):
+            width, height = viewport
+            driver = None
+            try:
+                driver = driver_factory()
+                driver.set_window_size(width, height)
+                if cookies:
+                    # Cookies can only be set on their own domain
+                    driver.get(url)
+                    for cookie in cookies:
+                        driver.add_cookie(cookie)
+                driver.get(url)
+                
+                util = ScreenshotUtil(driver)
+                util._wait_for_page_to_settle()
+                return util._capture_viewport(
+                    util._build_filepath(test_name, f"responsive_{width}x{height}", timestamp=timestamp)
+                )
+            except Exception as e:
+                logger.error("Failed to capture responsive screenshot at %sx%s: %s", width, height, e)
+                return None
+            finally:
+                if driver is not None:
+                    driver.quit()
+        
+        with ThreadPoolExecutor(max_workers=len(viewports)) as executor:
+            paths = list(executor.map(capture, viewports))
+        return [path for path in paths if path]
     
     def capture_error_context_screenshot(self, test_name, error_message):
         """
@@ -242,7 +457,7 @@ class ScreenshotUtil:
             str: Path to the saved screenshot
         """
         # Clean error message for filename
-        clean_error = "".join(c for c in error_message if c.isalnum() or c in (' ', '-', '_')).rstrip()
+        clean_error = _UNSAFE_FILENAME_CHARS.sub("", error_message).rstrip()
         clean_error = clean_error.replace(' ', '_')[:50]  # Limit length
         
         return self.capture_screenshot(test_name, f"error_{clean_error}")
@@ -272,10 +487,11 @@ class ScreenshotUtil:
             dict: Dictionary mapping step names to screenshot paths
         """
         step_screenshots = {}
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         for i, step in enumerate(steps):
             step_name = f"step_{i+1:02d}_{step.replace(' ', '_')}"
-            path = self.capture_screenshot(test_name, step_name)
+            path = self._capture_viewport(self._build_filepath(test_name, step_name, timestamp=timestamp))
             if path:
                 step_screenshots[step] = path
         
@@ -291,20 +507,23 @@ class ScreenshotUtil:
             max_height (int): Maximum height
             
         Returns:
-            str: Path to the resized screenshot
+            str: Path to the resized JPEG screenshot
         """
         try:
+            self.wait_for_pending_write(filepath)
             with Image.open(filepath) as img:
-                img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+                # reducing_gap first shrinks by whole factors with a cheap box
+                # reduce, so LANCZOS only runs on the last, small step
+                img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS, reducing_gap=2.0)
                 
-                # Save with optimized quality
-                resized_path = filepath.replace('.png', '_resized.png')
-                img.save(resized_path, optimize=True, quality=85)
+                # PNG ignores quality, so save the thumbnail as JPEG
+                resized_path = f"{os.path.splitext(filepath)[0]}_resized.jpg"
+                img.convert("RGB").save(resized_path, "JPEG", quality=85, optimize=True, progressive=True)
                 
-                logger.info(f"Screenshot resized and saved: {resized_path}")
+                logger.info("Screenshot resized and saved: %s", resized_path)
                 return resized_path
         except Exception as e:
-            logger.error(f"Failed to resize screenshot: {e}")
+            logger.error("Failed to resize screenshot: %s", e)
             return filepath
     
     def cleanup_old_screenshots(self, days_old=7):
@@ -315,16 +534,25 @@ class ScreenshotUtil:
             days_old (int): Number of days old to consider for cleanup
         """
         try:
-            current_time = time.time()
-            for filename in os.listdir(self.screenshot_dir):
-                filepath = os.path.join(self.screenshot_dir, filename)
-                if os.path.isfile(filepath):
-                    file_age = current_time - os.path.getmtime(filepath)
-                    if file_age > days_old * 24 * 60 * 60:  # Convert days to seconds
-                        os.remove(filepath)
-                        logger.info(f"Removed old screenshot: {filepath}")
+            cutoff = time.time() - days_old * 24 * 60 * 60  # Convert days to seconds
+            # Fixed-width timestamps compare correctly as strings
+            cutoff_stamp = (datetime.now() - timedelta(days=days_old)).strftime("%Y%m%d_%H%M%S")
+            # scandir entries carry the file type, and screenshot names carry
+            # their capture time, so only files named otherwise need a stat
+            with os.scandir(self.screenshot_dir) as entries:
+                for entry in entries:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    match = _FILENAME_TIMESTAMP.search(entry.name)
+                    if match:
+                        is_old = match.group(1) < cutoff_stamp
+                    else:
+                        is_old = entry.stat().st_mtime < cutoff
+                    if is_old:
+                        os.remove(entry.path)
+                        logger.info("Removed old screenshot: %s", entry.path)
         except Exception as e:
-            logger.error(f"Failed to cleanup old screenshots: {e}")
+            logger.error("Failed to cleanup old screenshots: %s", e)
     
     def get_screenshot_info(self, filepath):
         """
@@ -337,17 +565,26 @@ class ScreenshotUtil:
             dict: Screenshot information
         """
         try:
-            with Image.open(filepath) as img:
-                return {
-                    'path': filepath,
-                    'size': os.path.getsize(filepath),
-                    'dimensions': img.size,
-                    'format': img.format,
-                    'mode': img.mode,
-                    'created': datetime.fromtimestamp(os.path.getctime(filepath)).isoformat()
-                }
+            self.wait_for_pending_write(filepath)
+            stat = os.stat(filepath)
+            info = {
+                'path': filepath,
+                'size': stat.st_size,
+                'created': datetime.fromtimestamp(stat.st_ctime).isoformat()
+            }
+            
+            # Driver screenshots are 8-bit PNGs, whose size and mode sit in the
+            # first 26 bytes; anything else (e.g. resized JPEGs) goes through PIL
+            header = _read_png_header(filepath)
+            if header:
+                info['dimensions'], info['mode'] = header
+                info['format'] = 'PNG'
+            else:
+                with Image.open(filepath) as img:
+                    info.update(dimensions=img.size, format=img.format, mode=img.mode)
+            return info
         except Exception as e:
-            logger.error(f"Failed to get screenshot info: {e}")
+            logger.error("Failed to get screenshot info: %s", e)
             return None
 
 # Utility function to create screenshot utility instance